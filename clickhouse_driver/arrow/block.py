@@ -0,0 +1,71 @@
+import pyarrow as pa
+
+from ..block import ColumnOrientedBlock
+from .insert import write_arrow_column
+
+
+class ArrowColumnOrientedBlock(ColumnOrientedBlock):
+    """
+    Block of Arrow arrays: columns are written from Arrow buffers.
+    """
+
+    def write_column(self, context, column_name, column_type, items, buf):
+        write_arrow_column(context, column_name, column_type, items, buf,
+                           types_check=self.types_check)
+
+
+def iter_arrow_blocks(columns_with_types, data, block_size, sizer=None):
+    """
+    Returns iterator over blocks of at most ``block_size`` rows with
+    ``columns_with_types`` columns of Arrow ``data``: Table, RecordBatch,
+    RecordBatchReader or object exporting Arrow C stream. Record batches
+    are read as blocks are sent. Number of rows of every block is taken
+    from ``sizer`` if it is given.
+    """
+    if isinstance(data, pa.Table):
+        schema = data.schema
+        batches = data.to_batches(max_chunksize=block_size)
+    elif isinstance(data, pa.RecordBatch):
+        schema = data.schema
+        batches = [data]
+    elif isinstance(data, pa.RecordBatchReader):
+        schema = data.schema
+        batches = data
+    elif hasattr(data, '__arrow_c_stream__'):
+        batches = pa.RecordBatchReader.from_stream(data)
+        schema = batches.schema
+    else:
+        raise TypeError(
+            'Expected pyarrow Table, RecordBatch or RecordBatchReader, '
+            'got {}'.format(type(data).__name__)
+        )
+
+    names = [name for name, _ in columns_with_types]
+    # Raise if any columns are missing from the data.
+    missing = [x for x in names if schema.get_field_index(x) == -1]
+    if missing:
+        raise ValueError(
+            'Arrow data missing required columns: {}'.format(missing)
+        )
+    indexes = [schema.get_field_index(x) for x in names]
+
+    return _iter_blocks(
+        columns_with_types, batches, indexes, block_size, sizer
+    )
+
+
+def _iter_blocks(columns_with_types, batches, indexes, block_size, sizer):
+    for batch in batches:
+        columns = [batch.column(i) for i in indexes]
+
+        # Arrow buffers are close to serialized columns in size.
+        if sizer is not None and sizer.row_bytes is None:
+            sizer.update(batch.num_rows, sum(x.nbytes for x in columns))
+
+        offset = 0
+        while offset < batch.num_rows:
+            size = block_size if sizer is None else sizer.next_size()
+            yield ArrowColumnOrientedBlock(
+                columns_with_types, [x.slice(offset, size) for x in columns]
+            )
+            offset += size
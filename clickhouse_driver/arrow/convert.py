@@ -1,4 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import ceil
+
 import pyarrow as pa
+import pyarrow.compute as pc
 
 try:
     import numpy as np
@@ -6,22 +11,66 @@ except ImportError:
     np = None
 
 try:
-    import pandas as pd
-except ImportError:
-    pd = None
-
-try:
-    from ..columns.arrow.stringcolumn import ArrowStringBuffers
+    from ..columns.arrow.arraycolumn import ArrowListBuffers
+    from ..columns.arrow.datetimecolumn import ArrowTimestampBuffers
+    from ..columns.arrow.decimalcolumn import ArrowDecimalBuffers
+    from ..columns.arrow.enumcolumn import ArrowEnumBuffers
+    from ..columns.arrow.intcolumn import ArrowLargeIntBuffers
+    from ..columns.arrow.intervalcolumn import ArrowIntervalBuffers
+    from ..columns.arrow.ipcolumn import ArrowIPv4Buffers, ArrowIPv6Buffers
+    from ..columns.arrow.jsoncolumn import ArrowJsonBuffers
+    from ..columns.arrow.lowcardinalitycolumn import ArrowDictionaryBuffers
+    from ..columns.arrow.mapcolumn import ArrowMapBuffers
+    from ..columns.arrow.stringcolumn import (
+        ArrowFixedStringBuffers, ArrowStringBuffers
+    )
+    from ..columns.arrow.tuplecolumn import ArrowStructBuffers
+    from ..columns.arrow.uuidcolumn import ArrowUUIDBuffers
+    from ..columns.arrow.variantcolumn import ArrowUnionBuffers
+    from .formatting import format_ipv4, format_ipv6, format_uuids
 except ImportError:
-    ArrowStringBuffers = None
+    ArrowListBuffers = ArrowMapBuffers = ArrowStringBuffers = None
+    ArrowDecimalBuffers = ArrowDictionaryBuffers = ArrowEnumBuffers = None
+    ArrowFixedStringBuffers = ArrowIPv4Buffers = ArrowIPv6Buffers = None
+    ArrowLargeIntBuffers = ArrowStructBuffers = ArrowUUIDBuffers = None
+    ArrowJsonBuffers = ArrowUnionBuffers = None
+    ArrowIntervalBuffers = ArrowTimestampBuffers = None
 
 from .. import errors
+from ..columns.dynamiccolumn import (
+    NULL_DISCRIMINATOR, SHARED_VARIANT_NAME, encode_type_spec
+)
 from ..columns.util import get_inner_columns, get_inner_spec
 from ..protocol import ServerPacketTypes
+from ..varint import make_varint
 from .mapping import (
-    UNSUPPORTED, get_type_and_converter, json_as_object, json_as_text
+    BINARY_TYPES, INTERVAL_TYPES, LARGE_INT_TYPES, UNION_NULL_NAME,
+    UNSUPPORTED, address_as_text, datetime64_unit,
+    get_type_and_converter, interval_type, json_as_object, json_as_text,
+    large_int_as_words, tuple_field_names
 )
 
+# Largest data size addressed by int32 offsets of string/binary arrays.
+MAX_BINARY_SIZE = 2 ** 31 - 1
+
+# Decimal digits of fractional seconds of timestamp units.
+UNIT_PRECISIONS = {'s': 0, 'ms': 3, 'us': 6, 'ns': 9}
+
+# Inferred Arrow types of these types may change from block to block.
+DATA_DEPENDENT_TYPES = ('Dynamic', 'Int128', 'Int256')
+
+# Wire types of fixed size variants put into SharedVariant.
+SHARED_VALUE_DTYPES = {
+    'UInt8': '<u1', 'UInt16': '<u2', 'UInt32': '<u4', 'UInt64': '<u8',
+    'Int8': '<i1', 'Int16': '<i2', 'Int32': '<i4', 'Int64': '<i8',
+    'Float32': '<f4', 'Float64': '<f8', 'Bool': '<u1',
+    'Date': '<u2', 'Date32': '<i4'
+}
+
+# 10 ** 38 split into 64-bit words.
+DECIMAL128_BOUND_HIGH = (10 ** 38) >> 64
+DECIMAL128_BOUND_LOW = (10 ** 38) & (2 ** 64 - 1)
+
 
 class ArrowStreamState(object):
     """
@@ -29,22 +78,52 @@ class ArrowStreamState(object):
     ``pyarrow.RecordBatchReader.close`` doesn't reach the underlying
     generator, so the client uses this state to cancel unfinished
     streams before the next query.
+
+    Releasing the reader itself (dropping the last reference or
+    releasing the stream exported with ``__arrow_c_stream__``) closes
+    the generator: Cancel is sent right away then, and the rest of the
+    stream is drained by the next query.
     """
-    __slots__ = ('connection', 'finished', 'cancelled')
+    __slots__ = ('connection', 'finished', 'cancelled', 'released')
 
     def __init__(self, connection):
         self.connection = connection
         self.finished = False
         self.cancelled = False
+        self.released = False
+
+    def release(self):
+        if self.finished or self.cancelled or self.released:
+            return
+
+        self.released = True
+        connection = self.connection
+        if connection is None or not connection.connected or \
+                not connection.is_query_executing:
+            return
+
+        # Called from generator finalization: must not raise.
+        try:
+            connection.send_cancel()
+        except Exception:
+            connection.disconnect()
 
 
 def create_record_batch_reader(packet_generator, context, state=None,
-                               field_metadata=True, arrow_types=None):
+                               field_metadata=True, arrow_types=None,
+                               target_batch_rows=None,
+                               target_batch_bytes=None,
+                               split_batches=False, large_strings=False):
     """
     Creates RecordBatchReader yielding one record batch per ClickHouse
     block. Schema is built from the header block, so it's available before
     any data block is received.
 
+    With ``target_batch_rows`` or ``target_batch_bytes`` consecutive
+    blocks are concatenated until either target is reached. With
+    ``split_batches`` blocks exceeding the target are also sliced, so
+    batches have exactly ``target_batch_rows`` rows except the last one.
+
     Unless ``field_metadata`` is disabled, the original ClickHouse type
     of each column is attached to its Arrow field as ``clickhouse_type``
     metadata.
@@ -52,8 +131,16 @@ def create_record_batch_reader(packet_generator, context, state=None,
     ``arrow_types`` maps column names to Arrow types, overriding the
     default mapping. Columns of types without a default Arrow
     representation (``JSON``) require an entry.
+
+    Blocks with more than 2GiB of string data in a column are split
+    into several batches. With ``large_strings`` string and binary
+    columns are read as ``large_string``/``large_binary`` instead.
     """
+    use_numpy = context.client_settings.get('use_numpy', False)
     strings_as_bytes = context.client_settings.get('strings_as_bytes', False)
+    large_ints_as_words = context.client_settings.get(
+        'large_ints_as_words', False
+    )
 
     blocks = _data_blocks(packet_generator)
 
@@ -64,16 +151,19 @@ def create_record_batch_reader(packet_generator, context, state=None,
         return pa.RecordBatchReader.from_batches(pa.schema([]), iter([]))
 
     columns_with_types = first_block.columns_with_types
-    fields = _resolve_fields(
-        columns_with_types, strings_as_bytes, arrow_types
+    plan = _schema_plan(
+        tuple(columns_with_types), use_numpy, strings_as_bytes,
+        large_ints_as_words, large_strings,
+        tuple(sorted((arrow_types or {}).items())), field_metadata
     )
+    fields, schema = plan.resolved
 
     # Header block contains no rows.
     buffered = [first_block] if first_block.num_rows else []
 
     # Types without explicit mapping are inferred from the first non-empty
     # block. It has to be received before the schema can be built.
-    if any(type_ is None for type_, _ in fields):
+    if schema is None:
         while not buffered:
             block = next(blocks, None)
             if block is None:
@@ -82,18 +172,23 @@ def create_record_batch_reader(packet_generator, context, state=None,
                 buffered.append(block)
 
         fields = _infer_missing_types(fields, buffered)
+        schema = _make_schema(columns_with_types, fields, field_metadata)
 
-    schema = pa.schema([
-        pa.field(
-            name, type_,
-            metadata={'clickhouse_type': spec} if field_metadata else None
-        )
-        for (name, spec), (type_, _) in zip(columns_with_types, fields)
-    ])
+        # Next runs of the query get the schema before the first block.
+        # Null types of all-NULL or empty values are not reused: next
+        # runs may have values.
+        reusable = buffered and plan.reuse_inferred and \
+            not any(_has_null_type(type_) for type_, _ in fields)
+        if reusable:
+            plan.resolved = fields, schema
 
-    def batches():
+    convert_threads = context.client_settings.get('arrow_convert_threads')
+    executor = ThreadPoolExecutor(convert_threads) if convert_threads \
+        else None
+
+    def data_blocks():
         for block in buffered:
-            yield _block_to_batch(block, schema, fields)
+            yield block
 
         while True:
             # The stream may have been cancelled by a subsequent query
@@ -107,39 +202,213 @@ def create_record_batch_reader(packet_generator, context, state=None,
                 break
 
             if block.num_rows:
-                yield _block_to_batch(block, schema, fields)
+                yield block
 
         if state is not None:
             state.finished = True
 
-    return pa.RecordBatchReader.from_batches(schema, batches())
+    def batches():
+        try:
+            if executor is None:
+                for block in data_blocks():
+                    for batch in _block_to_batches(block, schema, fields):
+                        yield batch
+                return
+
+            # Columns of a block are converted by the pool while the
+            # next block is read and decompressed on this thread.
+            pending = None
+            for block in data_blocks():
+                futures = [
+                    executor.submit(_column_to_array, column, *field)
+                    for column, field in zip(block.get_columns(), fields)
+                ]
+                if pending is not None:
+                    arrays = [x.result() for x in pending]
+                    for batch in _arrays_to_batches(arrays, schema):
+                        yield batch
+                pending = futures
+
+            if pending is not None:
+                arrays = [x.result() for x in pending]
+                for batch in _arrays_to_batches(arrays, schema):
+                    yield batch
+
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+            # Reader released before the end of the stream.
+            if state is not None:
+                state.release()
+
+    rv = batches()
+    if target_batch_rows or target_batch_bytes:
+        rv = _coalesce_batches(
+            rv, schema, target_batch_rows, target_batch_bytes, split_batches
+        )
+
+    return pa.RecordBatchReader.from_batches(schema, rv)
+
+
+class _SchemaPlan(object):
+    """
+    Resolved ``(type, converter)`` pairs of result columns and their
+    schema, replaced as a whole. Schema is ``None`` while some types
+    are to be inferred from data.
+    """
+    __slots__ = ('resolved', 'reuse_inferred')
+
+    def __init__(self, fields, schema, reuse_inferred):
+        self.resolved = fields, schema
+        self.reuse_inferred = reuse_inferred
+
+
+@lru_cache(256)
+def _schema_plan(columns_with_types, use_numpy, strings_as_bytes,
+                 large_ints_as_words, large_strings, arrow_types,
+                 field_metadata):
+    """
+    Repeated queries share the plan: type specs are parsed once, types
+    inferred from the first run's data are reused by the next runs.
+    Types of ``Dynamic`` variants and of Python ints of ``[U]Int128/256``
+    depend on data: they are inferred on every run. ``use_numpy`` is
+    only a part of the cache key: columns of the NumPy family are read
+    into other forms, so types inferred from them differ.
+    """
+    fields = _resolve_fields(
+        columns_with_types, strings_as_bytes, large_ints_as_words,
+        large_strings, dict(arrow_types)
+    )
+
+    inferred = [
+        spec for (_, spec), (type_, _) in zip(columns_with_types, fields)
+        if type_ is None
+    ]
+    if inferred:
+        reuse_inferred = not any(
+            x in spec for spec in inferred for x in DATA_DEPENDENT_TYPES
+        )
+        return _SchemaPlan(fields, None, reuse_inferred)
+
+    schema = _make_schema(columns_with_types, fields, field_metadata)
+    return _SchemaPlan(fields, schema, False)
+
+
+def _make_schema(columns_with_types, fields, field_metadata):
+    return pa.schema([
+        pa.field(
+            name, type_,
+            metadata={'clickhouse_type': spec} if field_metadata else None
+        )
+        for (name, spec), (type_, _) in zip(columns_with_types, fields)
+    ])
+
+
+def _coalesce_batches(batches, schema, target_rows, target_bytes, split):
+    pending = []
+    n_rows = n_bytes = 0
+
+    try:
+        for batch in batches:
+            if not batch.num_rows:
+                continue
+
+            # Byte size of slices is estimated from the average row size.
+            row_bytes = batch.nbytes / batch.num_rows
+            offset = 0
+
+            while offset < batch.num_rows:
+                size = batch.num_rows - offset
+                limit = split and _rows_left(
+                    n_rows, n_bytes, row_bytes, target_rows, target_bytes
+                )
+                if limit:
+                    size = min(size, limit)
+
+                pending.append(
+                    batch if size == batch.num_rows else
+                    batch.slice(offset, size)
+                )
+                offset += size
+                n_rows += size
+                n_bytes += row_bytes * size
+
+                if (target_rows and n_rows >= target_rows) or \
+                        (target_bytes and n_bytes >= target_bytes):
+                    for rv in _concat_batches(pending, schema):
+                        yield rv
+                    pending = []
+                    n_rows = n_bytes = 0
+
+        for rv in _concat_batches(pending, schema):
+            yield rv
+
+    finally:
+        # Release of the reader must reach the stream state.
+        batches.close()
+
+
+def _rows_left(n_rows, n_bytes, row_bytes, target_rows, target_bytes):
+    rv = []
+    if target_rows:
+        rv.append(target_rows - n_rows)
+    if target_bytes and row_bytes:
+        rv.append(max(ceil((target_bytes - n_bytes) / row_bytes), 1))
+    return min(rv) if rv else None
+
+
+def _concat_batches(batches, schema):
+    if len(batches) <= 1:
+        return batches
+
+    # Dictionaries of LowCardinality/Enum blocks may differ.
+    table = pa.Table.from_batches(batches, schema)
+    return table.unify_dictionaries().combine_chunks().to_batches()
 
 
 def _is_json_spec(spec):
     return spec == 'JSON' or spec.startswith('JSON(')
 
 
-def _json_declared_converter(spec, declared, name):
+def _is_string_type(type_):
+    return pa.types.is_string(type_) or pa.types.is_large_string(type_)
+
+
+def _declared_converter(spec, declared, name):
     """
-    Composes JSON converters for a declared Arrow type, following
-    Nullable/Array/Map containers down to JSON positions. Returns
-    ``None`` when the spec contains no JSON at positions matched by
-    the declared type.
+    Composes converters for a declared Arrow type, following
+    Nullable/LowCardinality/Array/Map containers. JSON positions get
+    JSON text or object converters, UUID/IP positions declared as
+    strings get text converters, other positions keep their default
+    converters. Returns ``None`` when values need no conversion.
     """
     if _is_json_spec(spec):
-        if pa.types.is_string(declared) or \
-                pa.types.is_large_string(declared):
+        if _is_string_type(declared):
             return json_as_text(name)
         return json_as_object
 
+    if spec in BINARY_TYPES and _is_string_type(declared):
+        return address_as_text
+
+    if spec in LARGE_INT_TYPES:
+        if pa.types.is_fixed_size_binary(declared):
+            return large_int_as_words(spec)
+        return None
+
     if spec.startswith('Nullable('):
-        return _json_declared_converter(
+        return _declared_converter(
             get_inner_spec('Nullable', spec), declared, name
         )
 
+    if spec.startswith('LowCardinality('):
+        return _declared_converter(
+            get_inner_spec('LowCardinality', spec), declared, name
+        )
+
     if spec.startswith('Array(') and (
             pa.types.is_list(declared) or pa.types.is_large_list(declared)):
-        inner = _json_declared_converter(
+        inner = _declared_converter(
             get_inner_spec('Array', spec), declared.value_type, name
         )
         if inner is None:
@@ -150,33 +419,42 @@ def _json_declared_converter(spec, declared, name):
         return converter
 
     if spec.startswith('Map(') and pa.types.is_map(declared):
-        _, value_spec = get_inner_columns(get_inner_spec('Map', spec))
-        value_converter = _json_declared_converter(
+        key_spec, value_spec = get_inner_columns(get_inner_spec('Map', spec))
+        key_converter = _declared_converter(
+            key_spec, declared.key_type, name
+        )
+        value_converter = _declared_converter(
             value_spec, declared.item_type, name
         )
-        if value_converter is None:
+        if key_converter is None and value_converter is None:
             return None
 
-        def converter(value, _vc=value_converter):
+        def converter(value, _kc=key_converter, _vc=value_converter):
             return [
-                (k, None if v is None else _vc(v))
+                (
+                    _kc(k) if _kc else k,
+                    (None if v is None else _vc(v)) if _vc else v
+                )
                 for k, v in value.items()
             ]
         return converter
 
-    return None
+    return get_type_and_converter(spec)[1]
 
 
-def _resolve_fields(columns_with_types, strings_as_bytes, arrow_types):
+def _resolve_fields(columns_with_types, strings_as_bytes, large_ints_as_words,
+                    large_strings, arrow_types):
     fields = []
     for name, spec in columns_with_types:
-        type_, converter = get_type_and_converter(spec, strings_as_bytes)
+        type_, converter = get_type_and_converter(
+            spec, strings_as_bytes, large_ints_as_words
+        )
+        if large_strings and type_ is not None and type_ is not UNSUPPORTED:
+            type_ = _large_type(type_)
 
         declared = (arrow_types or {}).get(name)
         if declared is not None:
-            json_converter = _json_declared_converter(spec, declared, name)
-            if json_converter is not None:
-                converter = json_converter
+            converter = _declared_converter(spec, declared, name)
             type_ = declared
 
         elif type_ is UNSUPPORTED:
@@ -213,12 +491,146 @@ def _infer_missing_types(fields, buffered):
     return rv
 
 
-def _block_to_batch(block, schema, fields):
+def _has_null_type(type_):
+    if pa.types.is_null(type_):
+        return True
+
+    if pa.types.is_dictionary(type_):
+        return _has_null_type(type_.value_type)
+
+    # List, struct, map and union children.
+    return any(
+        _has_null_type(type_.field(i).type) for i in range(type_.num_fields)
+    )
+
+
+def _block_to_batches(block, schema, fields):
     arrays = [
         _column_to_array(column, type_, converter)
         for column, (type_, converter) in zip(block.get_columns(), fields)
     ]
-    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+    return _arrays_to_batches(arrays, schema)
+
+
+def _arrays_to_batches(arrays, schema):
+    # String columns over 2GiB are read with large offsets.
+    promoted = [
+        i for i, (array, field) in enumerate(zip(arrays, schema))
+        if array.type != field.type
+    ]
+    if promoted:
+        return _split_promoted(arrays, promoted, schema)
+
+    return [pa.RecordBatch.from_arrays(arrays, schema=schema)]
+
+
+def _split_promoted(arrays, promoted, schema):
+    """
+    Slices a block with large string columns into batches in which
+    every such column fits into int32 offsets of the schema type.
+    Slices are rebuilt with rebased offsets, other columns are sliced
+    without copying.
+    """
+    for i in promoted:
+        type_, field = arrays[i].type, schema.field(i)
+        if type_ != _large_type(field.type):
+            raise ValueError(
+                'Column {} of type {} does not match its schema type '
+                '{}'.format(field.name, type_, field.type)
+            )
+
+        if not _is_large_type(type_):
+            raise ValueError(
+                'Block string data in a nested column exceeds 2GiB. Lower '
+                'max_block_size or pass large_strings=True to read it.'
+            )
+
+    offsets = [
+        np.frombuffer(arrays[i].buffers()[1], dtype=np.int64)
+        for i in promoted
+    ]
+
+    batches = []
+    n_rows = len(arrays[0])
+    start = 0
+    while start < n_rows:
+        end = min(
+            int(np.searchsorted(
+                x, x[start] + MAX_BINARY_SIZE, side='right'
+            )) - 1
+            for x in offsets
+        )
+        if end == start:
+            raise ValueError(
+                'String value exceeds 2GiB. Pass large_strings=True '
+                'to read it.'
+            )
+
+        columns = [array.slice(start, end - start) for array in arrays]
+        for i, x in zip(promoted, offsets):
+            columns[i] = _rebased_slice(
+                arrays[i], x, start, end, schema.field(i).type
+            )
+
+        batches.append(pa.RecordBatch.from_arrays(columns, schema=schema))
+        start = end
+
+    return batches
+
+
+def _rebased_slice(array, offsets, start, end, type_):
+    validity = array.buffers()[0]
+    nulls_map = None
+    if validity is not None:
+        bits = np.unpackbits(
+            np.frombuffer(validity, dtype=np.uint8), bitorder='little'
+        )
+        nulls_map = 1 - bits[start:end]
+
+    data = np.frombuffer(array.buffers()[2], dtype=np.uint8)
+    return _binary_buffers_to_array(
+        offsets[start:end + 1] - offsets[start],
+        data[offsets[start]:offsets[end]], nulls_map, type_
+    )
+
+
+def _is_large_type(type_):
+    return pa.types.is_large_string(type_) or pa.types.is_large_binary(type_)
+
+
+def _large_type(type_):
+    """
+    Replaces string and binary types, including nested ones, with
+    their 64-bit offsets variants.
+    """
+    if pa.types.is_string(type_):
+        return pa.large_string()
+
+    if pa.types.is_binary(type_):
+        return pa.large_binary()
+
+    if pa.types.is_map(type_):
+        return pa.map_(
+            _large_type(type_.key_type), _large_type(type_.item_type)
+        )
+
+    if pa.types.is_list(type_):
+        return pa.list_(_large_type(type_.value_type))
+
+    if pa.types.is_large_list(type_):
+        return pa.large_list(_large_type(type_.value_type))
+
+    if pa.types.is_struct(type_):
+        return pa.struct([
+            field.with_type(_large_type(field.type)) for field in type_
+        ])
+
+    if pa.types.is_dictionary(type_):
+        return pa.dictionary(
+            type_.index_type, _large_type(type_.value_type), type_.ordered
+        )
+
+    return type_
 
 
 def _column_to_array(column, type_, converter):
@@ -226,6 +638,68 @@ def _column_to_array(column, type_, converter):
             isinstance(column, ArrowStringBuffers):
         return _string_buffers_to_array(column, type_)
 
+    if ArrowFixedStringBuffers is not None and \
+            isinstance(column, ArrowFixedStringBuffers):
+        return _fixed_string_buffers_to_array(column, type_)
+
+    if ArrowListBuffers is not None and isinstance(column, ArrowListBuffers):
+        return _list_buffers_to_array(column, type_)
+
+    if ArrowMapBuffers is not None and isinstance(column, ArrowMapBuffers):
+        return _map_buffers_to_array(column, type_)
+
+    if ArrowStructBuffers is not None and \
+            isinstance(column, ArrowStructBuffers):
+        return _struct_buffers_to_array(column, type_)
+
+    if ArrowDictionaryBuffers is not None and \
+            isinstance(column, ArrowDictionaryBuffers):
+        return _dictionary_buffers_to_array(column, type_)
+
+    if ArrowDecimalBuffers is not None and \
+            isinstance(column, ArrowDecimalBuffers):
+        return _decimal_buffers_to_array(column, type_)
+
+    if ArrowUUIDBuffers is not None and isinstance(column, ArrowUUIDBuffers):
+        return _address_buffers_to_array(
+            column.data, len(column), column.nulls_map, type_,
+            pa.binary(16), format_uuids
+        )
+
+    if ArrowIPv4Buffers is not None and isinstance(column, ArrowIPv4Buffers):
+        return _address_buffers_to_array(
+            column.values, len(column), column.nulls_map, type_,
+            pa.uint32(), format_ipv4
+        )
+
+    if ArrowIPv6Buffers is not None and isinstance(column, ArrowIPv6Buffers):
+        return _address_buffers_to_array(
+            column.data, len(column), column.nulls_map, type_,
+            pa.binary(16), format_ipv6
+        )
+
+    if ArrowEnumBuffers is not None and isinstance(column, ArrowEnumBuffers):
+        return _enum_buffers_to_array(column, type_)
+
+    if ArrowLargeIntBuffers is not None and \
+            isinstance(column, ArrowLargeIntBuffers):
+        return _large_int_buffers_to_array(column, type_)
+
+    if ArrowUnionBuffers is not None and \
+            isinstance(column, ArrowUnionBuffers):
+        return _union_buffers_to_array(column, type_)
+
+    if ArrowJsonBuffers is not None and isinstance(column, ArrowJsonBuffers):
+        return _json_buffers_to_array(column, type_, converter)
+
+    if ArrowTimestampBuffers is not None and \
+            isinstance(column, ArrowTimestampBuffers):
+        return _timestamp_buffers_to_array(column, type_)
+
+    if ArrowIntervalBuffers is not None and \
+            isinstance(column, ArrowIntervalBuffers):
+        return _interval_buffers_to_array(column, type_)
+
     if np is not None and isinstance(column, np.ma.MaskedArray):
         return _masked_to_array(column, type_, converter)
 
@@ -235,15 +709,6 @@ def _column_to_array(column, type_, converter):
             column.dtype.kind in 'iufbM':
         return pa.array(column, type=type_)
 
-    if pd is not None and isinstance(column, pd.Categorical):
-        if converter is None:
-            # Categorical maps to Arrow dictionary array without
-            # iterating over values.
-            dictionary = pa.array(column)
-            return dictionary.cast(type_) if type_ is not None \
-                else dictionary
-        column = [None if pd.isna(x) else x for x in column]
-
     if converter is not None:
         column = [None if x is None else converter(x) for x in column]
 
@@ -256,30 +721,725 @@ def _string_buffers_to_array(column, type_):
     concatenated bytes + offsets, no per-string Python objects. The
     binary -> string cast validates UTF-8 in C.
     """
-    n_items = len(column)
     offsets = np.frombuffer(column.offsets, dtype=np.int64)
+    return _binary_buffers_to_array(
+        offsets, column.data, column.nulls_map, type_
+    )
 
-    if offsets[-1] > 2 ** 31 - 1:
+
+def _fixed_string_buffers_to_array(column, type_):
+    """
+    Assembles a fixed_size_binary array over the FixedString buffer as
+    is. For variable-length targets trailing zero bytes are trimmed
+    for all rows at once: offsets are built from per-row lengths and
+    the data is compacted with a single mask.
+    """
+    n_items = len(column)
+    length = column.length
+    data = np.frombuffer(column.data, dtype=np.uint8)
+
+    if type_ is not None and pa.types.is_fixed_size_binary(type_):
+        array = pa.Array.from_buffers(pa.binary(length), n_items, [
+            _validity_buffer(column.nulls_map), pa.py_buffer(data)
+        ])
+        return array.cast(type_) if array.type != type_ else array
+
+    if column.trim:
+        chars = data.reshape(n_items, length)
+        nonzero = chars != 0
+        # Last non-zero byte position plus one: zero bytes padding is
+        # dropped, zero bytes inside the string are kept.
+        lengths = length - np.argmax(nonzero[:, ::-1], axis=1)
+        lengths[~nonzero.any(axis=1)] = 0
+        data = chars[np.arange(length) < lengths[:, None]]
+    else:
+        lengths = np.full(n_items, length, dtype=np.int64)
+
+    offsets = np.zeros(n_items + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return _binary_buffers_to_array(offsets, data, column.nulls_map, type_)
+
+
+def _binary_buffers_to_array(offsets, data, nulls_map, type_):
+    if type_ is None:
+        type_ = pa.string()
+
+    # Data over 2GiB can't be addressed by int32 offsets: the array is
+    # promoted to the large type and split into batches later.
+    if _is_large_type(type_) or offsets[-1] > MAX_BINARY_SIZE:
+        binary_type = pa.large_binary()
+        type_ = _large_type(type_)
+        offsets = offsets.astype(np.int64, copy=False)
+    else:
+        binary_type = pa.binary()
+        offsets = offsets.astype(np.int32)
+
+    binary = pa.Array.from_buffers(binary_type, len(offsets) - 1, [
+        _validity_buffer(nulls_map),
+        pa.py_buffer(offsets),
+        pa.py_buffer(data)
+    ])
+
+    return binary if type_ == binary_type else binary.cast(type_)
+
+
+def _validity_buffer(nulls_map):
+    if nulls_map is None:
+        return None
+    return pa.py_buffer(np.packbits(nulls_map == 0, bitorder='little'))
+
+
+def _decimal_buffers_to_array(column, type_):
+    """
+    Wraps wire decimals into Arrow decimal buffers. Both are
+    little-endian two's complement: Decimal128/256 are used as is,
+    Decimal32/64 are sign-extended to 128 bits.
+    """
+    precision, scale = column.precision, column.scale
+
+    if column.item_size == 32:
+        natural_type = pa.decimal256(precision, scale)
+        data = column.data
+
+    elif column.item_size == 16:
+        natural_type = pa.decimal128(precision, scale)
+        data = column.data
+
+    else:
+        natural_type = pa.decimal128(precision, scale)
+        values = np.frombuffer(column.data, dtype='<i{}'.format(
+            column.item_size
+        ))
+        data = np.empty((len(values), 2), dtype='<i8')
+        data[:, 0] = values
+        # High word is all sign bits.
+        data[:, 1] = data[:, 0] >> 63
+
+    array = pa.Array.from_buffers(natural_type, len(column), [
+        _validity_buffer(column.nulls_map), pa.py_buffer(data)
+    ])
+
+    if type_ is not None and array.type != type_:
+        array = array.cast(type_)
+    return array
+
+
+def _address_buffers_to_array(data, n_items, nulls_map, type_,
+                              natural_type, formatter):
+    """
+    Wraps UUID/IP buffers as is or, for a declared string type,
+    formats all values at once.
+    """
+    if type_ is not None and _is_string_type(type_):
+        offsets, text = formatter(data)
+        return _binary_buffers_to_array(offsets, text, nulls_map, type_)
+
+    array = pa.Array.from_buffers(natural_type, n_items, [
+        _validity_buffer(nulls_map), pa.py_buffer(data)
+    ])
+
+    if type_ is not None and array.type != type_:
+        array = array.cast(type_)
+    return array
+
+
+def _large_int_buffers_to_array(column, type_):
+    """
+    Wraps raw words of 128/256-bit integers as fixed_size_binary or,
+    for a declared decimal type, as decimal128(38, 0) when all values
+    fit into it.
+    """
+    n_items = len(column)
+    validity = _validity_buffer(column.nulls_map)
+
+    if type_ is None or not pa.types.is_decimal(type_):
+        array = pa.Array.from_buffers(pa.binary(column.item_size), n_items, [
+            validity, pa.py_buffer(column.data)
+        ])
+        if type_ is not None and array.type != type_:
+            array = array.cast(type_)
+        return array
+
+    words = np.frombuffer(column.data, dtype='<u8').reshape(n_items, -1)
+    if column.nulls_map is not None:
+        words = words[column.nulls_map == 0]
+
+    if not _words_fit_decimal128(words, column.signed):
         raise ValueError(
-            'Block string data exceeds 2GiB. '
-            'Lower max_block_size to stream it.'
+            'Values do not fit into decimal128(38, 0). Declare '
+            'fixed_size_binary to get raw little-endian words instead.'
         )
 
-    validity = None
-    if column.nulls_map is not None:
-        validity = pa.py_buffer(
-            np.packbits(column.nulls_map == 0, bitorder='little')
+    # Two's complement of the lower 128 bits is the decimal128 buffer.
+    data = np.ascontiguousarray(
+        np.frombuffer(column.data, dtype='<u8').reshape(n_items, -1)[:, :2]
+    )
+    array = pa.Array.from_buffers(pa.decimal128(38, 0), n_items, [
+        validity, pa.py_buffer(data)
+    ])
+    if array.type != type_:
+        array = array.cast(type_)
+    return array
+
+
+def _words_fit_decimal128(words, signed):
+    """
+    Checks that every value given by little-endian words is less than
+    10 ** 38 by absolute value.
+    """
+    if not len(words):
+        return True
+
+    high = words[:, 1]
+    low = words[:, 0]
+
+    if signed:
+        negative = words[:, -1] >> 63 == 1
+        # Upper words must be the sign extension of the lower 128 bits.
+        sign_words = np.where(
+            negative, np.uint64(2 ** 64 - 1), np.uint64(0)
+        )
+        if words.shape[1] > 2 and \
+                (words[:, 2:] != sign_words[:, None]).any():
+            return False
+        if (negative != (high >> 63 == 1)).any():
+            return False
+
+        # Absolute value of negative numbers: ~x + 1.
+        low = np.where(negative, ~low + np.uint64(1), low)
+        high = np.where(
+            negative, ~high + (low == 0).astype(np.uint64), high
         )
 
-    binary = pa.Array.from_buffers(pa.binary(), n_items, [
-        validity,
-        pa.py_buffer(offsets.astype(np.int32)),
-        pa.py_buffer(column.data)
+    elif words.shape[1] > 2 and (words[:, 2:] != 0).any():
+        return False
+
+    return bool((
+        (high < DECIMAL128_BOUND_HIGH) |
+        ((high == DECIMAL128_BOUND_HIGH) & (low < DECIMAL128_BOUND_LOW))
+    ).all())
+
+
+def _list_buffers_to_array(column, type_):
+    """
+    Assembles a list array from wire offsets and the inner column
+    converted as a whole: no per-row Python lists.
+    """
+    value_type = type_.value_type if type_ is not None else None
+    values = _column_to_array(column.values, value_type, None)
+
+    if type_ is not None and pa.types.is_large_list(type_):
+        offsets = pa.array(column.offsets, type=pa.int64())
+        return pa.LargeListArray.from_arrays(offsets, values)
+
+    array = pa.ListArray.from_arrays(_int32_offsets(column.offsets), values)
+    if type_ is not None and array.type not in (type_, _large_type(type_)):
+        array = array.cast(type_)
+    return array
+
+
+def _map_buffers_to_array(column, type_):
+    """
+    Assembles a map array from wire offsets and key/value columns
+    converted as a whole: no per-row dicts or (key, value) tuples.
+    """
+    key_type = type_.key_type if type_ is not None else None
+    item_type = type_.item_type if type_ is not None else None
+
+    array = pa.MapArray.from_arrays(
+        _int32_offsets(column.offsets),
+        _column_to_array(column.keys, key_type, None),
+        _column_to_array(column.values, item_type, None)
+    )
+    if type_ is not None and array.type not in (type_, _large_type(type_)):
+        array = array.cast(type_)
+    return array
+
+
+def _struct_buffers_to_array(column, type_):
+    """
+    Assembles a struct array from element columns converted as a
+    whole: no per-row tuples.
+    """
+    if type_ is not None:
+        fields = list(type_)
+        arrays = [
+            _column_to_array(x, field.type, None)
+            for x, field in zip(column.columns, fields)
+        ]
+        # Promoted string data over 2GiB changes field types.
+        fields = [
+            field.with_type(array.type)
+            for field, array in zip(fields, arrays)
+        ]
+        return pa.StructArray.from_arrays(arrays, fields=fields)
+
+    return pa.StructArray.from_arrays(
+        [_column_to_array(x, None, None) for x in column.columns],
+        names=tuple_field_names(column.names)
+    )
+
+
+def _dictionary_buffers_to_array(column, type_):
+    """
+    Assembles a dictionary array from LowCardinality keys and index.
+    Unless a dictionary type is declared, values are decoded with
+    ``take`` to the plain type of the nested column.
+    """
+    keys = column.keys
+    mask = keys == 0 if column.nullable else None
+
+    if type_ is not None and pa.types.is_dictionary(type_):
+        dictionary = _column_to_array(column.index, type_.value_type, None)
+        if column.nullable:
+            # The first index element stands for NULL.
+            dictionary = dictionary[1:]
+            keys = keys.astype(np.int64) - 1
+            keys[mask] = 0
+
+        indices = pa.array(keys, type=type_.index_type, mask=mask)
+        return pa.DictionaryArray.from_arrays(indices, dictionary)
+
+    dictionary = _column_to_array(column.index, type_, None)
+    return dictionary.take(pa.array(keys, mask=mask))
+
+
+def _enum_buffers_to_array(column, type_):
+    """
+    Assembles a dictionary array from dense enum indices and the
+    dictionary cached per enum. Unless a dictionary type is declared,
+    values are decoded with ``take``.
+    """
+    dictionary = _enum_dictionary(column.names)
+    mask = None
+    if column.nulls_map is not None:
+        mask = column.nulls_map != 0
+
+    if type_ is not None and pa.types.is_dictionary(type_):
+        if type_.value_type != dictionary.type:
+            dictionary = dictionary.cast(type_.value_type)
+        indices = pa.array(column.indices, type=type_.index_type, mask=mask)
+        return pa.DictionaryArray.from_arrays(indices, dictionary)
+
+    array = dictionary.take(pa.array(column.indices, mask=mask))
+    if type_ is not None and array.type != type_:
+        array = array.cast(type_)
+    return array
+
+
+def _union_buffers_to_array(column, type_):
+    """
+    Assembles a dense union array from Variant/Dynamic discriminators
+    and variant columns converted as a whole. Discriminators become
+    type ids, offsets are positions of rows within their variant. NULL
+    rows go to the trailing null child.
+
+    Children are matched to the fields of ``type_`` by name: variants
+    of Dynamic may differ from block to block. Rows of variants missing
+    in ``type_`` are put into its SharedVariant child the way the server
+    stores values of types over the Dynamic limit.
+    """
+    names = list(column.names) + [UNION_NULL_NAME]
+    n_children = len(names)
+    ids, counts, positions = _union_positions(column)
+
+    # Positions in the children laid out one after another: offsets
+    # are relative to the child start.
+    starts = np.zeros(n_children, dtype=np.int32)
+    np.cumsum(counts[:-1], out=starts[1:])
+    offsets = positions - starts[ids]
+
+    payloads = list(column.children) + [None]
+
+    if type_ is None:
+        child_types = [_union_child_type(name) for name in names]
+        type_codes = list(range(n_children))
+        children = [
+            _union_child_array(name, child_type, payload, count)
+            for name, child_type, payload, count in zip(
+                names, child_types, payloads, counts
+            )
+        ]
+
+    else:
+        fields = {field.name: field.type for field in type_}
+        # Variants without rows in this block don't matter.
+        moved = [
+            i for i, (name, count) in enumerate(zip(names, counts))
+            if count and name not in fields
+        ]
+        if moved and SHARED_VARIANT_NAME not in fields:
+            raise ValueError(
+                'Variants {} are missing in union type {}'.format(
+                    ', '.join(sorted(names[i] for i in moved)), type_
+                )
+            )
+
+        arrays = {
+            name: _union_child_array(name, fields[name], payload, count)
+            for name, payload, count in zip(names, payloads, counts)
+            if name in fields
+        }
+
+        if moved:
+            shared_type = fields[SHARED_VARIANT_NAME]
+            shared = arrays.get(SHARED_VARIANT_NAME)
+            parts = [pa.array([], type=shared_type)] if shared is None \
+                else [shared]
+            base = len(parts[0])
+            for i in moved:
+                offsets[ids == i] += base
+                parts.append(
+                    _shared_variant_blobs(names[i], payloads[i], shared_type)
+                )
+                base += int(counts[i])
+            arrays[SHARED_VARIANT_NAME] = pa.concat_arrays(parts)
+
+        codes = {field.name: code for code, field in zip(
+            type_.type_codes, type_
+        )}
+        lookup = np.zeros(n_children, dtype=np.int8)
+        for i, name in enumerate(names):
+            if name in codes:
+                lookup[i] = codes[name]
+        for i in moved:
+            lookup[i] = codes[SHARED_VARIANT_NAME]
+        ids = lookup[ids]
+
+        # Variants absent in this block get empty children.
+        names = list(fields)
+        type_codes = list(type_.type_codes)
+        children = [
+            arrays[name] if name in arrays else pa.array([], type=child_type)
+            for name, child_type in fields.items()
+        ]
+
+    return pa.UnionArray.from_dense(
+        pa.array(ids, type=pa.int8()), pa.array(offsets, type=pa.int32()),
+        children, names, type_codes
+    )
+
+
+def _union_child_array(name, type_, payload, count):
+    if name == UNION_NULL_NAME:
+        return pa.nulls(count)
+
+    converter = None
+    if name != SHARED_VARIANT_NAME:
+        converter = get_type_and_converter(name)[1]
+    return _column_to_array(payload, type_, converter)
+
+
+def _shared_variant_blobs(name, payload, type_):
+    """
+    Encodes rows of a variant as SharedVariant values:
+    ``encodeDataType`` of the variant type followed by the value in
+    ``serializeBinary`` form. Only scalar variants can be encoded.
+    """
+    prefix = encode_type_spec(name)
+
+    if name == 'String' or name.startswith('FixedString('):
+        values = _column_to_array(payload, pa.binary(), None).to_pylist()
+        if name == 'String':
+            values = [make_varint(len(x)) + x for x in values]
+        else:
+            # Trimmed zero bytes padding is restored.
+            length = int(name[12:-1])
+            values = [x.ljust(length, b'\0') for x in values]
+
+    else:
+        if ArrowTimestampBuffers is not None and \
+                isinstance(payload, ArrowTimestampBuffers):
+            data = payload.values
+        elif name in SHARED_VALUE_DTYPES:
+            data = np.asarray(payload).astype(
+                SHARED_VALUE_DTYPES[name], copy=False
+            )
+        else:
+            raise NotImplementedError(
+                'Cannot encode {} values into SharedVariant'.format(name)
+            )
+
+        # Values of fixed size types are serialized as is.
+        rows = np.ascontiguousarray(data).view(np.uint8)
+        values = [
+            x.tobytes() for x in rows.reshape(len(data), data.dtype.itemsize)
+        ]
+
+    return pa.array([prefix + x for x in values], type=type_)
+
+
+def _union_positions(column):
+    """
+    Maps NULL discriminators to the trailing null child. Returns type
+    ids, row counts of every child and positions of rows in children
+    concatenated in type id order.
+    """
+    discriminators = column.discriminators
+    n_children = len(column.names) + 1
+
+    ids = discriminators.astype(np.int8)
+    ids[discriminators == NULL_DISCRIMINATOR] = n_children - 1
+
+    # Stable sort groups rows by variant keeping their order.
+    counts = np.bincount(ids, minlength=n_children)
+    positions = np.empty(len(ids), dtype=np.int32)
+    positions[np.argsort(ids, kind='stable')] = \
+        np.arange(len(ids), dtype=np.int32)
+    return ids, counts, positions
+
+
+def _union_child_type(name):
+    if name == UNION_NULL_NAME:
+        return pa.null()
+    if name == SHARED_VARIANT_NAME:
+        return pa.binary()
+
+    type_ = get_type_and_converter(name)[0]
+    return None if type_ is UNSUPPORTED else type_
+
+
+def _json_buffers_to_array(column, type_, converter):
+    """
+    Assembles a struct array from JSON dynamic paths: every declared
+    field is built from its path's variants converted as a whole and
+    cast to the field type. Only values of the paths stored in shared
+    data are decoded row by row. Dotted paths go to nested structs.
+
+    Other types are built from per-row dicts, JSON text sent by the
+    server is passed through or parsed.
+    """
+    nulls_map = column.nulls_map
+    mask = None if nulls_map is None else nulls_map.astype(bool)
+
+    if column.texts is not None:
+        if type_ is not None and _is_string_type(type_):
+            values = [x or '{}' for x in column.texts]
+        else:
+            values = [json_as_object(x) for x in column.texts]
+        return pa.array(values, type=type_, mask=mask)
+
+    if type_ is None or not pa.types.is_struct(type_):
+        values = [_json_path_values(x, column.decode) for x in column.children]
+        rows = column.fold(len(column), values, column.shared_rows)
+        if converter is not None:
+            rows = [converter(x) for x in rows]
+        return pa.array(rows, type=type_, mask=mask)
+
+    declared = set()
+    _collect_struct_paths(type_, '', declared)
+
+    shared = {}
+    for i, entries in enumerate(column.shared_rows):
+        for path, blob in entries:
+            if path in declared:
+                rows, values = shared.setdefault(path, ([], []))
+                rows.append(i)
+                values.append(column.decode(blob))
+
+    paths = dict(zip(column.paths, column.children))
+    return _json_struct_array(
+        type_, '', len(column), paths, shared, column.decode,
+        nulls_map=nulls_map
+    )
+
+
+def _collect_struct_paths(type_, prefix, rv):
+    for field in type_:
+        path = prefix + field.name
+        rv.add(path)
+        if pa.types.is_struct(field.type):
+            _collect_struct_paths(field.type, path + '.', rv)
+
+
+def _json_struct_array(type_, prefix, n_rows, paths, shared, decode,
+                       nulls_map=None):
+    children = []
+    for field in type_:
+        path = prefix + field.name
+        if pa.types.is_struct(field.type) and \
+                path not in paths and path not in shared:
+            child = _json_struct_array(
+                field.type, path + '.', n_rows, paths, shared, decode
+            )
+        else:
+            child = _json_path_to_array(
+                paths.get(path), shared.get(path), n_rows, field.type,
+                decode
+            )
+        children.append(child)
+
+    # Nested objects are missing in rows without any of their paths.
+    if prefix and children:
+        valid = np.zeros(n_rows, dtype=bool)
+        for child in children:
+            valid |= child.is_valid().to_numpy(zero_copy_only=False)
+        nulls_map = (~valid).astype(np.uint8)
+
+    return pa.Array.from_buffers(
+        type_, n_rows, [_validity_buffer(nulls_map)], children=children
+    )
+
+
+def _json_path_to_array(column, shared, n_rows, type_, decode):
+    """
+    Converts the variants of a path to ``type_`` and takes every row
+    from its variant. Rows of the path stored in shared data are taken
+    from the decoded values.
+    """
+    if column is None:
+        array = pa.nulls(n_rows, type_)
+
+    else:
+        ids, counts, positions = _union_positions(column)
+
+        parts = []
+        for name, payload in zip(column.names, column.children):
+            if name == SHARED_VARIANT_NAME:
+                part = pa.array([decode(x) for x in payload], type=type_)
+            else:
+                converter = get_type_and_converter(name)[1]
+                part = _column_to_array(
+                    payload, _union_child_type(name), converter
+                )
+                if part.type != type_:
+                    part = part.cast(type_)
+            parts.append(part)
+        parts.append(pa.nulls(int(counts[-1]), type_))
+
+        array = pa.concat_arrays(parts).take(pa.array(positions))
+
+    if shared is not None:
+        rows, values = shared
+        positions = np.arange(n_rows, dtype=np.int64)
+        positions[rows] = np.arange(n_rows, n_rows + len(rows))
+        array = pa.concat_arrays([
+            array, pa.array(values, type=type_)
+        ]).take(pa.array(positions))
+
+    return array
+
+
+def _json_path_values(column, decode):
+    """Python values of a path for per-row dicts."""
+    values = [None] * len(column)
+    for i, (name, payload) in enumerate(zip(column.names, column.children)):
+        rows = np.flatnonzero(column.discriminators == i).tolist()
+        if not rows:
+            continue
+
+        if name == SHARED_VARIANT_NAME:
+            chunk = [decode(x) for x in payload]
+        else:
+            converter = get_type_and_converter(name)[1]
+            chunk = _column_to_array(
+                payload, _union_child_type(name), converter
+            ).to_pylist()
+
+        for row, value in zip(rows, chunk):
+            values[row] = value
+
+    return values
+
+
+def _timestamp_buffers_to_array(column, type_):
+    """
+    Wraps UTC wire values into a timestamp array, without copying when
+    the scale matches an Arrow unit. Timezone-aware types only get
+    the timezone metadata. Timezone-naive types get local time of the
+    column's timezone computed by Arrow.
+    """
+    unit = datetime64_unit(column.scale)
+    values = column.values
+    if UNIT_PRECISIONS[unit] != column.scale:
+        values = values * 10 ** (UNIT_PRECISIONS[unit] - column.scale)
+    elif values.dtype != np.int64:
+        values = values.astype(np.int64)
+
+    if type_ is None:
+        type_ = pa.timestamp(unit, tz=column.timezone)
+
+    if pa.types.is_timestamp(type_) and type_.tz is not None:
+        tz = type_.tz
+    else:
+        tz = column.local_timezone
+
+    array = pa.Array.from_buffers(pa.timestamp(unit, tz=tz), len(values), [
+        _validity_buffer(column.nulls_map), pa.py_buffer(values)
     ])
 
-    if type_ is None or type_ == pa.string():
-        return binary.cast(pa.string())
-    return binary
+    if tz is not None and tz != getattr(type_, 'tz', None):
+        array = _local_timestamps(array, values, column.nulls_map)
+
+    return array if array.type == type_ else array.cast(type_)
+
+
+def _local_timestamps(array, values, nulls_map):
+    if hasattr(pc, 'local_timestamp'):
+        return pc.local_timestamp(array)
+
+    # PyArrow < 12.
+    import pandas as pd
+
+    unit = array.type.unit
+    local = pd.to_datetime(values, unit=unit, utc=True) \
+        .tz_convert(array.type.tz).tz_localize(None)
+    return pa.array(
+        local.to_numpy('datetime64[{}]'.format(unit)),
+        type=pa.timestamp(unit),
+        mask=None if nulls_map is None else nulls_map.astype(bool)
+    )
+
+
+def _interval_buffers_to_array(column, type_):
+    """
+    Interval lengths are durations in seconds or smaller units and
+    month_day_nano intervals of months or days. Integer types get the
+    lengths as is.
+    """
+    values = column.values
+    validity = _validity_buffer(column.nulls_map)
+
+    if type_ is not None and pa.types.is_integer(type_):
+        array = pa.Array.from_buffers(
+            pa.int64(), len(values), [validity, pa.py_buffer(values)]
+        )
+        return array if array.type == type_ else array.cast(type_)
+
+    unit, factor = INTERVAL_TYPES[column.ch_type]
+    natural_type = interval_type(column.ch_type)
+
+    if factor != 1:
+        values = values * factor
+
+    if unit in ('days', 'months'):
+        data = np.zeros(len(values), dtype=[
+            ('months', '<i4'), ('days', '<i4'), ('nanoseconds', '<i8')
+        ])
+        data[unit] = values
+        values = data
+
+    array = pa.Array.from_buffers(
+        natural_type, len(values), [validity, pa.py_buffer(values)]
+    )
+    if type_ is None or array.type == type_:
+        return array
+    return array.cast(type_)
+
+
+@lru_cache(512)
+def _enum_dictionary(names):
+    return pa.array(names, type=pa.string())
+
+
+def _int32_offsets(offsets):
+    if offsets[-1] > 2 ** 31 - 1:
+        raise ValueError(
+            'Block array data exceeds 2**31 elements. '
+            'Lower max_block_size to stream it.'
+        )
+
+    return pa.array(offsets.astype(np.int32))
 
 
 def _masked_to_array(column, type_, converter):
@@ -0,0 +1,80 @@
+import pyarrow as pa
+
+FORMATS = ('parquet', 'arrow', 'feather')
+
+
+def write_record_batches(reader, path, format='parquet', compression=None,
+                         compression_level=None):
+    """
+    Writes record batches of ``reader`` to ``path`` as they arrive: only
+    the batch being written is kept in memory. Every batch becomes a
+    Parquet row group or an Arrow IPC record batch.
+
+    ``compression`` and ``compression_level`` can be dictionaries
+    mapping column names to per-column options for Parquet. Feather
+    files are LZ4-compressed unless other compression is given.
+
+    Returns the number of written rows.
+    """
+    check_writer_options(format, compression, compression_level)
+
+    if format == 'parquet':
+        writer = _parquet_writer(
+            path, reader.schema, compression, compression_level
+        )
+    else:
+        options = pa.ipc.IpcWriteOptions(
+            compression=_ipc_codec(format, compression, compression_level)
+        )
+        writer = pa.ipc.new_file(path, reader.schema, options=options)
+
+    n_rows = 0
+    with writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            n_rows += batch.num_rows
+
+    return n_rows
+
+
+def _parquet_writer(path, schema, compression, compression_level):
+    import pyarrow.parquet as pq
+
+    options = {}
+    if compression is not None:
+        options['compression'] = compression
+    if compression_level is not None:
+        options['compression_level'] = compression_level
+
+    return pq.ParquetWriter(path, schema, **options)
+
+
+def check_writer_options(format, compression, compression_level):
+    """
+    Raises ``ValueError`` for options files can't be written with.
+    Called before the query is sent.
+    """
+    if format not in FORMATS:
+        raise ValueError(
+            'Unknown format {}. Supported formats: {}'.format(
+                format, ', '.join(FORMATS)
+            )
+        )
+
+    if format != 'parquet':
+        _ipc_codec(format, compression, compression_level)
+
+
+def _ipc_codec(format, compression, compression_level):
+    if isinstance(compression, dict) or isinstance(compression_level, dict):
+        raise ValueError(
+            'Per-column compression is supported for Parquet only'
+        )
+
+    if format == 'feather' and compression is None:
+        compression = 'lz4'
+
+    if compression is None:
+        return None
+    # Unknown codecs and levels raise ValueError.
+    return pa.Codec(compression, compression_level)
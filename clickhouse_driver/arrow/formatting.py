@@ -0,0 +1,145 @@
+"""
+Vectorized text formatting of UUID, IPv4 and IPv6 values.
+
+Each formatter lays out every row in a fixed-width character matrix
+with a visibility mask and compacts the visible characters into Arrow
+string buffers at once. No per-value Python objects are created.
+"""
+import numpy as np
+
+HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+DEC_DIGITS = np.frombuffer(b'0123456789', dtype=np.uint8)
+
+COLON = ord(':')
+DOT = ord('.')
+DASH = ord('-')
+
+# Positions of hex digits in 8-4-4-4-12 UUID text.
+UUID_DIGIT_POSITIONS = [i for i in range(36) if i not in (8, 13, 18, 23)]
+
+IPV4_MAPPED_PREFIX = np.frombuffer(b'::ffff:', dtype=np.uint8)
+
+
+def format_uuids(data):
+    """
+    UUIDs in RFC 4122 byte order to ``(offsets, data)`` of their
+    8-4-4-4-12 hex text.
+    """
+    octets = np.frombuffer(data, dtype=np.uint8).reshape(-1, 16)
+    n_items = len(octets)
+
+    digits = np.empty((n_items, 16, 2), dtype=np.uint8)
+    digits[:, :, 0] = HEX_DIGITS[octets >> 4]
+    digits[:, :, 1] = HEX_DIGITS[octets & 0xf]
+
+    chars = np.full((n_items, 36), DASH, dtype=np.uint8)
+    chars[:, UUID_DIGIT_POSITIONS] = digits.reshape(n_items, 32)
+
+    offsets = np.arange(0, 36 * (n_items + 1), 36, dtype=np.int64)
+    return offsets, chars.reshape(-1)
+
+
+def format_ipv4(values):
+    """IPv4 addresses as integers to ``(offsets, data)`` of dotted text."""
+    chars, visible = _ipv4_cells(np.asarray(values, dtype=np.uint32))
+    return _compact(chars, visible)
+
+
+def format_ipv6(data):
+    """
+    IPv6 addresses in network byte order to ``(offsets, data)`` of
+    RFC 5952 text: lowercase hex without leading zeros, the longest
+    run of two or more zero groups (the first one on ties) replaced by
+    ``::`` and IPv4-mapped addresses in ``::ffff:a.b.c.d`` form.
+    """
+    groups = np.frombuffer(data, dtype='>u2').reshape(-1, 8)
+    n_items = len(groups)
+    run_start, run_end = _longest_zero_runs(groups)
+    has_run = run_end - run_start >= 2
+
+    # Each group takes five cells: four digits and a trailing colon.
+    # Lead cell holds the first colon of a leading "::".
+    cells = np.zeros((n_items, 8, 5), dtype=np.uint8)
+    visible = np.zeros((n_items, 8, 5), dtype=bool)
+
+    for i in range(4):
+        cells[:, :, i] = HEX_DIGITS[(groups >> (12 - 4 * i)) & 0xf]
+    n_digits = 1 + (groups > 0xf) + (groups > 0xff) + (groups > 0xfff)
+    visible[:, :, :4] = np.arange(4) >= 4 - n_digits[:, :, None]
+
+    index = np.arange(8)
+    in_run = has_run[:, None] & \
+        (index >= run_start[:, None]) & (index < run_end[:, None])
+    visible[:, :, :4] &= ~in_run[:, :, None]
+
+    # Colons separate groups outside the run, the last cell of the
+    # run gives the second colon of "::".
+    cells[:, :, 4] = COLON
+    visible[:, :, 4] = ((index < 7) & ~in_run) | \
+        (has_run[:, None] & (index == run_end[:, None] - 1))
+
+    lead = np.full((n_items, 1), COLON, dtype=np.uint8)
+    lead_visible = (has_run & (run_start == 0))[:, None]
+
+    chars = np.concatenate([lead, cells.reshape(n_items, 40)], axis=1)
+    visible = np.concatenate(
+        [lead_visible, visible.reshape(n_items, 40)], axis=1
+    )
+
+    mapped = (groups[:, :5] == 0).all(axis=1) & (groups[:, 5] == 0xffff)
+    if mapped.any():
+        ipv4 = groups[mapped, 6].astype(np.uint32) << 16 | groups[mapped, 7]
+        ipv4_chars, ipv4_visible = _ipv4_cells(ipv4)
+
+        prefix_len = len(IPV4_MAPPED_PREFIX)
+        width = prefix_len + ipv4_chars.shape[1]
+        chars[mapped, :prefix_len] = IPV4_MAPPED_PREFIX
+        chars[mapped, prefix_len:width] = ipv4_chars
+        visible[mapped, :prefix_len] = True
+        visible[mapped, prefix_len:width] = ipv4_visible
+        visible[mapped, width:] = False
+
+    return _compact(chars, visible)
+
+
+def _ipv4_cells(values):
+    # Each octet takes four cells: three digits and a trailing dot.
+    n_items = len(values)
+    octets = np.empty((n_items, 4), dtype=np.uint32)
+    for i in range(4):
+        octets[:, i] = (values >> (24 - 8 * i)) & 0xff
+
+    cells = np.empty((n_items, 4, 4), dtype=np.uint8)
+    cells[:, :, 0] = DEC_DIGITS[octets // 100]
+    cells[:, :, 1] = DEC_DIGITS[octets // 10 % 10]
+    cells[:, :, 2] = DEC_DIGITS[octets % 10]
+    cells[:, :, 3] = DOT
+
+    n_digits = 1 + (octets >= 10) + (octets >= 100)
+    visible = np.empty((n_items, 4, 4), dtype=bool)
+    visible[:, :, :3] = np.arange(3) >= 3 - n_digits[:, :, None]
+    visible[:, :, 3] = np.arange(4) < 3
+
+    return cells.reshape(n_items, 16), visible.reshape(n_items, 16)
+
+
+def _longest_zero_runs(groups):
+    n_items = len(groups)
+    best_start = np.zeros(n_items, dtype=np.int64)
+    best_len = np.zeros(n_items, dtype=np.int64)
+    current = np.zeros(n_items, dtype=np.int64)
+
+    for i in range(8):
+        current = np.where(groups[:, i] == 0, current + 1, 0)
+        # Strictly longer: the first run wins on ties.
+        longer = current > best_len
+        best_len = np.where(longer, current, best_len)
+        best_start = np.where(longer, i + 1 - current, best_start)
+
+    return best_start, best_start + best_len
+
+
+def _compact(chars, visible):
+    offsets = np.zeros(len(chars) + 1, dtype=np.int64)
+    np.cumsum(visible.sum(axis=1), out=offsets[1:])
+    return offsets, chars[visible]
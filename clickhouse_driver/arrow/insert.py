@@ -0,0 +1,405 @@
+"""
+Writing Arrow arrays as Native format columns for ``Client.insert_arrow``.
+
+Columns with a direct Arrow counterpart are written from Arrow buffers:
+fixed-width values as is, strings as varint-prefixed payloads from
+offsets and data, validity bitmaps as null maps and dictionary arrays as
+LowCardinality keys and index. Other columns are written by the generic
+columns from Python values.
+"""
+from functools import partial
+from math import log
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .. import errors
+from ..columns.lowcardinalitycolumn import LowCardinalityColumn
+from ..columns.service import get_column_by_spec, write_column
+from ..util.compat import get_localzone_name_compat
+from ..writer import write_binary_int64
+
+NUMBER_TYPES = {
+    'Int8': pa.int8(),
+    'Int16': pa.int16(),
+    'Int32': pa.int32(),
+    'Int64': pa.int64(),
+    'UInt8': pa.uint8(),
+    'UInt16': pa.uint16(),
+    'UInt32': pa.uint32(),
+    'UInt64': pa.uint64(),
+    'Float32': pa.float32(),
+    'Float64': pa.float64(),
+    'Bool': pa.uint8()
+}
+
+# Days since epoch.
+DATE_TYPES = {
+    'Date': pa.uint16(),
+    'Date32': pa.int32()
+}
+
+# Timestamp unit and number of its fractional digits.
+TIMESTAMP_UNITS = [('s', 0), ('ms', 3), ('us', 6), ('ns', 9)]
+
+KEY_DTYPES = ('<u1', '<u2', '<u4', '<u8')
+
+
+def write_arrow_column(context, column_name, column_spec, array, buf,
+                       types_check=False):
+    """
+    Writes Arrow ``array`` as ``column_spec`` column.
+    """
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+
+    writer = get_writer(context, column_spec, array.type)
+    if writer is None:
+        write_column(
+            context, column_name, column_spec, _python_items(array), buf,
+            types_check=types_check, use_numpy=False
+        )
+        return
+
+    try:
+        if column_spec.startswith('LowCardinality('):
+            # KeysSerializationVersion as LowCardinalityColumn writes it.
+            write_binary_int64(1, buf)
+        writer(array, buf)
+
+    except pa.ArrowInvalid as e:
+        raise errors.TypeMismatchError(
+            'Type mismatch in Arrow column "{}": {} can not be written '
+            'as {}. {}'.format(column_name, array.type, column_spec, e)
+        )
+
+
+def get_writer(context, spec, type_):
+    """
+    Returns ``writer(array, buf)`` writing arrays of ``type_`` as ``spec``
+    column from Arrow buffers or ``None`` if there is no such writer.
+    """
+    if spec.startswith('Nullable('):
+        writer = get_writer(context, spec[9:-1], type_)
+        return writer and partial(_write_nullable, writer)
+
+    if spec.startswith('LowCardinality('):
+        inner_spec = spec[15:-1]
+        nullable = inner_spec.startswith('Nullable(')
+        if nullable:
+            inner_spec = inner_spec[9:-1]
+
+        if pa.types.is_dictionary(type_):
+            type_ = type_.value_type
+        writer = get_writer(context, inner_spec, type_)
+        return writer and partial(_write_low_cardinality, writer, nullable)
+
+    if pa.types.is_dictionary(type_):
+        writer = get_writer(context, spec, type_.value_type)
+        return writer and partial(_write_decoded, writer)
+
+    is_number = (
+        pa.types.is_integer(type_) or pa.types.is_floating(type_) or
+        pa.types.is_boolean(type_)
+    )
+
+    if spec in NUMBER_TYPES:
+        if is_number:
+            return partial(_write_numbers, NUMBER_TYPES[spec])
+
+    elif spec in DATE_TYPES:
+        if is_number or pa.types.is_date(type_) or \
+                pa.types.is_timestamp(type_):
+            return partial(_write_dates, DATE_TYPES[spec])
+
+    elif spec.startswith('DateTime'):
+        storage_type = pa.int64() if spec.startswith('DateTime64') \
+            else pa.uint32()
+
+        if pa.types.is_integer(type_):
+            return partial(_write_numbers, storage_type)
+
+        elif pa.types.is_timestamp(type_):
+            column = get_column_by_spec(
+                spec, {'context': context}, use_numpy=False
+            )
+            timezone = column.timezone.zone if column.timezone \
+                else get_localzone_name_compat()
+            return partial(
+                _write_datetimes, storage_type,
+                getattr(column, 'scale', 0), timezone
+            )
+
+    elif spec == 'String':
+        encoding = context.client_settings.get('strings_encoding', 'utf-8')
+        is_text = pa.types.is_string(type_) or \
+            pa.types.is_large_string(type_)
+
+        # Arrow strings are UTF-8: other encodings need Python strings.
+        if is_text and encoding.lower() not in ('utf-8', 'utf8'):
+            return None
+
+        if is_text or pa.types.is_binary(type_) or \
+                pa.types.is_large_binary(type_):
+            return _write_strings
+
+    elif spec == 'UUID':
+        if pa.types.is_fixed_size_binary(type_) and type_.byte_width == 16:
+            return _write_uuids
+
+    elif spec == 'IPv4':
+        if pa.types.is_integer(type_):
+            return partial(_write_numbers, pa.uint32())
+
+    elif spec == 'IPv6':
+        if pa.types.is_fixed_size_binary(type_) and type_.byte_width == 16:
+            return partial(_write_fixed_size_binary, 16)
+
+    elif spec.startswith('FixedString('):
+        length = int(spec[12:-1])
+
+        if pa.types.is_fixed_size_binary(type_):
+            if type_.byte_width == length:
+                return partial(_write_fixed_size_binary, length)
+
+        elif pa.types.is_string(type_) or pa.types.is_binary(type_) or \
+                pa.types.is_large_string(type_) or \
+                pa.types.is_large_binary(type_):
+            return partial(_write_fixed_strings, length)
+
+    return None
+
+
+def _write_nullable(writer, array, buf):
+    nulls = array.is_null().to_numpy(zero_copy_only=False)
+    buf.write(nulls.view(np.uint8))
+    writer(array, buf)
+
+
+def _write_decoded(writer, array, buf):
+    writer(array.dictionary_decode(), buf)
+
+
+def _write_low_cardinality(writer, nullable, array, buf):
+    if not pa.types.is_dictionary(array.type):
+        array = array.dictionary_encode()
+
+    n_items = len(array)
+    # Nothing is written for empty column as LowCardinalityColumn does.
+    if not n_items:
+        return
+
+    dictionary = array.dictionary
+    indices = array.indices
+
+    # Slices and other arrays may refer to a part of the dictionary or
+    # in other order. Only used values are written in the order of
+    # their first appearance as LowCardinalityColumn writes them.
+    used = pc.unique(indices.drop_null())
+    if not np.array_equal(
+            used.to_numpy(zero_copy_only=False), np.arange(len(dictionary))):
+        dictionary = dictionary.take(used)
+        indices = pc.index_in(indices, value_set=used)
+
+    keys = indices.fill_null(0).to_numpy(zero_copy_only=False) \
+        .astype(np.uint64)
+
+    # The first element of index stands for NULL. Nulls of non-nullable
+    # columns are written as the default value the same way.
+    with_default = nullable or array.null_count > 0
+    if with_default:
+        keys += 1
+        keys[array.is_null().to_numpy(zero_copy_only=False)] = 0
+
+    index_size = len(dictionary) + with_default
+    int_type = int(log(index_size, 2) / 8)
+
+    write_binary_int64(
+        LowCardinalityColumn.serialization_type | int_type, buf
+    )
+    write_binary_int64(index_size, buf)
+    if with_default:
+        writer(pa.nulls(1, type=dictionary.type), buf)
+    writer(dictionary, buf)
+
+    write_binary_int64(n_items, buf)
+    buf.write(keys.astype(KEY_DTYPES[int_type]))
+
+
+def _write_numbers(storage_type, array, buf):
+    # Safe cast: values out of the column type range raise.
+    array = array.cast(storage_type)
+    if array.null_count:
+        array = array.fill_null(0)
+
+    values = array.to_numpy(zero_copy_only=False)
+    buf.write(np.ascontiguousarray(
+        values, dtype=values.dtype.newbyteorder('<')
+    ))
+
+
+def _write_dates(storage_type, array, buf):
+    if pa.types.is_timestamp(array.type) or pa.types.is_date64(array.type):
+        array = array.cast(pa.date32(), safe=False)
+    if pa.types.is_date32(array.type):
+        array = array.cast(pa.int32())
+
+    _write_numbers(storage_type, array, buf)
+
+
+def _write_datetimes(storage_type, scale, timezone, array, buf):
+    # Offset-naive timestamps are in column or local timezone as
+    # datetime objects written by DateTimeColumn.
+    if array.type.tz is None and timezone != 'UTC':
+        array = _localize(array, timezone)
+
+    unit, digits = next(x for x in TIMESTAMP_UNITS if x[1] >= scale)
+    values = array.cast(pa.timestamp(unit, tz='UTC'), safe=False) \
+        .cast(pa.int64()).fill_null(0).to_numpy(zero_copy_only=False)
+    if digits > scale:
+        values = values // 10 ** (digits - scale)
+
+    _write_numbers(storage_type, pa.array(values), buf)
+
+
+def _localize(array, timezone):
+    """
+    Offset-naive timestamps in ``timezone`` as ``pytz`` localizes them
+    with ``is_dst=False``: ambiguous times are taken in standard time,
+    nonexistent ones with the offset in effect before the gap.
+    """
+    localized = pc.assume_timezone(
+        array, timezone, ambiguous='latest', nonexistent='earliest'
+    )
+    gap = pc.not_equal(localized, pc.assume_timezone(
+        array, timezone, ambiguous='latest', nonexistent='latest'
+    ))
+    if not pc.any(gap).as_py():
+        return localized
+
+    # Nonexistent times are localized 6 hours earlier and moved back
+    # the same way pytz does.
+    shift = 6 * 3600 * 10 ** dict(TIMESTAMP_UNITS)[array.type.unit]
+    earlier = pc.assume_timezone(
+        pc.subtract(array.cast(pa.int64()), shift).cast(array.type),
+        timezone, ambiguous='latest', nonexistent='earliest'
+    )
+    shifted = pc.add(earlier.cast(pa.int64()), shift).cast(localized.type)
+    return pc.if_else(gap, shifted, localized)
+
+
+def _binary_buffers(array):
+    """
+    Returns int64 offsets and data of string or binary ``array`` with
+    empty strings for nulls.
+    """
+    if pa.types.is_string(array.type):
+        array = array.cast(pa.binary())
+    elif pa.types.is_large_string(array.type):
+        array = array.cast(pa.large_binary())
+
+    if array.null_count:
+        array = array.fill_null(b'')
+
+    _, offsets, data = array.buffers()
+    offset_dtype = np.int64 if pa.types.is_large_binary(array.type) \
+        else np.int32
+    offsets = np.frombuffer(offsets, dtype=offset_dtype)[
+        array.offset:array.offset + len(array) + 1
+    ].astype(np.int64)
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None \
+        else np.empty(0, dtype=np.uint8)
+
+    return offsets, data
+
+
+def _write_strings(array, buf):
+    buf.write_strings_from_offsets(*_binary_buffers(array))
+
+
+def _write_fixed_size_binary(length, array, buf):
+    n_items = len(array)
+    data = np.frombuffer(array.buffers()[1], dtype=np.uint8)[
+        array.offset * length:(array.offset + n_items) * length
+    ]
+
+    if array.null_count:
+        data = data.reshape(n_items, length).copy()
+        data[array.is_null().to_numpy(zero_copy_only=False)] = 0
+
+    buf.write(data)
+
+
+def _write_uuids(array, buf):
+    # RFC 4122 byte order back to two little-endian uint64 halves as
+    # ArrowUUIDColumn reads them.
+    n_items = len(array)
+    halves = np.frombuffer(array.buffers()[1], dtype='>u8')[
+        array.offset * 2:(array.offset + n_items) * 2
+    ].astype('<u8')
+
+    if array.null_count:
+        halves.reshape(n_items, 2)[
+            array.is_null().to_numpy(zero_copy_only=False)
+        ] = 0
+
+    buf.write(halves)
+
+
+def _write_fixed_strings(length, array, buf):
+    offsets, data = _binary_buffers(array)
+    lengths = np.diff(offsets)
+    if len(lengths) and lengths.max() > length:
+        raise errors.TooLargeStringSize()
+
+    # Strings are padded with zero bytes.
+    rv = np.zeros((len(lengths), length), dtype=np.uint8)
+    rv[np.arange(length) < lengths[:, None]] = data[offsets[0]:offsets[-1]]
+    buf.write(rv)
+
+
+def _python_items(array):
+    """
+    Python values for generic columns: structs become tuples and maps
+    become dicts.
+    """
+    items = array.to_pylist()
+    if not _has_nested_values(array.type):
+        return items
+
+    return [_python_value(x, array.type) for x in items]
+
+
+def _has_nested_values(type_):
+    if pa.types.is_struct(type_) or pa.types.is_map(type_):
+        return True
+
+    if pa.types.is_list(type_) or pa.types.is_large_list(type_) or \
+            pa.types.is_fixed_size_list(type_):
+        return _has_nested_values(type_.value_type)
+
+    return False
+
+
+def _python_value(value, type_):
+    if value is None:
+        return None
+
+    if pa.types.is_struct(type_):
+        return tuple(
+            _python_value(value[field.name], field.type) for field in type_
+        )
+
+    if pa.types.is_map(type_):
+        return {
+            _python_value(k, type_.key_type):
+                _python_value(v, type_.item_type)
+            for k, v in value
+        }
+
+    if pa.types.is_list(type_) or pa.types.is_large_list(type_) or \
+            pa.types.is_fixed_size_list(type_):
+        return [_python_value(x, type_.value_type) for x in value]
+
+    return value
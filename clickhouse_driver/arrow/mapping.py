@@ -1,4 +1,6 @@
 import json
+from ipaddress import IPv6Address
+from operator import attrgetter
 
 import pyarrow as pa
 
@@ -23,8 +25,22 @@ SIMPLE_TYPES = {
     'Nothing': pa.null()
 }
 
-# Types represented by rich Python objects are stringified.
-STRINGIFIED_TYPES = {'UUID', 'IPv4', 'IPv6'}
+# Types represented by rich Python objects are passed in their binary
+# form. Text form is produced for a declared string type.
+BINARY_TYPES = {
+    'UUID': (pa.binary(16), attrgetter('bytes')),
+    'IPv4': (pa.uint32(), int),
+    'IPv6': (pa.binary(16), attrgetter('packed'))
+}
+
+# Byte width and signedness. Mapped to fixed_size_binary with
+# large_ints_as_words, inferred from Python ints otherwise.
+LARGE_INT_TYPES = {
+    'Int128': (16, True),
+    'UInt128': (16, False),
+    'Int256': (32, True),
+    'UInt256': (32, False)
+}
 
 DECIMAL_PRECISIONS = {
     'Decimal32': 9,
@@ -33,12 +49,93 @@ DECIMAL_PRECISIONS = {
     'Decimal256': 76
 }
 
+# Arrow unit and number of units in one interval. Calendar intervals
+# are month_day_nano intervals of months or days, others are durations.
+INTERVAL_TYPES = {
+    'IntervalNanosecond': ('ns', 1),
+    'IntervalMicrosecond': ('us', 1),
+    'IntervalMillisecond': ('ms', 1),
+    'IntervalSecond': ('s', 1),
+    'IntervalMinute': ('s', 60),
+    'IntervalHour': ('s', 3600),
+    'IntervalDay': ('days', 1),
+    'IntervalWeek': ('days', 7),
+    'IntervalMonth': ('months', 1),
+    'IntervalQuarter': ('months', 3),
+    'IntervalYear': ('months', 12)
+}
+
+# Name of the dense union child holding NULL rows of Variant/Dynamic.
+UNION_NULL_NAME = 'NULL'
+
 
 #: Types with no default Arrow representation: an explicit
 #: ``arrow_types`` entry is required for such columns.
 UNSUPPORTED = object()
 
 
+def tuple_field_names(names):
+    """
+    Struct field names for Tuple elements. Unnamed elements are
+    numbered from one like in ClickHouse ``tupleElement``.
+    """
+    return [name or str(i) for i, name in enumerate(names, 1)]
+
+
+def large_int_as_words(spec):
+    """
+    Converter of Python ints into little-endian bytes of ``spec``
+    width: the wire form of 128/256-bit integers.
+    """
+    size, signed = LARGE_INT_TYPES[spec]
+
+    def converter(value):
+        return value.to_bytes(size, 'little', signed=signed)
+
+    return converter
+
+
+def datetime64_unit(precision):
+    """Timestamp unit holding DateTime64 values of ``precision``."""
+    if precision == 0:
+        return 's'
+    elif precision <= 3:
+        return 'ms'
+    elif precision <= 6:
+        return 'us'
+    return 'ns'
+
+
+def interval_type(spec):
+    unit = INTERVAL_TYPES[spec][0]
+    if unit in ('days', 'months'):
+        return pa.month_day_nano_interval()
+    return pa.duration(unit)
+
+
+def interval_converter(spec):
+    """Converter of interval lengths into values of ``interval_type``."""
+    unit, factor = INTERVAL_TYPES[spec]
+
+    if unit == 'months':
+        return lambda value: (value * factor, 0, 0)
+    elif unit == 'days':
+        return lambda value: (0, value * factor, 0)
+    elif factor != 1:
+        return lambda value: value * factor
+    return None
+
+
+def address_as_text(value):
+    """
+    UUID/IP value to text. IPv4-mapped IPv6 addresses are formatted
+    as ``::ffff:a.b.c.d`` regardless of Python version.
+    """
+    if isinstance(value, IPv6Address) and value.ipv4_mapped is not None:
+        return '::ffff:{}'.format(value.ipv4_mapped)
+    return str(value)
+
+
 def json_as_text(column_name):
     """
     JSON column value to JSON text. Requires
@@ -68,7 +165,18 @@ def json_as_object(value):
     return value
 
 
-def get_type_and_converter(spec, strings_as_bytes=False):
+def union_type(names, types):
+    """
+    Dense union over Variant/Dynamic variants in discriminator order
+    with a trailing null child for NULL rows.
+    """
+    fields = [pa.field(name, type_) for name, type_ in zip(names, types)]
+    fields.append(pa.field(UNION_NULL_NAME, pa.null()))
+    return pa.dense_union(fields)
+
+
+def get_type_and_converter(spec, strings_as_bytes=False,
+                           large_ints_as_words=False):
     """
     Maps ClickHouse type spec into pair (Arrow type, converter).
 
@@ -80,44 +188,59 @@ def get_type_and_converter(spec, strings_as_bytes=False):
     """
     spec = spec.strip()
 
+    def get_inner(inner_spec):
+        return get_type_and_converter(
+            inner_spec, strings_as_bytes, large_ints_as_words
+        )
+
     if spec in SIMPLE_TYPES:
         return SIMPLE_TYPES[spec], None
 
-    if spec in STRINGIFIED_TYPES:
-        return pa.string(), str
+    if spec in BINARY_TYPES:
+        return BINARY_TYPES[spec]
+
+    if spec in LARGE_INT_TYPES:
+        if large_ints_as_words:
+            return pa.binary(LARGE_INT_TYPES[spec][0]), \
+                large_int_as_words(spec)
+        return None, None
+
+    if spec in INTERVAL_TYPES:
+        return interval_type(spec), interval_converter(spec)
 
     if spec == 'JSON' or spec.startswith('JSON('):
         # No default representation: dynamic paths make every implicit
         # choice either lossy or unstable. Requires arrow_types.
         return UNSUPPORTED, None
 
-    if spec == 'String' or spec.startswith('FixedString'):
+    if spec == 'String':
         if strings_as_bytes:
             return pa.binary(), None
         return pa.string(), None
 
+    if spec.startswith('FixedString'):
+        if strings_as_bytes:
+            return pa.binary(int(get_inner_spec('FixedString', spec))), None
+        return pa.string(), None
+
     if spec.startswith('Enum'):
         return pa.string(), None
 
     if spec.startswith('Nullable('):
-        return get_type_and_converter(
-            get_inner_spec('Nullable', spec), strings_as_bytes
-        )
+        return get_inner(get_inner_spec('Nullable', spec))
 
     if spec.startswith('LowCardinality('):
-        return get_type_and_converter(
-            get_inner_spec('LowCardinality', spec), strings_as_bytes
-        )
+        return get_inner(get_inner_spec('LowCardinality', spec))
 
     if spec.startswith('SimpleAggregateFunction('):
         inner_spec = get_inner_columns(
             get_inner_spec('SimpleAggregateFunction', spec)
         )[-1]
-        return get_type_and_converter(inner_spec, strings_as_bytes)
+        return get_inner(inner_spec)
 
     if spec.startswith('Array('):
-        inner_type, inner_converter = get_type_and_converter(
-            get_inner_spec('Array', spec), strings_as_bytes
+        inner_type, inner_converter = get_inner(
+            get_inner_spec('Array', spec)
         )
         if inner_type is None or inner_type is UNSUPPORTED:
             return inner_type, None
@@ -134,12 +257,8 @@ def get_type_and_converter(spec, strings_as_bytes=False):
 
     if spec.startswith('Map('):
         key_spec, value_spec = get_inner_columns(get_inner_spec('Map', spec))
-        key_type, key_converter = get_type_and_converter(
-            key_spec, strings_as_bytes
-        )
-        value_type, value_converter = get_type_and_converter(
-            value_spec, strings_as_bytes
-        )
+        key_type, key_converter = get_inner(key_spec)
+        value_type, value_converter = get_inner(value_spec)
         for t in (key_type, value_type):
             if t is None or t is UNSUPPORTED:
                 return t, None
@@ -163,21 +282,55 @@ def get_type_and_converter(spec, strings_as_bytes=False):
         # same treatment as JSON.
         return UNSUPPORTED, None
 
-    if spec.startswith('Tuple(') or spec.startswith('Nested('):
-        # No explicit mapping (inference applies), but unsupported
-        # element types must not leak into inference.
-        prefix = 'Tuple' if spec.startswith('Tuple(') else 'Nested'
-        inner_columns = get_inner_columns_with_types(
-            get_inner_spec(prefix, spec)
+    if spec.startswith('Tuple('):
+        names, inner_specs = zip(*get_inner_columns_with_types(
+            get_inner_spec('Tuple', spec)
+        ))
+        inner = [get_inner(x) for x in inner_specs]
+        inner_types = [t for t, _ in inner]
+        if UNSUPPORTED in inner_types:
+            return UNSUPPORTED, None
+        if None in inner_types:
+            return None, None
+
+        field_names = tuple_field_names(names)
+        converters = [c for _, c in inner]
+        if not any(converters):
+            converter = None
+        else:
+            def converter(value, _converters=converters, _names=names):
+                # Named tuples are dicts with namedtuple_as_json.
+                if isinstance(value, dict):
+                    value = [value.get(name) for name in _names]
+                return tuple(
+                    x if x is None or c is None else c(x)
+                    for x, c in zip(value, _converters)
+                )
+
+        return pa.struct(list(zip(field_names, inner_types))), converter
+
+    if spec.startswith('Variant('):
+        variant_specs = sorted(
+            x.strip()
+            for x in get_inner_columns(get_inner_spec('Variant', spec))
         )
-        for _, inner_spec in inner_columns:
-            inner_type, _ = get_type_and_converter(
-                inner_spec, strings_as_bytes
-            )
-            if inner_type is UNSUPPORTED:
-                return UNSUPPORTED, None
+        inner_types = [get_inner(x)[0] for x in variant_specs]
+        if UNSUPPORTED in inner_types:
+            return UNSUPPORTED, None
+        if None in inner_types:
+            return None, None
+
+        return union_type(variant_specs, inner_types), None
+
+    if spec == 'Dynamic' or spec.startswith('Dynamic('):
+        # Variants are known from the first block only.
         return None, None
 
+    if spec.startswith('Nested('):
+        return get_inner(
+            'Array(Tuple({}))'.format(get_inner_spec('Nested', spec))
+        )
+
     if spec.startswith('Decimal'):
         if spec.startswith('Decimal('):
             precision, scale = [
@@ -196,19 +349,8 @@ def get_type_and_converter(spec, strings_as_bytes=False):
 
     if spec.startswith('DateTime64('):
         params = get_inner_columns(get_inner_spec('DateTime64', spec))
-        precision = int(params[0])
         tz = params[1].strip("'") if len(params) > 1 else None
-
-        if precision == 0:
-            unit = 's'
-        elif precision <= 3:
-            unit = 'ms'
-        elif precision <= 6:
-            unit = 'us'
-        else:
-            unit = 'ns'
-
-        return pa.timestamp(unit, tz=tz), None
+        return pa.timestamp(datetime64_unit(int(params[0])), tz=tz), None
 
     if spec.startswith('DateTime'):
         tz = None
@@ -1,3 +1,4 @@
+from .columns.service import write_column
 from .columns.util import get_inner_spec, get_inner_columns_with_types
 from .reader import read_varint, read_binary_uint8, read_binary_int32
 from .varint import write_varint
@@ -64,6 +65,10 @@ class BaseBlock(object):
     def transposed(self):
         return list(zip(*self.data))
 
+    def write_column(self, context, column_name, column_type, items, buf):
+        write_column(context, column_name, column_type, items, buf,
+                     types_check=self.types_check)
+
 
 class ColumnOrientedBlock(BaseBlock):
     def normalize(self, data):
@@ -1,15 +1,24 @@
 from cpython cimport PyMem_Malloc, PyMem_Free, PyBytes_AsString, \
-    PyBytes_Check, PyBytes_FromStringAndSize, PyBytes_AS_STRING, \
-    PyBytes_GET_SIZE
+    PyBytes_Check, PyBytes_AS_STRING, PyBytes_GET_SIZE, \
+    PyBytes_FromStringAndSize
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, \
+    PyBUF_C_CONTIGUOUS
+from cpython.unicode cimport PyUnicode_AsUTF8String, PyUnicode_Check
+from libc.stdint cimport int64_t
 from libc.string cimport memcpy, memset
 
 from . import errors
-from .varint import make_varint
+
+
+cdef extern from "Python.h":
+    const char* PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t *size) \
+        except NULL
+    bint PyUnicode_IS_COMPACT_ASCII(object unicode)
 
 
 cdef class BufferedWriter(object):
     cdef char* buffer
-    cdef unsigned long long position, buffer_size
+    cdef unsigned long long position, buffer_size, bytes_written
 
     def __init__(self, unsigned long long bufsize):
         self.buffer = <char *> PyMem_Malloc(bufsize)
@@ -18,6 +27,7 @@ cdef class BufferedWriter(object):
 
         self.position = 0
         self.buffer_size = bufsize
+        self.bytes_written = 0
 
         super(BufferedWriter, self).__init__()
 
@@ -27,93 +37,177 @@ cdef class BufferedWriter(object):
     cpdef write_into_stream(self):
         raise NotImplementedError
 
+    cpdef write_data_into_stream(self, data):
+        """
+        Writes contiguous ``data`` into the stream past the buffer.
+        """
+        raise NotImplementedError
+
     cpdef write(self, data):
+        """
+        Writes bytes or any C-contiguous object supporting buffer
+        protocol: bytearray, memoryview, numpy array, Arrow buffer.
+        Chunks not smaller than the buffer are written into the stream
+        as is without copying them into the buffer.
+        """
+        cdef Py_buffer view
+
+        if PyBytes_Check(data):
+            self._write(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data), data)
+            return
+
+        PyObject_GetBuffer(data, &view, PyBUF_C_CONTIGUOUS)
+        try:
+            self._write(<char *> view.buf, view.len, data)
+        finally:
+            PyBuffer_Release(&view)
+
+    def tell(self):
+        """
+        Returns number of bytes written since the writer creation.
+        """
+        return self.bytes_written
+
+    cdef _write(self, char* c_data, unsigned long long data_len, data):
         cdef unsigned long long size, written = 0
-        cdef unsigned long long data_len = PyBytes_GET_SIZE(data)
-        cdef char* c_data = PyBytes_AS_STRING(data)
 
-        while written < data_len:
-            size = min(data_len - written, self.buffer_size - self.position)
-            memcpy(&self.buffer[self.position], &c_data[written], size)
+        self.bytes_written += data_len
+
+        if data is not None and data_len >= self.buffer_size:
+            if self.position:
+                self.write_into_stream()
+            self.write_data_into_stream(data)
+            return
 
+        while written < data_len:
             if self.position == self.buffer_size:
                 self.write_into_stream()
 
+            size = min(data_len - written, self.buffer_size - self.position)
+            memcpy(&self.buffer[self.position], &c_data[written], size)
+
             self.position += size
             written += size
 
+    cdef _write_fixed(self, char* c_value, Py_ssize_t value_len,
+                      Py_ssize_t length):
+        # Value padded with zero bytes up to length goes straight into
+        # the buffer.
+        cdef unsigned long long size, padding = length - value_len
+
+        if <unsigned long long> length > self.buffer_size:
+            self._write(c_value, value_len, None)
+            while padding:
+                if self.position == self.buffer_size:
+                    self.write_into_stream()
+
+                size = min(padding, self.buffer_size - self.position)
+                memset(&self.buffer[self.position], 0, size)
+                self.position += size
+                self.bytes_written += size
+                padding -= size
+            return
+
+        if self.position + length > self.buffer_size:
+            self.write_into_stream()
+
+        memcpy(&self.buffer[self.position], c_value, value_len)
+        memset(&self.buffer[self.position + value_len], 0, padding)
+        self.position += length
+        self.bytes_written += length
+
     def flush(self):
         self.write_into_stream()
 
+    cdef _write_varint(self, unsigned long long number):
+        cdef char varint[10]
+        cdef Py_ssize_t size = 0
+
+        while number >= 0x80:
+            varint[size] = <char> ((number & 0x7f) | 0x80)
+            number >>= 7
+            size += 1
+
+        varint[size] = <char> number
+        self._write(varint, size + 1, None)
+
     def write_strings(self, items, encoding=None):
         cdef int do_encode = encoding is not None
+        # ASCII str is its own UTF-8 representation: it's taken without
+        # encoding it into intermediate bytes. Other strings are encoded:
+        # PyUnicode_AsUTF8AndSize would keep UTF-8 copy in each of them.
+        cdef int is_utf8 = do_encode and \
+            encoding.lower().replace('-', '').replace('_', '') == 'utf8'
+        cdef const char* c_value
+        cdef Py_ssize_t value_len
 
         for value in items:
-            if not PyBytes_Check(value):
-                if do_encode:
-                    value = value.encode(encoding)
+            if PyBytes_Check(value):
+                c_value = PyBytes_AS_STRING(value)
+                value_len = PyBytes_GET_SIZE(value)
+
+            elif is_utf8 and PyUnicode_Check(value):
+                if PyUnicode_IS_COMPACT_ASCII(value):
+                    c_value = PyUnicode_AsUTF8AndSize(value, &value_len)
+                    # Not passed on: str doesn't support buffer protocol.
+                    value = None
                 else:
-                    raise ValueError('bytes object expected')
+                    value = PyUnicode_AsUTF8String(value)
+                    c_value = PyBytes_AS_STRING(value)
+                    value_len = PyBytes_GET_SIZE(value)
 
-            self.write(make_varint(PyBytes_GET_SIZE(value)))
-            self.write(value)
+            elif do_encode:
+                value = value.encode(encoding)
+                c_value = PyBytes_AS_STRING(value)
+                value_len = PyBytes_GET_SIZE(value)
+
+            else:
+                raise ValueError('bytes object expected')
+
+            self._write_varint(value_len)
+            self._write(<char *> c_value, value_len, value)
+
+    def write_strings_from_offsets(self, offsets, data):
+        """
+        Writes strings given by Arrow-like buffers: ``n + 1`` int64
+        ``offsets`` into ``data`` bytes of ``n`` strings.
+        """
+        cdef const int64_t[::1] c_offsets = offsets
+        cdef const unsigned char[::1] c_data = data
+        cdef const unsigned char* data_ptr = NULL
+        cdef Py_ssize_t i, n_items = c_offsets.shape[0] - 1
+        cdef int64_t start, end, data_len = c_data.shape[0]
+
+        if data_len:
+            data_ptr = &c_data[0]
+
+        for i in range(n_items):
+            start = c_offsets[i]
+            end = c_offsets[i + 1]
+            if start < 0 or end < start or end > data_len:
+                raise ValueError('Invalid string offsets')
+
+            self._write_varint(end - start)
+            self._write(<char *> &data_ptr[start], end - start, None)
 
     def write_fixed_strings_as_bytes(self, items, Py_ssize_t length):
-        cdef Py_ssize_t buf_pos = 0
-        cdef Py_ssize_t items_buf_size = length * len(items)
-
-        cdef char* c_value
-        cdef char* items_buf = <char *>PyMem_Malloc(items_buf_size)
-        if not items_buf:
-            raise MemoryError()
-
-        memset(items_buf, 0, items_buf_size)
-
+        # Lengths are checked first: nothing is written for a column
+        # with too large strings.
         for value in items:
-            value_len = len(value)
-            if length < value_len:
+            if length < len(value):
                 raise errors.TooLargeStringSize()
 
-            c_value = PyBytes_AsString(value)
-
-            memcpy(&items_buf[buf_pos], c_value, value_len)
-            buf_pos += length
-        try:
-            self.write(PyBytes_FromStringAndSize(items_buf, items_buf_size))
-        finally:
-            PyMem_Free(items_buf)
-
-    def write_fixed_strings(self, items, Py_ssize_t length, encoding=None):
-        if encoding is None:
-            self.write_fixed_strings_as_bytes(items, length)
-            return
-
-        cdef Py_ssize_t buf_pos = 0
-        cdef Py_ssize_t items_buf_size = length * len(items)
-
-        cdef char* c_value
-        cdef char* items_buf = <char *>PyMem_Malloc(items_buf_size)
-        if not items_buf:
-            raise MemoryError()
-
-        memset(items_buf, 0, items_buf_size)
-
         for value in items:
-            if not PyBytes_Check(value):
-                value = value.encode(encoding)
-
-            value_len = len(value)
-            if length < value_len:
-                raise errors.TooLargeStringSize()
+            self._write_fixed(PyBytes_AsString(value), len(value), length)
 
-            c_value = PyBytes_AsString(value)
+    def write_fixed_strings(self, items, Py_ssize_t length, encoding=None):
+        if encoding is not None:
+            items = [
+                value if PyBytes_Check(value) else value.encode(encoding)
+                for value in items
+            ]
 
-            memcpy(&items_buf[buf_pos], c_value, value_len)
-            buf_pos += length
-        try:
-            self.write(PyBytes_FromStringAndSize(items_buf, items_buf_size))
-        finally:
-            PyMem_Free(items_buf)
+        self.write_fixed_strings_as_bytes(items, length)
 
 
 cdef class BufferedSocketWriter(BufferedWriter):
@@ -129,6 +223,30 @@ cdef class BufferedSocketWriter(BufferedWriter):
         )
         self.position = 0
 
+    cpdef write_data_into_stream(self, data):
+        self.sock.sendall(data)
+
+
+cdef class BufferedMemoryWriter(BufferedWriter):
+    """
+    Writes into in-memory file-like object, e.g. ``BytesIO``: blocks
+    serialized before they are sent.
+    """
+    cdef object fout
+
+    def __init__(self, fout, bufsize):
+        self.fout = fout
+        super(BufferedMemoryWriter, self).__init__(bufsize)
+
+    cpdef write_into_stream(self):
+        self.fout.write(
+            PyBytes_FromStringAndSize(self.buffer, self.position)
+        )
+        self.position = 0
+
+    cpdef write_data_into_stream(self, data):
+        self.fout.write(data)
+
 
 cdef class CompressedBufferedWriter(BufferedWriter):
     cdef object compressor
@@ -143,5 +261,8 @@ cdef class CompressedBufferedWriter(BufferedWriter):
         )
         self.position = 0
 
+    cpdef write_data_into_stream(self, data):
+        self.compressor.write(data)
+
     def flush(self):
         self.write_into_stream()
@@ -8,13 +8,17 @@ from urllib.parse import urlparse
 from . import errors, defines
 from .block import ColumnOrientedBlock, RowOrientedBlock
 from .connection import Connection
+from .insertpipeline import InsertPipeline
 from .log import log_block
 from .protocol import ServerPacketTypes
 from .result import (
     IterQueryResult, ProgressQueryResult, QueryResult, QueryInfo
 )
 from .util.escape import escape_params
-from .util.helpers import column_chunks, chunks, parse_url
+from .util.helpers import (
+    BlockSizer, column_chunks, chunks, parse_url, sized_chunks,
+    sized_column_chunks
+)
 
 
 class Client(object):
@@ -67,6 +71,31 @@ class Client(object):
                            Default: False. Means that parameters are rendered
                            on driver's side.
                            New in version *0.2.7*.
+        * ``large_ints_as_words`` -- Return ``Int128``, ``UInt128``,
+                           ``Int256`` and ``UInt256`` values as raw
+                           little-endian 64-bit words instead of Python ints:
+                           structured arrays with NumPy, ``fixed_size_binary``
+                           in Arrow results. Default: False.
+                           New in version *0.2.12*.
+        * ``arrow_convert_threads`` -- Number of threads converting
+                           columns to Arrow arrays in ``query_arrow`` and
+                           ``query_arrow_stream``. Conversion of a block
+                           overlaps with reading the next one. Default: 0
+                           (convert on the calling thread).
+                           New in version *0.2.12*.
+        * ``insert_block_bytes`` -- Target size of serialized ``INSERT``
+                           blocks in bytes. Number of rows of a block is
+                           estimated from the size of the previous block or
+                           column dtypes of NumPy and Arrow data, at most
+                           ``insert_block_size``. Default: 0 (blocks of
+                           ``insert_block_size`` rows).
+                           New in version *0.2.12*.
+        * ``insert_pipeline_depth`` -- Number of serialized blocks queued
+                           for ``INSERT``. Blocks are compressed and sent by
+                           a background thread while the next ones are
+                           serialized. Default: 0 (serialize and send blocks
+                           one by one on the calling thread).
+                           New in version *0.2.12*.
     """
 
     available_client_settings = (
@@ -79,7 +108,11 @@ class Client(object):
         'quota_key',
         'input_format_null_as_default',
         'namedtuple_as_json',
-        'server_side_params'
+        'server_side_params',
+        'large_ints_as_words',
+        'arrow_convert_threads',
+        'insert_block_bytes',
+        'insert_pipeline_depth'
     )
 
     def __init__(self, *args, **kwargs):
@@ -115,7 +148,19 @@ class Client(object):
             ),
             'server_side_params': self.settings.pop(
                 'server_side_params', False
-            )
+            ),
+            'large_ints_as_words': self.settings.pop(
+                'large_ints_as_words', False
+            ),
+            'arrow_convert_threads': int(self.settings.pop(
+                'arrow_convert_threads', 0
+            )),
+            'insert_block_bytes': int(self.settings.pop(
+                'insert_block_bytes', 0
+            )),
+            'insert_pipeline_depth': int(self.settings.pop(
+                'insert_pipeline_depth', 0
+            ))
         }
 
         if self.client_settings['use_numpy']:
@@ -314,7 +359,8 @@ class Client(object):
         to the end. RecordBatchReader.close() doesn't reach the
         underlying generator, so cleanup happens on the next query:
         drain the stream through END_OF_STREAM after Cancel, or reset
-        the connection.
+        the connection. Cancel is already sent if the reader was
+        released.
         """
         state = self._pending_arrow_stream
         self._pending_arrow_stream = None
@@ -329,7 +375,8 @@ class Client(object):
             return
 
         try:
-            connection.send_cancel()
+            if not state.released:
+                connection.send_cancel()
             terminal_packets = (
                 ServerPacketTypes.END_OF_STREAM, ServerPacketTypes.EXCEPTION
             )
@@ -588,9 +635,65 @@ class Client(object):
             self.last_query.store_elapsed(time() - start_time)
             return rv
 
+    def insert_arrow(
+            self, query, data, external_tables=None, query_id=None,
+            settings=None):
+        """
+        *New in version 0.2.12.*
+
+        Inserts PyArrow data with specified query. Columns are written
+        from Arrow buffers: no Python objects are created for numbers,
+        strings, dates and dictionary-encoded columns. Columns of other
+        types are inserted from Python values.
+
+        :param query: query that will be send to server.
+        :param data: pyarrow Table, RecordBatch, RecordBatchReader or
+                     object exporting Arrow C stream
+                     (``__arrow_c_stream__``). Record batches are sent
+                     as they are read in blocks of at most
+                     ``insert_block_size`` rows.
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ClickHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :return: number of inserted rows.
+        """
+
+        try:
+            import numpy  # noqa: F401
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise RuntimeError('Extras for PyArrow must be installed')
+
+        from .arrow.block import iter_arrow_blocks
+
+        start_time = time()
+
+        with self.disconnect_on_error(query, settings):
+            self.connection.send_query(query, query_id=query_id)
+            self.connection.send_external_tables(external_tables)
+
+            sample_block = self.receive_sample_block()
+            rv = None
+            if sample_block:
+                client_settings = self.connection.context.client_settings
+                sizer = self.get_block_sizer()
+                blocks = iter_arrow_blocks(
+                    sample_block.columns_with_types, data,
+                    client_settings['insert_block_size'], sizer=sizer
+                )
+                rv = self.send_blocks(blocks, sizer=sizer)
+                self.receive_end_of_insert_query()
+
+            self.last_query.store_elapsed(time() - start_time)
+            return rv
+
     def query_arrow(
             self, query, params=None, external_tables=None, query_id=None,
-            settings=None, field_metadata=True, arrow_types=None):
+            settings=None, field_metadata=True, arrow_types=None,
+            large_strings=False):
         """
         *New in version 0.2.11.*
 
@@ -613,18 +716,26 @@ class Client(object):
                             Required for columns without a default
                             Arrow representation (``JSON``).
                             Defaults to ``None``.
+        :param large_strings: read string and binary columns as
+                              ``large_string``/``large_binary``. Blocks
+                              with more than 2GiB of string data in a
+                              column are split into several batches
+                              otherwise. Defaults to ``False``.
         :return: pyarrow.Table.
         """
 
         return self.query_arrow_stream(
             query, params=params, external_tables=external_tables,
             query_id=query_id, settings=settings,
-            field_metadata=field_metadata, arrow_types=arrow_types
+            field_metadata=field_metadata, arrow_types=arrow_types,
+            large_strings=large_strings
         ).read_all()
 
     def query_arrow_stream(
             self, query, params=None, external_tables=None, query_id=None,
-            settings=None, field_metadata=True, arrow_types=None):
+            settings=None, field_metadata=True, arrow_types=None,
+            target_batch_rows=None, target_batch_bytes=None,
+            split_batches=False, large_strings=False):
         """
         *New in version 0.2.11.*
 
@@ -635,7 +746,12 @@ class Client(object):
         setting.
 
         The reader doesn't have to be consumed to the end: the streamed
-        query is cancelled when the next query on this client starts.
+        query is cancelled when the reader is released or the next query
+        on this client starts.
+
+        With PyArrow 14+ the reader implements the Arrow PyCapsule
+        interface (``__arrow_c_stream__``), so Polars, DuckDB and other
+        consumers can read the stream directly.
 
         :param query: query that will be send to server.
         :param params: substitution parameters.
@@ -654,6 +770,19 @@ class Client(object):
                             Required for columns without a default
                             Arrow representation (``JSON``).
                             Defaults to ``None``.
+        :param target_batch_rows: concatenate consecutive blocks into
+                                  batches of at least this many rows.
+                                  Defaults to ``None`` (batch per block).
+        :param target_batch_bytes: concatenate consecutive blocks into
+                                   batches of at least this many bytes.
+                                   Defaults to ``None`` (batch per block).
+        :param split_batches: also slice blocks exceeding the targets
+                              above. Defaults to ``False``.
+        :param large_strings: read string and binary columns as
+                              ``large_string``/``large_binary``. Blocks
+                              with more than 2GiB of string data in a
+                              column are split into several batches
+                              otherwise. Defaults to ``False``.
         :return: pyarrow.RecordBatchReader.
         """
 
@@ -662,6 +791,11 @@ class Client(object):
         except ImportError:
             raise RuntimeError('Extras for PyArrow must be installed')
 
+        for name, value in [('target_batch_rows', target_batch_rows),
+                            ('target_batch_bytes', target_batch_bytes)]:
+            if value is not None and value <= 0:
+                raise ValueError('{} must be positive'.format(name))
+
         from .arrow.convert import ArrowStreamState, \
             create_record_batch_reader
 
@@ -688,9 +822,89 @@ class Client(object):
             return create_record_batch_reader(
                 self.packet_generator(), self.connection.context,
                 state=state, field_metadata=field_metadata,
-                arrow_types=arrow_types
+                arrow_types=arrow_types, target_batch_rows=target_batch_rows,
+                target_batch_bytes=target_batch_bytes,
+                split_batches=split_batches, large_strings=large_strings
+            )
+
+    def query_to_file(
+            self, query, path, format='parquet', params=None,
+            external_tables=None, query_id=None, settings=None,
+            field_metadata=True, arrow_types=None, large_strings=False,
+            row_group_size=None, compression=None, compression_level=None):
+        """
+        *New in version 0.2.12.*
+
+        Writes result of specified SELECT query to Parquet or Arrow IPC
+        (Feather) file. Record batches are written as they arrive, so
+        results of any size are exported with bounded memory usage.
+
+        :param query: query that will be send to server.
+        :param path: path or writable file object.
+        :param format: ``'parquet'``, ``'arrow'`` (Arrow IPC file) or
+                       ``'feather'`` (Arrow IPC file with LZ4
+                       compression by default). Defaults to
+                       ``'parquet'``.
+        :param params: substitution parameters.
+                       Defaults to ``None`` (no parameters  or data).
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ClickHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :param field_metadata: attach original ClickHouse column types
+                               to Arrow fields as ``clickhouse_type``
+                               metadata. Defaults to ``True``.
+        :param arrow_types: dictionary mapping column names to Arrow
+                            types, overriding the default mapping.
+                            Defaults to ``None``.
+        :param large_strings: read string and binary columns as
+                              ``large_string``/``large_binary``.
+                              Defaults to ``False``.
+        :param row_group_size: rows per Parquet row group or Arrow
+                               record batch. Blocks are concatenated
+                               and sliced to this size.
+                               Defaults to ``None`` (one per block).
+        :param compression: compression codec name. For Parquet it can
+                            be a dictionary mapping column names to
+                            codecs. Defaults to ``None`` (PyArrow's
+                            default).
+        :param compression_level: compression level, or a dictionary
+                                  mapping column names to levels for
+                                  Parquet. Defaults to ``None``.
+        :return: number of written rows.
+        """
+
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise RuntimeError('Extras for PyArrow must be installed')
+
+        from .arrow.export import check_writer_options, write_record_batches
+
+        check_writer_options(format, compression, compression_level)
+
+        reader = self.query_arrow_stream(
+            query, params=params, external_tables=external_tables,
+            query_id=query_id, settings=settings,
+            field_metadata=field_metadata, arrow_types=arrow_types,
+            target_batch_rows=row_group_size,
+            split_batches=row_group_size is not None,
+            large_strings=large_strings
+        )
+
+        try:
+            return write_record_batches(
+                reader, path, format=format, compression=compression,
+                compression_level=compression_level
             )
 
+        except (Exception, KeyboardInterrupt):
+            # Don't leave the query running until the next one.
+            self._reset_pending_arrow_stream()
+            raise
+
     def process_ordinary_query_with_progress(
             self, query, params=None, with_column_types=False,
             external_tables=None, query_id=None,
@@ -774,17 +988,19 @@ class Client(object):
                 raise errors.UnexpectedPacketFromServerError(message)
 
     def send_data(self, sample_block, data, types_check=False, columnar=False):
-        inserted_rows = 0
-
         client_settings = self.connection.context.client_settings
         block_cls = ColumnOrientedBlock if columnar else RowOrientedBlock
 
         if client_settings['use_numpy']:
             try:
-                from .numpy.helpers import column_chunks as numpy_column_chunks
+                from .numpy.helpers import (
+                    column_chunks as numpy_column_chunks,
+                    sized_column_chunks as numpy_sized_column_chunks
+                )
 
                 if columnar:
                     slicer = numpy_column_chunks
+                    sized_slicer = numpy_sized_column_chunks
                 else:
                     raise ValueError(
                         'NumPy inserts is only allowed with columnar=True'
@@ -795,24 +1011,77 @@ class Client(object):
 
         else:
             slicer = column_chunks if columnar else chunks
+            sized_slicer = sized_column_chunks if columnar else sized_chunks
+
+        sizer = self.get_block_sizer()
+        if sizer is not None:
+            chunked = sized_slicer(data, sizer)
+        else:
+            chunked = slicer(data, client_settings['insert_block_size'])
+
+        blocks = (
+            block_cls(sample_block.columns_with_types, chunk,
+                      types_check=types_check)
+            for chunk in chunked
+        )
+        return self.send_blocks(blocks, sizer=sizer)
+
+    def get_block_sizer(self):
+        client_settings = self.connection.context.client_settings
+        block_bytes = client_settings['insert_block_bytes']
+        if not block_bytes:
+            return None
+
+        return BlockSizer(block_bytes, client_settings['insert_block_size'])
+
+    def send_blocks(self, blocks, sizer=None):
+        client_settings = self.connection.context.client_settings
+        pipeline_depth = client_settings.get('insert_pipeline_depth')
+        if pipeline_depth:
+            return self.send_blocks_pipelined(blocks, pipeline_depth, sizer)
+
+        inserted_rows = 0
 
-        for chunk in slicer(data, client_settings['insert_block_size']):
-            block = block_cls(sample_block.columns_with_types, chunk,
-                              types_check=types_check)
-            self.connection.send_data(block)
+        for block in blocks:
+            size = self.connection.send_data(block)
             inserted_rows += block.num_rows
 
+            # Size of the next block is estimated by this one.
+            if sizer is not None:
+                sizer.update(block.num_rows, size)
+
             # Starting from the specific revision there are profile events
             # sent by server in response to each inserted block
             self.receive_profile_events()
 
         # Empty block means end of data.
-        self.connection.send_data(block_cls())
+        self.connection.send_data(RowOrientedBlock())
         # If enabled by revision profile events are also sent after empty block
         self.receive_profile_events()
 
         return inserted_rows
 
+    def send_blocks_pipelined(self, blocks, depth, sizer=None):
+        pipeline = InsertPipeline(self, depth)
+        inserted_rows = 0
+
+        try:
+            for block in blocks:
+                size = pipeline.send(block)
+                inserted_rows += block.num_rows
+
+                if sizer is not None:
+                    sizer.update(block.num_rows, size)
+
+            # Empty block means end of data.
+            pipeline.send(RowOrientedBlock())
+
+        finally:
+            pipeline.stop()
+
+        pipeline.check()
+        return inserted_rows
+
     def receive_end_of_query(self):
         while True:
             packet = self.connection.receive_packet()
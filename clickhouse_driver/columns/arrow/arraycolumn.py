@@ -0,0 +1,56 @@
+import numpy as np
+
+from ..arraycolumn import ArrayColumn
+
+
+class ArrowListBuffers(object):
+    """
+    Array column read into Arrow-style buffers: int32/int64 offsets
+    (``n_items + 1`` values starting with zero) plus the flattened
+    values of the inner column in whatever form the inner column
+    returns. Assembled into a pyarrow ListArray by
+    ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('offsets', 'values')
+
+    def __init__(self, offsets, values):
+        self.offsets = offsets
+        self.values = values
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+class ArrowArrayColumn(ArrayColumn):
+    def read_data(self, n_rows, buf):
+        # Sizes of every nesting level come first in breadth-first
+        # order, then the leaf column with its nulls map. Wire sizes
+        # are already cumulative: prepending zero turns them into
+        # Arrow offsets.
+        levels = []
+
+        column = self
+        size = n_rows
+        while isinstance(column, ArrayColumn):
+            sizes = np.frombuffer(buf.read(size * 8), dtype='<u8', count=size)
+            levels.append(sizes)
+            size = int(sizes[-1]) if size else 0
+            column = column.nested_column
+
+        values = column.read_data(size, buf)
+
+        for sizes in reversed(levels):
+            values = ArrowListBuffers(_sizes_to_offsets(sizes), values)
+
+        return values
+
+
+def _sizes_to_offsets(sizes):
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    offsets[1:] = sizes
+    return offsets
+
+
+def create_arrow_array_column(spec, column_by_spec_getter, column_options):
+    inner = spec[6:-1]
+    return ArrowArrayColumn(column_by_spec_getter(inner), **column_options)
@@ -1,5 +1,10 @@
+from io import BytesIO
+
 import numpy as np
 
+from ..base import CommonSerialization
+from ..numpy.base import NumpySparseSerialization
+
 
 class ArrowColumnMixin(object):
     """
@@ -22,3 +27,52 @@ class ArrowColumnMixin(object):
             return np.ma.MaskedArray(items, mask=nulls_map)
 
         return items
+
+
+class ArrowBuffersMixin(object):
+    """
+    Read-path override for columns of the generic family with
+    fixed-size items: raw wire data is handed over to
+    ``clickhouse_driver.arrow.convert`` in one buffer instead of
+    per-item Python objects.
+    """
+
+    sparse_serialization_class = NumpySparseSerialization
+
+    # Size of one wire item for columns with fixed-size items: sparse
+    # columns of them are expanded before buffers are built. Defaults
+    # are zero bytes unless ``sparse_default`` wire bytes are given.
+    sparse_item_size = None
+    sparse_default = None
+
+    def read_data(self, n_items, buf):
+        item_size = self.sparse_item_size
+        if (type(self.serialization) is CommonSerialization or
+                item_size is None or self.nullable):
+            return super(ArrowBuffersMixin, self).read_data(n_items, buf)
+
+        serialization = self.serialization
+        n_values = serialization.read_sparse(n_items, buf)
+        data = serialization.apply_sparse_bytes(
+            buf.read(n_values * item_size), item_size,
+            default=self.sparse_default
+        )
+        return self._read_buffers(
+            serialization.items_total - 1, BytesIO(data)
+        )
+
+    def _read_nulls_map(self, n_items, buf):
+        return np.frombuffer(buf.read(n_items), dtype=np.uint8,
+                             count=n_items)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        # Sparse columns need real items to put defaults between.
+        if type(self.serialization) is not CommonSerialization:
+            return super(ArrowBuffersMixin, self)._read_data(
+                n_items, buf, nulls_map=nulls_map
+            )
+
+        return self._read_buffers(n_items, buf, nulls_map=nulls_map)
+
+    def _read_buffers(self, n_items, buf, nulls_map=None):
+        raise NotImplementedError
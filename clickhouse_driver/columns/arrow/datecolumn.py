@@ -1,6 +1,19 @@
+import numpy as np
+
+from ..numpy.base import NumpyColumn
 from ..numpy.datecolumn import NumpyDateColumn
 from .base import ArrowColumnMixin
 
 
 class ArrowDateColumn(ArrowColumnMixin, NumpyDateColumn):
-    pass
+    # Days since epoch as int32 are Arrow date32 values.
+    null_value = 0
+
+    def read_items(self, n_items, buf):
+        items = super(NumpyDateColumn, self).read_items(n_items, buf)
+        return items.astype(np.int32)
+
+
+class ArrowDate32Column(ArrowColumnMixin, NumpyColumn):
+    dtype = np.dtype(np.int32)
+    ch_type = 'Date32'
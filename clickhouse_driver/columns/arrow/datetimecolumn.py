@@ -1,14 +1,68 @@
+import numpy as np
+
 from ..numpy.datetimecolumn import (
     NumpyDateTime64Column, NumpyDateTimeColumn, create_numpy_datetime_column
 )
-from .base import ArrowColumnMixin
+from .base import ArrowBuffersMixin
+
+
+class ArrowTimestampBuffers(object):
+    """
+    DateTime/DateTime64 column as wire integers: UTC time since epoch
+    in units of ``10 ** -scale`` seconds. ``timezone`` is the timezone
+    of the column type, ``local_timezone`` is the timezone of
+    timezone-naive values for columns without one. Wrapped into a
+    pyarrow timestamp array by ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('values', 'scale', 'timezone', 'local_timezone',
+                 'nulls_map')
+
+    def __init__(self, values, scale, timezone=None, local_timezone=None,
+                 nulls_map=None):
+        self.values = values
+        self.scale = scale
+        self.timezone = timezone
+        self.local_timezone = local_timezone
+        self.nulls_map = nulls_map
+
+    def __len__(self):
+        return len(self.values)
+
+
+class ArrowDateTimeMixin(ArrowBuffersMixin):
+    scale = 0
+
+    @property
+    def sparse_item_size(self):
+        return self.dtype.itemsize
+
+    def _read_buffers(self, n_items, buf, nulls_map=None):
+        # Values are kept in UTC: timezone conversions are done by
+        # Arrow compute functions, not pandas.
+        values = np.frombuffer(
+            buf.read(n_items * self.dtype.itemsize),
+            dtype=self.dtype.newbyteorder('<'), count=n_items
+        )
+
+        timezone = local_timezone = None
+        if not self.offset_naive:
+            timezone = self.timezone.zone
+        else:
+            local = self.timezone or self.local_timezone
+            if local is not None and local.zone != 'UTC':
+                local_timezone = local.zone
+
+        return ArrowTimestampBuffers(
+            values, self.scale, timezone=timezone,
+            local_timezone=local_timezone, nulls_map=nulls_map
+        )
 
 
-class ArrowDateTimeColumn(ArrowColumnMixin, NumpyDateTimeColumn):
+class ArrowDateTimeColumn(ArrowDateTimeMixin, NumpyDateTimeColumn):
     pass
 
 
-class ArrowDateTime64Column(ArrowColumnMixin, NumpyDateTime64Column):
+class ArrowDateTime64Column(ArrowDateTimeMixin, NumpyDateTime64Column):
     pass
 
 
@@ -0,0 +1,71 @@
+from ..decimalcolumn import (
+    Decimal32Column, Decimal64Column, Decimal128Column, Decimal256Column
+)
+from .base import ArrowBuffersMixin
+
+
+class ArrowDecimalBuffers(object):
+    """
+    Decimal column read as is: scaled little-endian two's complement
+    integers of ``item_size`` bytes each, no ``Decimal`` objects.
+    Widened and wrapped into a pyarrow decimal array by
+    ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('precision', 'scale', 'item_size', 'data', 'nulls_map')
+
+    def __init__(self, precision, scale, item_size, data, nulls_map=None):
+        self.precision = precision
+        self.scale = scale
+        self.item_size = item_size
+        self.data = data
+        self.nulls_map = nulls_map
+
+    def __len__(self):
+        return len(self.data) // self.item_size
+
+
+class ArrowDecimalMixin(ArrowBuffersMixin):
+    item_size = None
+
+    @property
+    def sparse_item_size(self):
+        return self.item_size
+
+    def _read_buffers(self, n_items, buf, nulls_map=None):
+        data = buf.read(n_items * self.item_size)
+        return ArrowDecimalBuffers(
+            self.precision, self.scale, self.item_size, data,
+            nulls_map=nulls_map
+        )
+
+
+class ArrowDecimal32Column(ArrowDecimalMixin, Decimal32Column):
+    item_size = 4
+
+
+class ArrowDecimal64Column(ArrowDecimalMixin, Decimal64Column):
+    item_size = 8
+
+
+class ArrowDecimal128Column(ArrowDecimalMixin, Decimal128Column):
+    item_size = 16
+
+
+class ArrowDecimal256Column(ArrowDecimalMixin, Decimal256Column):
+    item_size = 32
+
+
+def create_arrow_decimal_column(spec, column_options):
+    precision, scale = spec[8:-1].split(',')
+    precision, scale = int(precision), int(scale)
+
+    if precision <= 9:
+        cls = ArrowDecimal32Column
+    elif precision <= 18:
+        cls = ArrowDecimal64Column
+    elif precision <= 38:
+        cls = ArrowDecimal128Column
+    else:
+        cls = ArrowDecimal256Column
+
+    return cls(precision, scale, **column_options)
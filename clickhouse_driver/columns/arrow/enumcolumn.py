@@ -0,0 +1,92 @@
+from functools import lru_cache
+
+import numpy as np
+
+from ..enumcolumn import Enum8Column, Enum16Column, _parse_options
+from .base import ArrowBuffersMixin
+
+
+class ArrowEnumBuffers(object):
+    """
+    Enum column as dense indices into ``names``: the enum elements in
+    spec order. Assembled into a pyarrow dictionary array by
+    ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('indices', 'names', 'nulls_map')
+
+    def __init__(self, indices, names, nulls_map=None):
+        self.indices = indices
+        self.names = names
+        self.nulls_map = nulls_map
+
+    def __len__(self):
+        return len(self.indices)
+
+
+class ArrowEnumMixin(ArrowBuffersMixin):
+    def __init__(self, name_by_value, value_by_name, lookup_table, **kwargs):
+        self.lookup_table = lookup_table
+        self.names = tuple(value_by_name)
+        super(ArrowEnumMixin, self).__init__(
+            name_by_value, value_by_name, **kwargs
+        )
+
+    @property
+    def sparse_item_size(self):
+        return self.int_size
+
+    @property
+    def sparse_default(self):
+        # Default of Enum is its smallest value, not zero.
+        return min(self.name_by_value).to_bytes(
+            self.int_size, 'little', signed=True
+        )
+
+    def _read_buffers(self, n_items, buf, nulls_map=None):
+        # Codes are looked up by their unsigned bit pattern: no
+        # widening to index negative values.
+        dtype = np.dtype('<u{}'.format(self.int_size))
+        codes = np.frombuffer(
+            buf.read(n_items * self.int_size), dtype=dtype, count=n_items
+        )
+        return ArrowEnumBuffers(
+            self.lookup_table[codes], self.names,
+            nulls_map=nulls_map
+        )
+
+
+class ArrowEnum8Column(ArrowEnumMixin, Enum8Column):
+    pass
+
+
+class ArrowEnum16Column(ArrowEnumMixin, Enum16Column):
+    pass
+
+
+@lru_cache(512)
+def _get_enum_options(spec):
+    # Parsed options and lookup table are shared by all blocks and
+    # queries with the same spec.
+    if spec.startswith('Enum8'):
+        params = spec[6:-1]
+        int_size = 1
+    else:
+        params = spec[7:-1]
+        int_size = 2
+
+    name_by_value, value_by_name = _parse_options(params)
+
+    index_dtype = '<u{}'.format(int_size)
+    lookup_table = np.zeros(1 << (8 * int_size), dtype=index_dtype)
+    for i, value in enumerate(value_by_name.values()):
+        lookup_table[value & ((1 << (8 * int_size)) - 1)] = i
+    lookup_table.setflags(write=False)
+
+    return name_by_value, value_by_name, lookup_table
+
+
+def create_arrow_enum_column(spec, column_options):
+    cls = ArrowEnum8Column if spec.startswith('Enum8') else ArrowEnum16Column
+    name_by_value, value_by_name, lookup_table = _get_enum_options(spec)
+
+    return cls(name_by_value, value_by_name, lookup_table, **column_options)
@@ -1,8 +1,29 @@
+from ..intcolumn import (
+    Int128Column, UInt128Column, Int256Column, UInt256Column
+)
 from ..numpy.intcolumn import (
     NumpyInt8Column, NumpyInt16Column, NumpyInt32Column, NumpyInt64Column,
     NumpyUInt8Column, NumpyUInt16Column, NumpyUInt32Column, NumpyUInt64Column
 )
-from .base import ArrowColumnMixin
+from .base import ArrowBuffersMixin, ArrowColumnMixin
+
+
+class ArrowLargeIntBuffers(object):
+    """
+    128/256-bit integer column as raw little-endian words, lowest word
+    first. Wrapped into a pyarrow array by
+    ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('item_size', 'signed', 'data', 'nulls_map')
+
+    def __init__(self, item_size, signed, data, nulls_map=None):
+        self.item_size = item_size
+        self.signed = signed
+        self.data = data
+        self.nulls_map = nulls_map
+
+    def __len__(self):
+        return len(self.data) // self.item_size
 
 
 class ArrowInt8Column(ArrowColumnMixin, NumpyInt8Column):
@@ -35,3 +56,33 @@ class ArrowUInt32Column(ArrowColumnMixin, NumpyUInt32Column):
 
 class ArrowUInt64Column(ArrowColumnMixin, NumpyUInt64Column):
     pass
+
+
+class ArrowLargeIntMixin(ArrowBuffersMixin):
+    signed = True
+
+    @property
+    def sparse_item_size(self):
+        return self.int_size
+
+    def _read_buffers(self, n_items, buf, nulls_map=None):
+        return ArrowLargeIntBuffers(
+            self.int_size, self.signed, buf.read(n_items * self.int_size),
+            nulls_map=nulls_map
+        )
+
+
+class ArrowInt128Column(ArrowLargeIntMixin, Int128Column):
+    pass
+
+
+class ArrowUInt128Column(ArrowLargeIntMixin, UInt128Column):
+    signed = False
+
+
+class ArrowInt256Column(ArrowLargeIntMixin, Int256Column):
+    pass
+
+
+class ArrowUInt256Column(ArrowLargeIntMixin, UInt256Column):
+    signed = False
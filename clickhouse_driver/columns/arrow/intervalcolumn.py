@@ -0,0 +1,71 @@
+from ..numpy.intcolumn import NumpyInt64Column
+from .base import ArrowBuffersMixin
+
+
+class ArrowIntervalBuffers(object):
+    """
+    Interval column as Int64 numbers of interval units. Wrapped into a
+    pyarrow duration or month_day_nano_interval array by
+    ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('ch_type', 'values', 'nulls_map')
+
+    def __init__(self, ch_type, values, nulls_map=None):
+        self.ch_type = ch_type
+        self.values = values
+        self.nulls_map = nulls_map
+
+    def __len__(self):
+        return len(self.values)
+
+
+class ArrowIntervalColumn(ArrowBuffersMixin, NumpyInt64Column):
+    sparse_item_size = 8
+
+    def _read_buffers(self, n_items, buf, nulls_map=None):
+        values = self.read_items(n_items, buf)
+        return ArrowIntervalBuffers(self.ch_type, values, nulls_map=nulls_map)
+
+
+class ArrowIntervalNanosecondColumn(ArrowIntervalColumn):
+    ch_type = 'IntervalNanosecond'
+
+
+class ArrowIntervalMicrosecondColumn(ArrowIntervalColumn):
+    ch_type = 'IntervalMicrosecond'
+
+
+class ArrowIntervalMillisecondColumn(ArrowIntervalColumn):
+    ch_type = 'IntervalMillisecond'
+
+
+class ArrowIntervalSecondColumn(ArrowIntervalColumn):
+    ch_type = 'IntervalSecond'
+
+
+class ArrowIntervalMinuteColumn(ArrowIntervalColumn):
+    ch_type = 'IntervalMinute'
+
+
+class ArrowIntervalHourColumn(ArrowIntervalColumn):
+    ch_type = 'IntervalHour'
+
+
+class ArrowIntervalDayColumn(ArrowIntervalColumn):
+    ch_type = 'IntervalDay'
+
+
+class ArrowIntervalWeekColumn(ArrowIntervalColumn):
+    ch_type = 'IntervalWeek'
+
+
+class ArrowIntervalMonthColumn(ArrowIntervalColumn):
+    ch_type = 'IntervalMonth'
+
+
+class ArrowIntervalQuarterColumn(ArrowIntervalColumn):
+    ch_type = 'IntervalQuarter'
+
+
+class ArrowIntervalYearColumn(ArrowIntervalColumn):
+    ch_type = 'IntervalYear'
@@ -0,0 +1,51 @@
+import numpy as np
+
+from ..ipcolumn import IPv4Column, IPv6Column
+from .base import ArrowBuffersMixin
+
+
+class ArrowIPv4Buffers(object):
+    """
+    IPv4 column as uint32 NumPy array. Wrapped into a pyarrow array by
+    ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('values', 'nulls_map')
+
+    def __init__(self, values, nulls_map=None):
+        self.values = values
+        self.nulls_map = nulls_map
+
+    def __len__(self):
+        return len(self.values)
+
+
+class ArrowIPv6Buffers(object):
+    """
+    IPv6 column as 16 bytes per item in network byte order. Wrapped
+    into a pyarrow array by ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('data', 'nulls_map')
+
+    def __init__(self, data, nulls_map=None):
+        self.data = data
+        self.nulls_map = nulls_map
+
+    def __len__(self):
+        return len(self.data) // 16
+
+
+class ArrowIPv4Column(ArrowBuffersMixin, IPv4Column):
+    sparse_item_size = 4
+
+    def _read_buffers(self, n_items, buf, nulls_map=None):
+        values = np.frombuffer(
+            buf.read(n_items * 4), dtype='<u4', count=n_items
+        )
+        return ArrowIPv4Buffers(values, nulls_map=nulls_map)
+
+
+class ArrowIPv6Column(ArrowBuffersMixin, IPv6Column):
+    sparse_item_size = 16
+
+    def _read_buffers(self, n_items, buf, nulls_map=None):
+        return ArrowIPv6Buffers(buf.read(n_items * 16), nulls_map=nulls_map)
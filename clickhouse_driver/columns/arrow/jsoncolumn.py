@@ -0,0 +1,75 @@
+from ..dynamiccolumn import SharedValueDecoder
+from ..newjsoncolumn import NewJsonColumn, OBJECT_STRING, _tuples_to_lists
+from ..service import get_column_by_spec
+from .base import ArrowBuffersMixin
+from .variantcolumn import ArrowDynamicColumn
+
+
+class ArrowJsonBuffers(object):
+    """
+    JSON column as one ArrowUnionBuffers per dynamic path in sorted
+    path order plus the shared data rows: ``(path, blob)`` pairs of the
+    paths over ``max_dynamic_paths``. Paths declared in a struct type
+    are assembled by ``clickhouse_driver.arrow.convert`` without
+    building per-row dicts.
+
+    ``decode`` turns a shared blob into its Python value, ``fold``
+    builds per-row dicts from per-path values for other target types.
+    With server-side serialization ``texts`` holds JSON text instead.
+    """
+    __slots__ = (
+        'n_items', 'paths', 'children', 'shared_rows', 'decode', 'fold',
+        'texts', 'nulls_map'
+    )
+
+    def __init__(self, n_items, paths=(), children=(), shared_rows=None,
+                 decode=None, fold=None, texts=None, nulls_map=None):
+        self.n_items = n_items
+        self.paths = paths
+        self.children = children
+        self.shared_rows = shared_rows
+        self.decode = decode
+        self.fold = fold
+        self.texts = texts
+        self.nulls_map = nulls_map
+
+    def __len__(self):
+        return self.n_items
+
+
+class ArrowNewJsonColumn(ArrowBuffersMixin, NewJsonColumn):
+    dynamic_column_class = ArrowDynamicColumn
+
+    def __init__(self, column_by_spec_getter, **kwargs):
+        super(ArrowNewJsonColumn, self).__init__(
+            column_by_spec_getter, **kwargs
+        )
+        # Shared blobs are decoded value by value: generic columns
+        # return Python values for them.
+        self._shared_value_decoder = SharedValueDecoder(
+            lambda x: get_column_by_spec(x, kwargs, use_numpy=False)
+        )
+
+    def _read_buffers(self, n_items, buf, nulls_map=None):
+        if self.serialization_version == OBJECT_STRING:
+            texts = buf.read_strings(n_items, encoding='utf-8')
+            return ArrowJsonBuffers(
+                n_items, texts=texts, nulls_map=nulls_map
+            )
+
+        children = [
+            column.read_items(n_items, buf) for column in self.dynamic_columns
+        ]
+        shared_rows = self.shared_data_column.read_data(n_items, buf)
+
+        return ArrowJsonBuffers(
+            n_items, self.sorted_dynamic_paths, children, shared_rows,
+            self._decode_shared, self._fold_rows, nulls_map=nulls_map
+        )
+
+    def _decode_shared(self, blob):
+        return _tuples_to_lists(self._shared_value_decoder.decode(blob))
+
+
+def create_arrow_json_column(spec, column_by_spec_getter, column_options):
+    return ArrowNewJsonColumn(column_by_spec_getter, **column_options)
@@ -0,0 +1,63 @@
+import numpy as np
+
+from ..numpy.lowcardinalitycolumn import NumpyLowCardinalityColumn
+from ...reader import read_binary_uint64
+
+
+class ArrowDictionaryBuffers(object):
+    """
+    LowCardinality column read as is: keys NumPy array of the wire key
+    width plus the index (dictionary) in whatever form the nested
+    column returns. For nullable columns key zero stands for NULL.
+    Assembled into a pyarrow DictionaryArray by
+    ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('keys', 'index', 'nullable')
+
+    def __init__(self, keys, index, nullable=False):
+        self.keys = keys
+        self.index = index
+        self.nullable = nullable
+
+    def __len__(self):
+        return len(self.keys)
+
+
+class ArrowLowCardinalityColumn(NumpyLowCardinalityColumn):
+    key_dtypes = {
+        0: '<u1',
+        1: '<u2',
+        2: '<u4',
+        3: '<u8'
+    }
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        if not n_items:
+            return tuple()
+
+        serialization_type = read_binary_uint64(buf)
+
+        # Lowest byte contains info about key type.
+        key_dtype = np.dtype(self.key_dtypes[serialization_type & 0xf])
+
+        nullable = self.nested_column.nullable
+        # Prevent null map reading. Reset nested column nullable flag.
+        self.nested_column.nullable = False
+
+        index_size = read_binary_uint64(buf)
+        index = self.nested_column.read_data(index_size, buf)
+
+        read_binary_uint64(buf)  # number of keys
+        keys = np.frombuffer(
+            buf.read(n_items * key_dtype.itemsize), dtype=key_dtype,
+            count=n_items
+        )
+
+        return ArrowDictionaryBuffers(keys, index, nullable=nullable)
+
+
+def create_arrow_low_cardinality_column(spec, column_by_spec_getter,
+                                        column_options):
+    inner = spec[15:-1]
+    nested = column_by_spec_getter(inner)
+    return ArrowLowCardinalityColumn(nested, **column_options)
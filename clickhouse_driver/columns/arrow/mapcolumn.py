@@ -0,0 +1,45 @@
+import numpy as np
+
+from ..mapcolumn import MapColumn, comma_re
+from .arraycolumn import _sizes_to_offsets
+
+
+class ArrowMapBuffers(object):
+    """
+    Map column read into Arrow-style buffers: int64 offsets
+    (``n_items + 1`` values starting with zero) plus flattened keys and
+    values in whatever form the key/value columns return. Assembled
+    into a pyarrow MapArray by ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('offsets', 'keys', 'values')
+
+    def __init__(self, offsets, keys, values):
+        self.offsets = offsets
+        self.keys = keys
+        self.values = values
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+class ArrowMapColumn(MapColumn):
+    def read_items(self, n_items, buf):
+        # Map is stored as Array(Tuple(K, V)): cumulative sizes, then
+        # all keys, then all values. No per-row dicts are built.
+        sizes = np.frombuffer(
+            buf.read(n_items * 8), dtype='<u8', count=n_items
+        )
+        size = int(sizes[-1]) if n_items else 0
+
+        keys = self.key_column.read_data(size, buf)
+        values = self.value_column.read_data(size, buf)
+
+        return ArrowMapBuffers(_sizes_to_offsets(sizes), keys, values)
+
+
+def create_arrow_map_column(spec, column_by_spec_getter, column_options):
+    key, value = comma_re.split(spec[4:-1])
+    key_column = column_by_spec_getter(key.strip())
+    value_column = column_by_spec_getter(value.strip())
+
+    return ArrowMapColumn(key_column, value_column, **column_options)
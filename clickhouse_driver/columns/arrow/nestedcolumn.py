@@ -0,0 +1,9 @@
+from ..util import get_inner_spec
+from .arraycolumn import create_arrow_array_column
+
+
+def create_arrow_nested_column(spec, column_by_spec_getter, column_options):
+    return create_arrow_array_column(
+        'Array(Tuple({}))'.format(get_inner_spec('Nested', spec)),
+        column_by_spec_getter, column_options
+    )
@@ -1,27 +1,63 @@
 from ... import errors
 from ..nullablecolumn import create_nullable_column
-from ..numpy.lowcardinalitycolumn import create_numpy_low_cardinality_column
-from ..numpy.tuplecolumn import create_tuple_column
 from ..service import aliases
+from .arraycolumn import create_arrow_array_column
 from .boolcolumn import ArrowBoolColumn
-from .datecolumn import ArrowDateColumn
+from .datecolumn import ArrowDate32Column, ArrowDateColumn
 from .datetimecolumn import create_arrow_datetime_column
+from .decimalcolumn import create_arrow_decimal_column
+from .enumcolumn import create_arrow_enum_column
 from .floatcolumn import ArrowFloat32Column, ArrowFloat64Column
+from .intervalcolumn import (
+    ArrowIntervalNanosecondColumn, ArrowIntervalMicrosecondColumn,
+    ArrowIntervalMillisecondColumn, ArrowIntervalSecondColumn,
+    ArrowIntervalMinuteColumn, ArrowIntervalHourColumn,
+    ArrowIntervalDayColumn, ArrowIntervalWeekColumn,
+    ArrowIntervalMonthColumn, ArrowIntervalQuarterColumn,
+    ArrowIntervalYearColumn
+)
 from .intcolumn import (
     ArrowInt8Column, ArrowInt16Column, ArrowInt32Column, ArrowInt64Column,
-    ArrowUInt8Column, ArrowUInt16Column, ArrowUInt32Column, ArrowUInt64Column
+    ArrowUInt8Column, ArrowUInt16Column, ArrowUInt32Column, ArrowUInt64Column,
+    ArrowInt128Column, ArrowUInt128Column, ArrowInt256Column,
+    ArrowUInt256Column
 )
+from .ipcolumn import ArrowIPv4Column, ArrowIPv6Column
+from .jsoncolumn import create_arrow_json_column
+from .lowcardinalitycolumn import create_arrow_low_cardinality_column
+from .mapcolumn import create_arrow_map_column
+from .nestedcolumn import create_arrow_nested_column
 from .stringcolumn import create_arrow_string_column
+from .tuplecolumn import create_arrow_tuple_column
+from .uuidcolumn import ArrowUUIDColumn
+from .variantcolumn import (
+    create_arrow_dynamic_column, create_arrow_variant_column
+)
 
 # Fixed-width types differ from their NumPy counterparts only in
 # nullable reads: ArrowColumnMixin keeps the values and the nulls map
-# intact instead of converting to an object ndarray.
+# intact instead of converting to an object ndarray. UUID, IP and
+# Interval columns are read into single buffers instead of Python
+# objects, dates are read as days since epoch.
 column_by_type = {c.ch_type: c for c in [
-    ArrowDateColumn,
+    ArrowDateColumn, ArrowDate32Column,
     ArrowFloat32Column, ArrowFloat64Column,
     ArrowInt8Column, ArrowInt16Column, ArrowInt32Column, ArrowInt64Column,
     ArrowUInt8Column, ArrowUInt16Column, ArrowUInt32Column, ArrowUInt64Column,
-    ArrowBoolColumn
+    ArrowBoolColumn,
+    ArrowUUIDColumn, ArrowIPv4Column, ArrowIPv6Column,
+    ArrowIntervalNanosecondColumn, ArrowIntervalMicrosecondColumn,
+    ArrowIntervalMillisecondColumn, ArrowIntervalSecondColumn,
+    ArrowIntervalMinuteColumn, ArrowIntervalHourColumn,
+    ArrowIntervalDayColumn, ArrowIntervalWeekColumn,
+    ArrowIntervalMonthColumn, ArrowIntervalQuarterColumn,
+    ArrowIntervalYearColumn
+]}
+
+# Used with large_ints_as_words only: Python ints otherwise.
+large_int_column_by_type = {c.ch_type: c for c in [
+    ArrowInt128Column, ArrowUInt128Column, ArrowInt256Column,
+    ArrowUInt256Column
 ]}
 
 
@@ -35,8 +71,44 @@ def get_arrow_column_by_spec(spec, column_options):
     elif spec.startswith('DateTime'):
         return create_arrow_datetime_column(spec, column_options)
 
+    elif spec.startswith('Enum'):
+        return create_arrow_enum_column(spec, column_options)
+
+    elif spec.startswith('Decimal'):
+        return create_arrow_decimal_column(spec, column_options)
+
+    elif spec.startswith('Array'):
+        return create_arrow_array_column(
+            spec, create_column_with_options, column_options
+        )
+
     elif spec.startswith('Tuple'):
-        return create_tuple_column(
+        return create_arrow_tuple_column(
+            spec, create_column_with_options, column_options
+        )
+
+    elif spec.startswith('Nested'):
+        return create_arrow_nested_column(
+            spec, create_column_with_options, column_options
+        )
+
+    elif spec.startswith('Map'):
+        return create_arrow_map_column(
+            spec, create_column_with_options, column_options
+        )
+
+    elif spec.startswith('Variant'):
+        return create_arrow_variant_column(
+            spec, create_column_with_options, column_options
+        )
+
+    elif spec.startswith('Dynamic'):
+        return create_arrow_dynamic_column(
+            spec, create_column_with_options, column_options
+        )
+
+    elif spec.startswith('JSON'):
+        return create_arrow_json_column(
             spec, create_column_with_options, column_options
         )
 
@@ -44,13 +116,9 @@ def get_arrow_column_by_spec(spec, column_options):
         return create_nullable_column(spec, create_column_with_options)
 
     elif spec.startswith('LowCardinality'):
-        column = create_numpy_low_cardinality_column(
+        return create_arrow_low_cardinality_column(
             spec, create_column_with_options, column_options
         )
-        # Dictionary values are consumed by pd.Categorical: real items
-        # are needed, not Arrow buffers.
-        column.nested_column.arrow_buffers_allowed = False
-        return column
     else:
         for alias, primitive in aliases:
             if spec.startswith(alias):
@@ -62,4 +130,10 @@ def get_arrow_column_by_spec(spec, column_options):
             cls = column_by_type[spec]
             return cls(**column_options)
 
+        client_settings = column_options['context'].client_settings
+        if client_settings.get('large_ints_as_words') and \
+                spec in large_int_column_by_type:
+            cls = large_int_column_by_type[spec]
+            return cls(**column_options)
+
         raise errors.UnknownTypeError('Unknown type {}'.format(spec))
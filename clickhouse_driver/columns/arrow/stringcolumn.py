@@ -25,31 +25,65 @@ class ArrowStringBuffers(object):
         return len(self.offsets) // 8 - 1
 
 
-class ArrowStringMixin(ArrowColumnMixin):
-    # Reset for columns whose consumers need real items, e.g.
-    # LowCardinality dictionaries.
-    arrow_buffers_allowed = True
+class ArrowFixedStringBuffers(object):
+    """
+    FixedString column read as one contiguous buffer of
+    ``n_items * length`` bytes. Trailing zero bytes are trimmed on
+    conversion to variable-length arrays if ``trim`` is set. Assembled
+    into a pyarrow array by ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('length', 'data', 'nulls_map', 'trim')
 
+    def __init__(self, length, data, nulls_map=None, trim=False):
+        self.length = length
+        self.data = data
+        self.nulls_map = nulls_map
+        self.trim = trim
+
+    def __len__(self):
+        return len(self.data) // self.length
+
+
+class ArrowStringMixin(ArrowColumnMixin):
     def _buffers_encoding_ok(self):
         return self.encoding.lower() in ('utf-8', 'utf8')
 
     def _use_arrow_buffers(self, buf):
         return (
-            self.arrow_buffers_allowed and
             self._buffers_encoding_ok() and
-            type(self.serialization) is CommonSerialization and
             hasattr(buf, 'read_strings_arrow')
         )
 
+    def read_data(self, n_items, buf):
+        serialization = self.serialization
+        if (type(serialization) is CommonSerialization or self.nullable or
+                not self._use_arrow_buffers(buf)):
+            return super(ArrowStringMixin, self).read_data(n_items, buf)
+
+        # Sparse column: defaults are put between non-default strings
+        # in the buffers.
+        n_values = serialization.read_sparse(n_items, buf)
+        return self._read_sparse_buffers(n_values, buf)
+
     def _read_data(self, n_items, buf, nulls_map=None):
-        if self._use_arrow_buffers(buf):
-            offsets, data = buf.read_strings_arrow(n_items)
-            return ArrowStringBuffers(offsets, data, nulls_map=nulls_map)
+        if (type(self.serialization) is CommonSerialization and
+                self._use_arrow_buffers(buf)):
+            return self._read_buffers(n_items, buf, nulls_map=nulls_map)
 
         return super(ArrowStringMixin, self)._read_data(
             n_items, buf, nulls_map=nulls_map
         )
 
+    def _read_buffers(self, n_items, buf, nulls_map=None):
+        offsets, data = buf.read_strings_arrow(n_items)
+        return ArrowStringBuffers(offsets, data, nulls_map=nulls_map)
+
+    def _read_sparse_buffers(self, n_values, buf):
+        offsets, data = buf.read_strings_arrow(n_values)
+        return ArrowStringBuffers(
+            self.serialization.apply_sparse_offsets(offsets), data
+        )
+
     def _wrap_items(self, items):
         # Wrapping strings into an ndarray re-encodes them (unicode
         # dtype). Arrow consumes the raw tuple directly; the ndarray
@@ -76,21 +110,35 @@ class ArrowByteStringColumn(ArrowStringMixin, NumpyByteStringColumn):
         return self._wrap_items(buf.read_strings(n_items))
 
 
-class ArrowFixedString(ArrowStringMixin, NumpyFixedString):
-    def _use_arrow_buffers(self, buf):
-        # Fixed strings are trimmed of zero bytes on read: buffers
-        # would keep the padding.
-        return False
+class ArrowFixedStringMixin(ArrowStringMixin):
+    # Zero bytes padding is trimmed for strings, kept for bytes.
+    trim = True
+
+    def _read_buffers(self, n_items, buf, nulls_map=None):
+        data = buf.read(n_items * self.length)
+        return ArrowFixedStringBuffers(
+            self.length, data, nulls_map=nulls_map, trim=self.trim
+        )
+
+    def _read_sparse_buffers(self, n_values, buf):
+        data = self.serialization.apply_sparse_bytes(
+            buf.read(n_values * self.length), self.length
+        )
+        return ArrowFixedStringBuffers(self.length, data, trim=self.trim)
+
 
+class ArrowFixedString(ArrowFixedStringMixin, NumpyFixedString):
     def read_items(self, n_items, buf):
         return self._wrap_items(buf.read_fixed_strings(
             n_items, self.length, encoding=self.encoding
         ))
 
 
-class ArrowByteFixedString(ArrowStringMixin, NumpyByteFixedString):
-    def _use_arrow_buffers(self, buf):
-        return False
+class ArrowByteFixedString(ArrowFixedStringMixin, NumpyByteFixedString):
+    trim = False
+
+    def _buffers_encoding_ok(self):
+        return True
 
     def read_items(self, n_items, buf):
         return self._wrap_items(
@@ -0,0 +1,37 @@
+from ..tuplecolumn import TupleColumn
+from ..util import get_inner_spec, get_inner_columns_with_types
+
+
+class ArrowStructBuffers(object):
+    """
+    Tuple column read element-wise: one payload per element in whatever
+    form the element column returns. Assembled into a pyarrow
+    StructArray by ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('names', 'columns')
+
+    def __init__(self, names, columns):
+        self.names = names
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns[0]) if self.columns else 0
+
+
+class ArrowTupleColumn(TupleColumn):
+    def read_data(self, n_items, buf):
+        # Elements are stored one after another as whole columns: no
+        # per-row tuples are needed.
+        return ArrowStructBuffers(
+            self.names,
+            [x.read_data(n_items, buf) for x in self.nested_columns]
+        )
+
+
+def create_arrow_tuple_column(spec, column_by_spec_getter, column_options):
+    inner_spec = get_inner_spec('Tuple', spec)
+    columns_with_types = get_inner_columns_with_types(inner_spec)
+    names, types = zip(*columns_with_types)
+
+    return ArrowTupleColumn(names, [column_by_spec_getter(x) for x in types],
+                            **column_options)
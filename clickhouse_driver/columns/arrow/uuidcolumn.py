@@ -0,0 +1,32 @@
+import numpy as np
+
+from ..uuidcolumn import UUIDColumn
+from .base import ArrowBuffersMixin
+
+
+class ArrowUUIDBuffers(object):
+    """
+    UUID column as 16 bytes per item in RFC 4122 byte order. Wrapped
+    into a pyarrow array by ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('data', 'nulls_map')
+
+    def __init__(self, data, nulls_map=None):
+        self.data = data
+        self.nulls_map = nulls_map
+
+    def __len__(self):
+        return len(self.data) // 16
+
+
+class ArrowUUIDColumn(ArrowBuffersMixin, UUIDColumn):
+    sparse_item_size = 16
+
+    def _read_buffers(self, n_items, buf, nulls_map=None):
+        # UUID is stored as two little-endian uint64: swapping bytes
+        # of each half gives RFC 4122 byte order.
+        halves = np.frombuffer(
+            buf.read(n_items * 16), dtype='<u8', count=2 * n_items
+        )
+        data = halves.byteswap().view(np.uint8)
+        return ArrowUUIDBuffers(data, nulls_map=nulls_map)
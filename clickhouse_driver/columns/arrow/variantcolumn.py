@@ -0,0 +1,108 @@
+import numpy as np
+
+from ...reader import read_binary_uint64
+from ..dynamiccolumn import (
+    DynamicColumn, NULL_DISCRIMINATOR, SHARED_VARIANT_NAME,
+    VARIANT_MODE_BASIC, VARIANT_MODE_COMPACT
+)
+from ..util import get_inner_columns, get_inner_spec
+
+
+class ArrowUnionBuffers(object):
+    """
+    Variant/Dynamic column as global discriminators (``255`` for NULL)
+    plus one payload per variant in discriminator order, holding only
+    the rows of that variant in whatever form the variant column
+    returns. Assembled into a pyarrow dense UnionArray by
+    ``clickhouse_driver.arrow.convert``.
+    """
+    __slots__ = ('discriminators', 'names', 'children')
+
+    def __init__(self, discriminators, names, children):
+        self.discriminators = discriminators
+        self.names = names
+        self.children = children
+
+    def __len__(self):
+        return len(self.discriminators)
+
+
+class ArrowVariantMixin(object):
+    def read_items(self, n_items, buf):
+        if self.discriminators_mode == VARIANT_MODE_COMPACT:
+            raise NotImplementedError(
+                'Compact Variant discriminators are not supported yet'
+            )
+
+        discriminators = np.frombuffer(
+            buf.read(n_items), dtype=np.uint8, count=n_items
+        )
+
+        n_variants = len(self.variant_columns)
+        counts = np.bincount(discriminators, minlength=NULL_DISCRIMINATOR)
+        if counts[n_variants:NULL_DISCRIMINATOR].any():
+            raise ValueError(
+                'Variant discriminator out of range '
+                '(have {} variants)'.format(n_variants)
+            )
+
+        # Variants follow each other as whole columns sized by the
+        # number of rows of each variant: no per-row values are built.
+        children = [
+            column.read_data(int(count), buf)
+            for column, count in zip(self.variant_columns, counts)
+        ]
+        return ArrowUnionBuffers(
+            discriminators, self.variant_names, children
+        )
+
+
+class ArrowDynamicColumn(ArrowVariantMixin, DynamicColumn):
+    """
+    Variants are known from the state prefix only. SharedVariant values
+    are kept as ``encodeDataType + serializeBinary`` blobs.
+    """
+
+    @property
+    def variant_names(self):
+        return sorted(self.variant_specs + [SHARED_VARIANT_NAME])
+
+
+class ArrowVariantColumn(ArrowVariantMixin, DynamicColumn):
+    def __init__(self, variant_specs, column_by_spec_getter, **kwargs):
+        super(ArrowVariantColumn, self).__init__(
+            column_by_spec_getter, **kwargs
+        )
+        # Global discriminators follow variant type names order.
+        self.variant_specs = sorted(variant_specs)
+        self.variant_names = self.variant_specs
+        self.variant_columns = [
+            column_by_spec_getter(x) for x in self.variant_specs
+        ]
+
+    def read_state_prefix(self, buf):
+        self.discriminators_mode = read_binary_uint64(buf)
+        if self.discriminators_mode not in (
+                VARIANT_MODE_BASIC, VARIANT_MODE_COMPACT):
+            raise NotImplementedError(
+                'Unsupported Variant discriminators mode {}'.format(
+                    self.discriminators_mode
+                )
+            )
+
+        for column in self.variant_columns:
+            column.read_state_prefix(buf)
+
+
+def create_arrow_variant_column(spec, column_by_spec_getter,
+                                column_options):
+    variant_specs = [
+        x.strip() for x in get_inner_columns(get_inner_spec('Variant', spec))
+    ]
+    return ArrowVariantColumn(
+        variant_specs, column_by_spec_getter, **column_options
+    )
+
+
+def create_arrow_dynamic_column(spec, column_by_spec_getter, column_options):
+    return ArrowDynamicColumn(column_by_spec_getter, **column_options)
@@ -70,6 +70,9 @@ class Column(object):
 
     null_value = 0
 
+    # Expands items of columns sent with sparse serialization.
+    sparse_serialization_class = SparseSerialization
+
     # True when ``write_state_prefix`` needs the block's items to emit
     # the prefix (JSON: the path list is data-dependent). Container
     # columns propagate the flag and thread flattened items through so
@@ -187,7 +190,7 @@ class Column(object):
         if self.has_custom_serialization:
             use_custom_serialization = read_varint(buf)
             if use_custom_serialization:
-                self.serialization = SparseSerialization(self)
+                self.serialization = self.sparse_serialization_class(self)
 
     def write_state_prefix(self, buf, items=None):
         pass
@@ -9,11 +9,12 @@ hand-rolling Variant deserialization. The byte layout mirrors
 
 from .base import Column
 from .stringcolumn import ByteString
+from .util import get_inner_columns, get_inner_spec
 from ..reader import (
     read_binary_str,
     read_binary_uint64,
 )
-from ..varint import read_varint
+from ..varint import make_varint, read_varint
 
 
 __all__ = [
@@ -25,6 +26,7 @@ __all__ = [
     'VARIANT_MODE_COMPACT',
     'NULL_DISCRIMINATOR',
     'SHARED_VARIANT_NAME',
+    'encode_type_spec',
 ]
 
 
@@ -281,6 +283,45 @@ _PRIMITIVE_TYPE_NAMES = {
     _TAG_BOOL: "Bool",
 }
 
+_PRIMITIVE_TYPE_TAGS = {
+    name: tag for tag, name in _PRIMITIVE_TYPE_NAMES.items()
+}
+
+
+def _binary_string(text):
+    raw = text.encode('utf-8')
+    return make_varint(len(raw)) + raw
+
+
+def encode_type_spec(spec):
+    """
+    Inverse of ``_decode_type_spec`` for scalar types: ``encodeDataType``
+    bytes of ClickHouse type ``spec``. Used to put values of variants
+    into SharedVariant blobs.
+    """
+    tag = _PRIMITIVE_TYPE_TAGS.get(spec)
+    if tag is not None:
+        return bytes([tag])
+
+    if spec.startswith('FixedString('):
+        return bytes([_TAG_FIXED_STRING]) + make_varint(int(spec[12:-1]))
+
+    if spec.startswith('DateTime('):
+        tz = get_inner_spec('DateTime', spec).strip(" '")
+        return bytes([_TAG_DATETIME_TZ]) + _binary_string(tz)
+
+    if spec.startswith('DateTime64('):
+        params = get_inner_columns(get_inner_spec('DateTime64', spec))
+        scale = make_varint(int(params[0]))
+        if len(params) == 1:
+            return bytes([_TAG_DATETIME64_UTC]) + scale
+
+        tz = params[1].strip(" '")
+        return bytes([_TAG_DATETIME64_TZ]) + scale + _binary_string(tz)
+
+    raise NotImplementedError(
+        "Cannot encode type {} as binary type tag".format(spec))
+
 
 def _decode_type_spec(buf):
     """
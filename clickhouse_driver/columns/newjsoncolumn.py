@@ -70,6 +70,8 @@ class NewJsonColumn(Column):  # pragma: requires-clickhouse-24.8
     # the server expects for nested columns.
     prefix_needs_items = True
 
+    dynamic_column_class = DynamicColumn
+
     def __init__(self, column_by_spec_getter, **kwargs):
         self.column_by_spec_getter = column_by_spec_getter
         self._column_kwargs = kwargs
@@ -123,7 +125,7 @@ class NewJsonColumn(Column):  # pragma: requires-clickhouse-24.8
 
         self.dynamic_columns = []
         for _ in range(num_paths):
-            col = DynamicColumn(
+            col = self.dynamic_column_class(
                 self.column_by_spec_getter,
                 shared_value_decoder=self._shared_value_decoder,
                 **self._column_kwargs)
@@ -1,12 +1,76 @@
 import numpy as np
 import pandas as pd
 
-from ..base import Column
+from ..base import Column, SparseSerialization
+
+
+class NumpySparseSerialization(SparseSerialization):
+    """
+    Puts non-default items between defaults with NumPy: the result
+    keeps the dtype of the column and no per-item Python objects are
+    built for default rows.
+    """
+
+    def read_sparse(self, n_items, buf):
+        rv = super(NumpySparseSerialization, self).read_sparse(n_items, buf)
+        # 1-based positions of non-default items.
+        self.sparse_indexes = np.array(self.sparse_indexes, dtype=np.int64)
+        return rv
+
+    def apply_sparse(self, items):
+        if not isinstance(items, np.ndarray):
+            return super(NumpySparseSerialization, self).apply_sparse(items)
+
+        n_items = self.items_total - 1
+        positions = self.sparse_indexes - 1
+
+        # Zero is the default of every fixed-size dtype: epoch for
+        # datetime64, False, 0 and 0.0 for numbers.
+        if items.dtype == object:
+            rv = np.full(n_items, self.column.null_value, dtype=object)
+        else:
+            rv = np.zeros(n_items, dtype=items.dtype)
+        rv[positions] = items
+
+        if isinstance(items, np.ma.MaskedArray):
+            mask = np.zeros(n_items, dtype=np.bool_)
+            mask[positions] = np.ma.getmaskarray(items)
+            rv = np.ma.MaskedArray(rv, mask=mask)
+
+        return rv
+
+    def apply_sparse_bytes(self, data, item_size, default=None):
+        """
+        Puts non-default fixed-size items of wire ``data`` between
+        defaults: zero bytes or ``default`` wire bytes.
+        """
+        n_items = self.items_total - 1
+        if default is None:
+            rv = np.zeros((n_items, item_size), dtype=np.uint8)
+        else:
+            rv = np.empty((n_items, item_size), dtype=np.uint8)
+            rv[:] = np.frombuffer(default, dtype=np.uint8)
+        rv[self.sparse_indexes - 1] = np.frombuffer(
+            data, dtype=np.uint8
+        ).reshape(-1, item_size)
+        return rv.tobytes()
+
+    def apply_sparse_offsets(self, offsets):
+        """
+        Puts empty strings between non-default strings given by int64
+        ``offsets`` of the Arrow layout. String data is not touched.
+        """
+        offsets = np.frombuffer(offsets, dtype=np.int64)
+        lengths = np.zeros(self.items_total, dtype=np.int64)
+        lengths[self.sparse_indexes] = np.diff(offsets)
+        return np.cumsum(lengths).view(np.uint8)
 
 
 class NumpyColumn(Column):
     dtype = None
 
+    sparse_serialization_class = NumpySparseSerialization
+
     normalize_null_value = True
 
     def read_items(self, n_items, buf):
@@ -14,7 +78,9 @@ class NumpyColumn(Column):
         return np.frombuffer(data, self.dtype.newbyteorder('<'), n_items)
 
     def write_items(self, items, buf):
-        buf.write(items.astype(self.dtype.newbyteorder('<')).tobytes())
+        buf.write(np.ascontiguousarray(
+            items, dtype=self.dtype.newbyteorder('<')
+        ))
 
     def _write_nulls_map(self, items, buf):
         s = self.make_null_struct(len(items))
@@ -41,3 +41,35 @@ class NumpyInt64Column(NumpyColumn):
 class NumpyUInt64Column(NumpyColumn):
     dtype = np.dtype(np.uint64)
     ch_type = 'UInt64'
+
+
+class NumpyLargeIntColumn(NumpyColumn):
+    """
+    Raw little-endian 64-bit words of 128/256-bit integers as a
+    structured array, lowest word first. Used with
+    ``large_ints_as_words`` client setting.
+    """
+
+    def prepare_items(self, items):
+        # Words can't be null: structured arrays are written as is.
+        return items
+
+
+class NumpyInt128Column(NumpyLargeIntColumn):
+    dtype = np.dtype([('w0', '<u8'), ('w1', '<u8')])
+    ch_type = 'Int128'
+
+
+class NumpyUInt128Column(NumpyLargeIntColumn):
+    dtype = np.dtype([('w0', '<u8'), ('w1', '<u8')])
+    ch_type = 'UInt128'
+
+
+class NumpyInt256Column(NumpyLargeIntColumn):
+    dtype = np.dtype([('w{}'.format(i), '<u8') for i in range(4)])
+    ch_type = 'Int256'
+
+
+class NumpyUInt256Column(NumpyLargeIntColumn):
+    dtype = np.dtype([('w{}'.format(i), '<u8') for i in range(4)])
+    ch_type = 'UInt256'
@@ -5,7 +5,9 @@ from .datetimecolumn import create_numpy_datetime_column
 from .floatcolumn import NumpyFloat32Column, NumpyFloat64Column
 from .intcolumn import (
     NumpyInt8Column, NumpyInt16Column, NumpyInt32Column, NumpyInt64Column,
-    NumpyUInt8Column, NumpyUInt16Column, NumpyUInt32Column, NumpyUInt64Column
+    NumpyUInt8Column, NumpyUInt16Column, NumpyUInt32Column, NumpyUInt64Column,
+    NumpyInt128Column, NumpyUInt128Column, NumpyInt256Column,
+    NumpyUInt256Column
 )
 from .boolcolumn import NumpyBoolColumn
 from .lowcardinalitycolumn import create_numpy_low_cardinality_column
@@ -21,6 +23,12 @@ column_by_type = {c.ch_type: c for c in [
     NumpyBoolColumn
 ]}
 
+# Used with large_ints_as_words only: Python ints otherwise.
+large_int_column_by_type = {c.ch_type: c for c in [
+    NumpyInt128Column, NumpyUInt128Column, NumpyInt256Column,
+    NumpyUInt256Column
+]}
+
 
 def get_numpy_column_by_spec(spec, column_options):
     def create_column_with_options(x):
@@ -55,4 +63,10 @@ def get_numpy_column_by_spec(spec, column_options):
             cls = column_by_type[spec]
             return cls(**column_options)
 
+        client_settings = column_options['context'].client_settings
+        if client_settings.get('large_ints_as_words') and \
+                spec in large_int_column_by_type:
+            cls = large_int_column_by_type[spec]
+            return cls(**column_options)
+
         raise errors.UnknownTypeError('Unknown type {}'.format(spec))
@@ -171,12 +171,13 @@ def read_column(context, column_spec, n_items, buf, use_numpy=None,
 
 
 def write_column(context, column_name, column_spec, items, buf,
-                 types_check=False):
+                 types_check=False, use_numpy=None):
     column_options = {
         'context': context,
         'types_check': types_check
     }
-    column = get_column_by_spec(column_spec, column_options)
+    column = get_column_by_spec(column_spec, column_options,
+                                use_numpy=use_numpy)
 
     try:
         column.write_state_prefix(buf, items)
@@ -37,9 +37,11 @@ class BaseCompressor(object):
         raise NotImplementedError
 
     def get_compressed_data(self, extra_header_size):
+        return self.get_compressed_frame(self.get_value(), extra_header_size)
+
+    def get_compressed_frame(self, data, extra_header_size):
         rv = BytesIO()
 
-        data = self.get_value()
         compressed = self.compress_data(data)
 
         header_size = extra_header_size + 4 + 4  # sizes
@@ -9,7 +9,8 @@ class Compressor(BaseCompressor):
     method_byte = CompressionMethodByte.ZSTD
 
     def compress_data(self, data):
-        return zstd.compress(data)
+        # Frames are memoryview slices: zstd accepts only bytes.
+        return zstd.compress(bytes(data))
 
 
 class Decompressor(BaseDecompressor):
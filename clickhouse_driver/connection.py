@@ -108,6 +108,10 @@ class Connection(object):
                                  Defaults to ``5`` seconds.
     :param compress_block_size: size of compressed block to send.
                                 Defaults to ``1048576``.
+    :param compress_threads: number of threads compressing blocks of
+                             ``compress_block_size`` bytes of sent data.
+                             Defaults to ``0`` (compress data as a whole
+                             on the sending thread).
     :param compression: specifies whether or not use compression.
                         Defaults to ``False``. Possible choices:
 
@@ -164,6 +168,7 @@ class Connection(object):
             send_receive_timeout=defines.DBMS_DEFAULT_TIMEOUT_SEC,
             sync_request_timeout=defines.DBMS_DEFAULT_SYNC_REQUEST_TIMEOUT_SEC,
             compress_block_size=defines.DEFAULT_COMPRESS_BLOCK_SIZE,
+            compress_threads=0,
             compression=False,
             secure=False,
             # Secure socket parameters.
@@ -235,10 +240,12 @@ class Connection(object):
             self.compression = Compression.DISABLED
             self.compressor_cls = None
             self.compress_block_size = None
+            self.compress_threads = 0
         else:
             self.compression = Compression.ENABLED
             self.compressor_cls = get_compressor_cls(compression)
             self.compress_block_size = compress_block_size
+            self.compress_threads = compress_threads
 
         self.socket = None
         self.fin = None
@@ -487,6 +494,9 @@ class Connection(object):
         elif self.socket:
             self.socket.close()
 
+        if self.block_out is not None:
+            self.block_out.close()
+
         self.reset_state()
 
     def send_hello(self):
@@ -677,7 +687,8 @@ class Connection(object):
 
             return CompressedBlockOutputStream(
                 self.compressor_cls, self.compress_block_size,
-                self.fout, self.context
+                self.fout, self.context,
+                compress_threads=self.compress_threads
             )
         else:
             return BlockOutputStream(self.fout, self.context)
@@ -717,7 +728,26 @@ class Connection(object):
         if revision >= defines.DBMS_MIN_REVISION_WITH_TEMPORARY_TABLES:
             write_binary_str(table_name, self.fout)
 
-        self.block_out.write(block)
+        size = self.block_out.write(block)
+        logger.debug('Block "%s" send time: %f', table_name, time() - start)
+        return size
+
+    def serialize_data(self, block):
+        """
+        Serializes data ``block`` in memory for ``send_serialized_data``.
+        Returns serialized block and its size in bytes.
+        """
+        return self.block_out.serialize(block)
+
+    def send_serialized_data(self, serialized, table_name=''):
+        start = time()
+        write_varint(ClientPacketTypes.DATA, self.fout)
+
+        revision = self.server_info.used_revision
+        if revision >= defines.DBMS_MIN_REVISION_WITH_TEMPORARY_TABLES:
+            write_binary_str(table_name, self.fout)
+
+        self.block_out.write_serialized(serialized)
         logger.debug('Block "%s" send time: %f', table_name, time() - start)
 
     def send_query(self, query, query_id=None, params=None):
@@ -0,0 +1,70 @@
+from queue import Queue
+from threading import Thread
+
+
+class InsertPipeline(object):
+    """
+    Sends data blocks of ``INSERT`` query from a background thread.
+
+    Blocks are serialized on the calling thread and queued, at most
+    ``depth`` of them. The sender thread compresses and writes them into
+    the socket and receives profile events of each block while the next
+    one is sent. Errors of the sender thread are raised on the calling
+    thread by the next ``send`` or by ``check``.
+    """
+
+    def __init__(self, client, depth):
+        self.client = client
+        self.connection = client.connection
+        self.queue = Queue(depth)
+        self.error = None
+
+        self.thread = Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+        super(InsertPipeline, self).__init__()
+
+    def send(self, block):
+        """
+        Queues ``block``. Returns size of serialized block in bytes.
+        """
+        self.check()
+        serialized, size = self.connection.serialize_data(block)
+        self.queue.put(serialized)
+        return size
+
+    def stop(self):
+        self.queue.put(None)
+        self.thread.join()
+
+    def check(self):
+        if self.error is not None:
+            raise self.error
+
+    def _run(self):
+        # Profile events of a block are received after the next block is
+        # sent: server has time to process the block meanwhile.
+        pending_events = False
+        serialized = True
+
+        try:
+            while True:
+                serialized = self.queue.get()
+                if serialized is None:
+                    break
+
+                self.connection.send_serialized_data(serialized)
+
+                if pending_events:
+                    self.client.receive_profile_events()
+                pending_events = True
+
+            if pending_events:
+                self.client.receive_profile_events()
+
+        except BaseException as e:
+            self.error = e
+
+            # Calling thread may be waiting for free space in the queue.
+            while serialized is not None:
+                serialized = self.queue.get()
@@ -26,3 +26,30 @@ def column_chunks(columns, n):
         if not any(len(x) for x in item):
             break
         yield item
+
+
+def sized_column_chunks(columns, sizer):
+    for column in columns:
+        if not isinstance(
+            column, (np.ndarray, pd.DatetimeIndex, ExtensionArray)
+        ):
+            raise TypeError(
+                'Unsupported column type: {}. '
+                'ndarray/DatetimeIndex/ExtensionArray is expected.'
+                .format(type(column))
+            )
+
+    # Row width of fixed-size columns is known from their dtypes.
+    n_rows = max((len(c) for c in columns), default=0)
+    fixed_size = all(c.dtype.kind != 'O' for c in columns)
+    if sizer.row_bytes is None and n_rows and fixed_size:
+        sizer.update(n_rows, sum(c.nbytes for c in columns))
+
+    i = 0
+    while True:
+        n = sizer.next_size()
+        item = [c[i:i + n] for c in columns]
+        if not any(len(x) for x in item):
+            break
+        yield item
+        i += n
@@ -1,3 +1,6 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from io import BytesIO
 
 try:
@@ -17,9 +20,12 @@ from ..writer import write_binary_uint8, write_binary_uint128
 
 
 class CompressedBlockOutputStream(BlockOutputStream):
-    def __init__(self, compressor_cls, compress_block_size, fout, context):
+    def __init__(self, compressor_cls, compress_block_size, fout, context,
+                 compress_threads=0):
         self.compressor_cls = compressor_cls
         self.compress_block_size = compress_block_size
+        self.compress_threads = compress_threads
+        self.executor = None
         self.raw_fout = fout
 
         self.compressor = self.compressor_cls()
@@ -29,34 +35,84 @@ class CompressedBlockOutputStream(BlockOutputStream):
     def get_compressed_hash(self, data):
         return CityHash128(data)
 
+    def serialize(self, block):
+        # Uncompressed data in its own compressor: it is compressed by
+        # write_serialized.
+        compressor = self.compressor_cls()
+        fout = CompressedBufferedWriter(compressor, BUFFER_SIZE)
+        size = self.write_block(block, fout)
+        fout.flush()
+        return compressor, size
+
+    def write_serialized(self, compressor):
+        self.write_compressed(compressor)
+
     def finalize(self):
         self.fout.flush()
+        self.write_compressed(self.compressor)
+
+    def write_compressed(self, compressor):
+        data = compressor.get_value()
+        compress = partial(self.get_compressed_frame, compressor)
+
+        if self.compress_threads > 1 and len(data) > self.compress_block_size:
+            compressed_frames = self.compress_in_parallel(
+                compress, memoryview(data)
+            )
+        else:
+            # Data is compressed as one block on the sending thread.
+            compressed_frames = [compress(data)]
 
-        compressed = self.get_compressed()
-        compressed_size = len(compressed)
+        for compressed_hash, compressed in compressed_frames:
+            write_binary_uint128(compressed_hash, self.raw_fout)
+            self.raw_fout.write(compressed)
 
-        compressed_hash = self.get_compressed_hash(compressed)
-        write_binary_uint128(compressed_hash, self.raw_fout)
+        self.raw_fout.flush()
+
+    def compress_in_parallel(self, compress, data):
+        """
+        Yields independently compressed blocks of at most
+        ``compress_block_size`` bytes of ``data`` in order. Blocks are
+        compressed in the thread pool, at most two per thread ahead of
+        the yielded one: compressed data of the whole block is not kept
+        in memory at once.
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.compress_threads)
 
         block_size = self.compress_block_size
+        window = 2 * self.compress_threads
+        pending = deque()
 
-        i = 0
-        while i < compressed_size:
-            self.raw_fout.write(compressed[i:i + block_size])
-            i += block_size
+        for i in range(0, len(data), block_size):
+            if len(pending) == window:
+                yield pending.popleft().result()
+            pending.append(
+                self.executor.submit(compress, data[i:i + block_size])
+            )
 
-        self.raw_fout.flush()
+        while pending:
+            yield pending.popleft().result()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def get_compressed_frame(self, compressor, data):
+        compressed = self.get_compressed(compressor, data)
+        return self.get_compressed_hash(compressed), compressed
 
-    def get_compressed(self):
+    def get_compressed(self, compressor, data):
         compressed = BytesIO()
 
-        if self.compressor.method_byte is not None:
-            write_binary_uint8(self.compressor.method_byte, compressed)
+        if compressor.method_byte is not None:
+            write_binary_uint8(compressor.method_byte, compressed)
             extra_header_size = 1  # method
         else:
             extra_header_size = 0
 
-        data = self.compressor.get_compressed_data(extra_header_size)
+        data = compressor.get_compressed_frame(data, extra_header_size)
         compressed.write(data)
 
         return compressed.getvalue()
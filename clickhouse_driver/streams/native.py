@@ -1,7 +1,10 @@
 import logging
+from io import BytesIO
 
 from ..block import ColumnOrientedBlock, BlockInfo
-from ..columns.service import read_column, write_column
+from ..bufferedwriter import BufferedMemoryWriter
+from ..columns.service import read_column
+from ..defines import BUFFER_SIZE
 from ..reader import read_binary_str, read_binary_uint8
 from ..varint import write_varint, read_varint
 from ..writer import write_binary_str, write_binary_uint8
@@ -18,20 +21,46 @@ class BlockOutputStream(object):
         super(BlockOutputStream, self).__init__()
 
     def write(self, block):
+        """
+        Writes ``block``. Returns size of serialized block in bytes.
+        """
+        size = self.write_block(block, self.fout)
+        self.finalize()
+        return size
+
+    def serialize(self, block):
+        """
+        Writes ``block`` into memory. Returns serialized block sent by
+        ``write_serialized``, possibly from another thread, and its size
+        in bytes.
+        """
+        data = BytesIO()
+        fout = BufferedMemoryWriter(data, BUFFER_SIZE)
+        size = self.write_block(block, fout)
+        fout.flush()
+        return data, size
+
+    def write_serialized(self, data):
+        self.fout.write(data.getbuffer())
+        self.finalize()
+
+    def write_block(self, block, fout):
+        start = fout.tell()
+
         revision = self.context.server_info.used_revision
         if revision >= defines.DBMS_MIN_REVISION_WITH_BLOCK_INFO:
-            block.info.write(self.fout)
+            block.info.write(fout)
 
         # We write transposed data.
         n_columns = block.num_columns
         n_rows = block.num_rows
 
-        write_varint(n_columns, self.fout)
-        write_varint(n_rows, self.fout)
+        write_varint(n_columns, fout)
+        write_varint(n_rows, fout)
 
         for i, (col_name, col_type) in enumerate(block.columns_with_types):
-            write_binary_str(col_name, self.fout)
-            write_binary_str(col_type, self.fout)
+            write_binary_str(col_name, fout)
+            write_binary_str(col_type, fout)
 
             if n_columns:
                 try:
@@ -42,17 +71,23 @@ class BlockOutputStream(object):
                 if revision >= \
                         defines.DBMS_MIN_REVISION_WITH_CUSTOM_SERIALIZATION:
                     # We write always sparse data without custom serialization.
-                    write_binary_uint8(0, self.fout)
+                    write_binary_uint8(0, fout)
 
                 logger.debug('Writing column %s', col_name)
-                write_column(self.context, col_name, col_type, items,
-                             self.fout, types_check=block.types_check)
+                block.write_column(
+                    self.context, col_name, col_type, items, fout
+                )
 
-        self.finalize()
+        return fout.tell() - start
 
     def finalize(self):
         self.fout.flush()
 
+    def close(self):
+        """
+        Frees resources of the stream when the connection is closed.
+        """
+
 
 class BlockInputStream(object):
     def __init__(self, fin, context):
@@ -46,6 +46,72 @@ def column_chunks(columns, n):
         yield item
 
 
+# Rows of the first block when row width is not known beforehand.
+PROBE_BLOCK_ROWS = 100
+
+
+class BlockSizer(object):
+    """
+    Number of rows of the next insert block: ``block_bytes`` divided by
+    serialized row width of the previous block, at most ``max_rows``.
+    ``row_bytes`` is row width estimate before the first block.
+    """
+
+    def __init__(self, block_bytes, max_rows, row_bytes=None):
+        self.block_bytes = block_bytes
+        self.max_rows = max_rows
+        self.row_bytes = row_bytes
+
+        super(BlockSizer, self).__init__()
+
+    def next_size(self):
+        if not self.row_bytes:
+            return min(PROBE_BLOCK_ROWS, self.max_rows)
+
+        n_rows = int(self.block_bytes // self.row_bytes)
+        return max(1, min(n_rows, self.max_rows))
+
+    def update(self, n_rows, n_bytes):
+        if n_rows:
+            self.row_bytes = n_bytes / n_rows
+
+
+def sized_chunks(seq, sizer):
+    # Size of the next chunk is taken after the previous one is sent.
+    if isinstance(seq, (list, tuple)):
+        i = 0
+        item = seq[i:i + sizer.next_size()]
+        while item:
+            yield list(item)
+            i += len(item)
+            item = seq[i:i + sizer.next_size()]
+
+    else:
+        it = iter(seq)
+        item = list(islice(it, sizer.next_size()))
+        while item:
+            yield item
+            item = list(islice(it, sizer.next_size()))
+
+
+def sized_column_chunks(columns, sizer):
+    for column in columns:
+        if not isinstance(column, (list, tuple)):
+            raise TypeError(
+                'Unsupported column type: {}. list or tuple is expected.'
+                .format(type(column))
+            )
+
+    i = 0
+    while True:
+        n = sizer.next_size()
+        item = [list(column[i:i + n]) for column in columns]
+        if not any(item):
+            break
+        yield item
+        i += n
+
+
 # from paste.deploy.converters
 def asbool(obj):
     if isinstance(obj, str):
@@ -123,7 +189,7 @@ def parse_url(url):
         elif name == 'secure':
             kwargs[name] = asbool(value)
 
-        elif name == 'use_numpy':
+        elif name in ('use_numpy', 'large_ints_as_words'):
             settings[name] = asbool(value)
 
         elif name == 'round_robin':
@@ -135,7 +201,7 @@ def parse_url(url):
         elif name in timeouts:
             kwargs[name] = float(value)
 
-        elif name == 'compress_block_size':
+        elif name in ('compress_block_size', 'compress_threads'):
             kwargs[name] = int(value)
 
         elif name == 'settings_is_important':
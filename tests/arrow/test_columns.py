@@ -0,0 +1,960 @@
+import struct
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from ipaddress import IPv4Address, IPv6Address
+from unittest.mock import patch
+from io import BytesIO
+from uuid import UUID
+
+try:
+    import numpy as np
+    import pyarrow as pa
+
+    from clickhouse_driver.arrow import mapping
+    from clickhouse_driver.arrow.convert import (
+        _arrays_to_batches, _column_to_array
+    )
+except ImportError:
+    pa = None
+
+from clickhouse_driver.columns.service import read_column
+from clickhouse_driver.varint import write_varint
+from tests.arrow.testcase import ArrowColumnTestCase
+
+
+class ArrayColumnTestCase(ArrowColumnTestCase):
+    def test_array_of_ints(self):
+        array = self.to_arrow('Array(UInt32)', [[1, 2, 3], [], [4]])
+
+        self.assertEqual(array.type, pa.list_(pa.uint32()))
+        self.assertEqual(array.to_pylist(), [[1, 2, 3], [], [4]])
+
+    def test_array_is_not_read_into_python_lists(self):
+        data = self.serialize('Array(UInt32)', [[1, 2], [3]])
+        column = self.read_arrow_column('Array(UInt32)', data, 2)
+
+        self.assertEqual(list(column.offsets), [0, 2, 3])
+        self.assertEqual(list(column.values), [1, 2, 3])
+
+    def test_nested_arrays(self):
+        data = [[[1, 2], [3]], [[]], [], [[4]]]
+        array = self.to_arrow('Array(Array(Int32))', data)
+
+        self.assertEqual(array.type, pa.list_(pa.list_(pa.int32())))
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_array_of_nullable(self):
+        data = [[1, None], [], [None, 3]]
+        array = self.to_arrow('Array(Nullable(Int64))', data)
+
+        self.assertEqual(array.to_pylist(), data)
+        self.assertEqual(array.values.null_count, 2)
+
+    def test_nested_array_of_nullable_strings(self):
+        data = [[['a', None], []], [], [['привет']]]
+        array = self.to_arrow('Array(Array(Nullable(String)))', data)
+
+        self.assertEqual(array.type, pa.list_(pa.list_(pa.string())))
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_array_of_low_cardinality(self):
+        data = [['a', 'b', 'a'], []]
+        array = self.to_arrow('Array(LowCardinality(String))', data)
+
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_all_empty_arrays(self):
+        array = self.to_arrow('Array(Array(UInt8))', [[], []])
+
+        self.assertEqual(array.to_pylist(), [[], []])
+
+    def test_declared_large_list(self):
+        array = self.to_arrow(
+            'Array(UInt8)', [[1], [2, 3]],
+            type_=pa.large_list(pa.uint8())
+        )
+
+        self.assertEqual(array.type, pa.large_list(pa.uint8()))
+        self.assertEqual(array.to_pylist(), [[1], [2, 3]])
+
+
+class MapColumnTestCase(ArrowColumnTestCase):
+    def test_map(self):
+        array = self.to_arrow(
+            'Map(String, UInt64)', [{'a': 1, 'b': 2}, {}, {'c': 3}]
+        )
+
+        self.assertEqual(array.type, pa.map_(pa.string(), pa.uint64()))
+        self.assertEqual(
+            array.to_pylist(), [[('a', 1), ('b', 2)], [], [('c', 3)]]
+        )
+
+    def test_map_is_not_read_into_dicts(self):
+        data = self.serialize('Map(String, UInt64)', [{'a': 1}, {'b': 2}])
+        column = self.read_arrow_column('Map(String, UInt64)', data, 2)
+
+        self.assertEqual(list(column.offsets), [0, 1, 2])
+        self.assertEqual(list(column.values), [1, 2])
+
+    def test_map_low_cardinality_keys(self):
+        data = [{'x': 1.5, 'y': 2.5}, {'x': 0.5}]
+        array = self.to_arrow('Map(LowCardinality(String), Float64)', data)
+
+        self.assertEqual(array.type, pa.map_(pa.string(), pa.float64()))
+        self.assertEqual(
+            array.to_pylist(), [[('x', 1.5), ('y', 2.5)], [('x', 0.5)]]
+        )
+
+    def test_map_nullable_values(self):
+        array = self.to_arrow(
+            'Map(String, Nullable(Int32))', [{'a': None, 'b': 1}]
+        )
+
+        self.assertEqual(array.to_pylist(), [[('a', None), ('b', 1)]])
+
+    def test_map_array_values(self):
+        data = [{'a': [1, 2]}, {}, {'b': []}]
+        array = self.to_arrow('Map(String, Array(UInt8))', data)
+
+        self.assertEqual(
+            array.to_pylist(), [[('a', [1, 2])], [], [('b', [])]]
+        )
+
+    def test_array_of_maps(self):
+        array = self.to_arrow(
+            'Array(Map(String, UInt8))', [[{'a': 1}, {}], []]
+        )
+
+        self.assertEqual(array.to_pylist(), [[[('a', 1)], []], []])
+
+
+class TupleColumnTestCase(ArrowColumnTestCase):
+    def test_unnamed_tuple(self):
+        array = self.to_arrow('Tuple(UInt8, String)', [(1, 'a'), (2, 'b')])
+
+        self.assertEqual(
+            array.type, pa.struct([('1', pa.uint8()), ('2', pa.string())])
+        )
+        self.assertEqual(
+            array.to_pylist(), [{'1': 1, '2': 'a'}, {'1': 2, '2': 'b'}]
+        )
+
+    def test_tuple_is_not_read_into_python_tuples(self):
+        data = self.serialize('Tuple(a UInt8, b Float32)', [(1, 0.5)])
+        column = self.read_arrow_column('Tuple(a UInt8, b Float32)', data, 1)
+
+        self.assertEqual(column.names, ('a', 'b'))
+        self.assertEqual(list(column.columns[0]), [1])
+        self.assertEqual(list(column.columns[1]), [0.5])
+
+    def test_named_nested_tuple(self):
+        spec = 'Tuple(a Nullable(String), b Tuple(c Int32, d String))'
+        array = self.to_arrow(spec, [(None, (1, 'x')), ('y', (2, ''))])
+
+        self.assertEqual(array.to_pylist(), [
+            {'a': None, 'b': {'c': 1, 'd': 'x'}},
+            {'a': 'y', 'b': {'c': 2, 'd': ''}}
+        ])
+
+    def test_array_of_tuples(self):
+        data = [[(1, 'a'), (2, 'b')], []]
+        array = self.to_arrow('Array(Tuple(x UInt16, y String))', data)
+
+        self.assertEqual(array.type, pa.list_(
+            pa.struct([('x', pa.uint16()), ('y', pa.string())])
+        ))
+        self.assertEqual(array.to_pylist(), [
+            [{'x': 1, 'y': 'a'}, {'x': 2, 'y': 'b'}], []
+        ])
+
+    def test_nested(self):
+        data = [[(1, 'a')], [], [(2, 'b'), (3, 'c')]]
+        array = self.to_arrow('Nested(x UInt8, y String)', data)
+
+        self.assertEqual(array.type, pa.list_(
+            pa.struct([('x', pa.uint8()), ('y', pa.string())])
+        ))
+        self.assertEqual(array.to_pylist()[2], [
+            {'x': 2, 'y': 'b'}, {'x': 3, 'y': 'c'}
+        ])
+
+    def test_declared_field_names(self):
+        type_ = pa.struct([('first', pa.int64()), ('second', pa.string())])
+        array = self.to_arrow('Tuple(UInt8, String)', [(1, 'a')], type_=type_)
+
+        self.assertEqual(array.type, type_)
+        self.assertEqual(array.to_pylist(), [{'first': 1, 'second': 'a'}])
+
+
+class LowCardinalityColumnTestCase(ArrowColumnTestCase):
+    def test_low_cardinality_is_decoded(self):
+        data = ['a', 'b', 'a', 'c']
+        array = self.to_arrow('LowCardinality(String)', data)
+
+        self.assertEqual(array.type, pa.string())
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_low_cardinality_is_not_read_into_python_strings(self):
+        data = self.serialize('LowCardinality(String)', ['a', 'b', 'a'])
+        column = self.read_arrow_column('LowCardinality(String)', data, 3)
+
+        self.assertEqual(column.keys.dtype.itemsize, 1)
+        self.assertEqual(list(column.keys), [0, 1, 0])
+        self.assertEqual(bytes(column.index.data), b'ab')
+
+    def test_nullable_low_cardinality(self):
+        data = ['a', None, '', 'a']
+        array = self.to_arrow('LowCardinality(Nullable(String))', data)
+
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_declared_dictionary(self):
+        type_ = pa.dictionary(pa.int32(), pa.string())
+        data = ['a', None, 'b', 'a']
+        array = self.to_arrow(
+            'LowCardinality(Nullable(String))', data, type_=type_
+        )
+
+        self.assertEqual(array.type, type_)
+        self.assertEqual(array.to_pylist(), data)
+        self.assertEqual(array.dictionary.to_pylist(), ['a', 'b'])
+
+    def test_wide_keys(self):
+        data = [str(i) for i in range(300)]
+        array = self.to_arrow(
+            'LowCardinality(String)', data,
+            type_=pa.dictionary(pa.int16(), pa.string())
+        )
+
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_low_cardinality_numbers(self):
+        array = self.to_arrow('LowCardinality(UInt32)', [7, 7, 9])
+
+        self.assertEqual(array.type, pa.uint32())
+        self.assertEqual(array.to_pylist(), [7, 7, 9])
+
+
+class FixedStringColumnTestCase(ArrowColumnTestCase):
+    def test_fixed_string_is_trimmed(self):
+        data = ['abc', 'a', '', 'a\x00b']
+        array = self.to_arrow('FixedString(3)', data)
+
+        self.assertEqual(array.type, pa.string())
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_fixed_string_is_read_as_one_buffer(self):
+        data = self.serialize('FixedString(2)', ['ab', 'c'])
+        column = self.read_arrow_column('FixedString(2)', data, 2)
+
+        self.assertEqual(column.length, 2)
+        self.assertEqual(bytes(column.data), b'abc\x00')
+
+    def test_nullable_fixed_string(self):
+        data = ['ab', None, 'c']
+        array = self.to_arrow('Nullable(FixedString(2))', data)
+
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_unicode_fixed_string(self):
+        data = ['привет', 'мир']
+        array = self.to_arrow('FixedString(12)', data)
+
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_fixed_string_as_bytes(self):
+        data = [b'ab', b'c\x00']
+        array = self.to_arrow(
+            'FixedString(2)', data, type_=pa.binary(2), strings_as_bytes=True
+        )
+
+        self.assertEqual(array.type, pa.binary(2))
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_fixed_string_as_variable_bytes_keeps_padding(self):
+        array = self.to_arrow(
+            'FixedString(2)', [b'a'], type_=pa.binary(),
+            strings_as_bytes=True
+        )
+
+        self.assertEqual(array.to_pylist(), [b'a\x00'])
+
+    def test_low_cardinality_fixed_string(self):
+        data = ['ab', 'c', 'ab']
+        array = self.to_arrow('LowCardinality(FixedString(2))', data)
+
+        self.assertEqual(array.to_pylist(), data)
+
+
+class DateColumnTestCase(ArrowColumnTestCase):
+    def test_date(self):
+        data = [date(1970, 1, 2), date(2024, 2, 29)]
+        array = self.to_arrow('Date', data)
+
+        self.assertEqual(array.type, pa.date32())
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_date32_is_read_as_days(self):
+        data = [date(1925, 1, 2), date(2024, 2, 29)]
+        column = self.read_arrow_column(
+            'Date32', self.serialize('Date32', data), 2
+        )
+        self.assertEqual(list(column), [-16435, 19782])
+
+        array = self.to_arrow('Date32', data)
+        self.assertEqual(array.type, pa.date32())
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_nullable_date32(self):
+        data = [date(1925, 1, 2), None]
+        array = self.to_arrow('Nullable(Date32)', data)
+
+        self.assertEqual(array.to_pylist(), data)
+
+
+class DateTimeColumnTestCase(ArrowColumnTestCase):
+    def make_context(self, **client_settings):
+        context = super(DateTimeColumnTestCase, self).make_context(
+            **client_settings
+        )
+        context.settings = {'use_client_time_zone': True}
+        return context
+
+    def test_timezone(self):
+        data = [datetime(2024, 1, 1, 12, 30, 45, tzinfo=timezone.utc)]
+        spec = "DateTime('Europe/Berlin')"
+        column = self.read_arrow_column(spec, self.serialize(spec, data), 1)
+        self.assertEqual(column.timezone, 'Europe/Berlin')
+        self.assertEqual(list(column.values), [1704112245])
+
+        array = self.to_arrow(spec, data)
+        self.assertEqual(array.type, pa.timestamp('s', tz='Europe/Berlin'))
+        self.assertEqual(array.to_pylist(), data)
+
+    @patch(
+        'clickhouse_driver.columns.numpy.datetimecolumn.'
+        'get_localzone_name_compat', lambda: 'Europe/Berlin'
+    )
+    def test_naive_local_time(self):
+        data = [
+            datetime(2024, 1, 1, 11, tzinfo=timezone.utc),
+            datetime(2024, 7, 1, 10, tzinfo=timezone.utc),
+            None
+        ]
+        local = [datetime(2024, 1, 1, 12), datetime(2024, 7, 1, 12), None]
+
+        for spec, type_ in [('DateTime', pa.timestamp('s')),
+                            ('DateTime64(3)', pa.timestamp('ms'))]:
+            spec = 'Nullable({})'.format(spec)
+            array = self.to_arrow(spec, data)
+
+            self.assertEqual(array.type, type_)
+            self.assertEqual(array.to_pylist(), local)
+
+            # Declared timezone: no conversion.
+            array = self.to_arrow(
+                spec, data, type_=pa.timestamp('s', tz='UTC')
+            )
+            self.assertEqual(array.to_pylist(), data)
+
+    def test_datetime64_scale(self):
+        data = [datetime(2024, 1, 1, 12, 30, 45, 120000, timezone.utc)]
+
+        for spec, type_ in [
+                ("DateTime64(2, 'UTC')", pa.timestamp('ms', tz='UTC')),
+                ("DateTime64(6, 'UTC')", pa.timestamp('us', tz='UTC'))]:
+            array = self.to_arrow(spec, data)
+
+            self.assertEqual(array.type, type_)
+            self.assertEqual(array.to_pylist(), data)
+
+
+class IntervalColumnTestCase(ArrowColumnTestCase):
+    def test_durations(self):
+        array = self.to_arrow('IntervalMinute', [1, 2])
+
+        self.assertEqual(array.type, pa.duration('s'))
+        self.assertEqual(
+            array.to_pylist(), [timedelta(minutes=1), timedelta(minutes=2)]
+        )
+
+    def test_calendar_intervals(self):
+        array = self.to_arrow('IntervalWeek', [1, 2])
+        self.assertEqual(array.type, pa.month_day_nano_interval())
+        self.assertEqual(
+            [(x.months, x.days) for x in array.to_pylist()], [(0, 7), (0, 14)]
+        )
+
+        array = self.to_arrow('Nullable(IntervalYear)', [1, None])
+        self.assertEqual(
+            [x and (x.months, x.days) for x in array.to_pylist()],
+            [(12, 0), None]
+        )
+
+    def test_declared_integer(self):
+        array = self.to_arrow('IntervalHour', [1, 2], type_=pa.int64())
+
+        self.assertEqual(array.to_pylist(), [1, 2])
+
+
+class DecimalColumnTestCase(ArrowColumnTestCase):
+    def check(self, spec, data, type_):
+        array = self.to_arrow(spec, data)
+
+        self.assertEqual(array.type, type_)
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_decimal32(self):
+        self.check(
+            'Decimal(9, 2)',
+            [Decimal('1.25'), Decimal('-1.25'), Decimal('9999999.99')],
+            pa.decimal128(9, 2)
+        )
+
+    def test_decimal64(self):
+        self.check(
+            'Decimal(18, 4)',
+            [Decimal('-99999999999999.9999'), Decimal('0.0001'), Decimal(0)],
+            pa.decimal128(18, 4)
+        )
+
+    def test_decimal128(self):
+        self.check(
+            'Decimal(38, 10)',
+            [Decimal('-1234567890123456789012345678.9012345678'),
+             Decimal('1.5')],
+            pa.decimal128(38, 10)
+        )
+
+    def test_decimal256(self):
+        self.check(
+            'Decimal(76, 20)',
+            [Decimal('-' + '9' * 56 + '.' + '1' * 20), Decimal('2.5')],
+            pa.decimal256(76, 20)
+        )
+
+    def test_decimal_is_not_read_into_python_decimals(self):
+        data = self.serialize('Decimal(18, 4)', [Decimal('1.5')])
+        column = self.read_arrow_column('Decimal(18, 4)', data, 1)
+
+        self.assertEqual(column.item_size, 8)
+        self.assertEqual(bytes(column.data), (15000).to_bytes(8, 'little'))
+
+    def test_nullable_decimal(self):
+        data = [Decimal('1.5'), None, Decimal('-2.5')]
+        array = self.to_arrow('Nullable(Decimal(9, 1))', data)
+
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_declared_type(self):
+        array = self.to_arrow(
+            'Decimal(9, 2)', [Decimal('1.25')], type_=pa.float64()
+        )
+
+        self.assertEqual(array.to_pylist(), [1.25])
+
+
+class LargeIntColumnTestCase(ArrowColumnTestCase):
+    def to_words(self, spec, data, **kwargs):
+        return self.to_arrow(spec, data, large_ints_as_words=True, **kwargs)
+
+    def test_raw_words(self):
+        data = [1, -2, 2 ** 100]
+        array = self.to_words('Int128', data)
+
+        self.assertEqual(array.type, pa.binary(16))
+        self.assertEqual(array.to_pylist(), [
+            x.to_bytes(16, 'little', signed=True) for x in data
+        ])
+
+    def test_raw_words_256(self):
+        data = [2 ** 255, 0]
+        array = self.to_words('UInt256', data)
+
+        self.assertEqual(array.type, pa.binary(32))
+        self.assertEqual(array.to_pylist(), [
+            x.to_bytes(32, 'little') for x in data
+        ])
+
+    def test_is_not_read_into_python_ints(self):
+        data = self.serialize('UInt128', [5])
+        column = self.read_arrow_column(
+            'UInt128', data, 1, large_ints_as_words=True
+        )
+
+        self.assertEqual(column.item_size, 16)
+        self.assertEqual(bytes(column.data), (5).to_bytes(16, 'little'))
+
+    def test_nullable(self):
+        array = self.to_words('Nullable(Int256)', [None, -1])
+
+        self.assertEqual(array.to_pylist(), [None, b'\xff' * 32])
+
+    def test_declared_decimal(self):
+        for spec in ['Int128', 'Int256']:
+            data = [10 ** 38 - 1, -(10 ** 38 - 1), -1, 0]
+            array = self.to_words(spec, data, type_=pa.decimal128(38, 0))
+
+            self.assertEqual(array.to_pylist(), [Decimal(x) for x in data])
+
+    def test_declared_decimal_nullable(self):
+        array = self.to_words(
+            'Nullable(UInt128)', [None, 7], type_=pa.decimal128(38, 0)
+        )
+
+        self.assertEqual(array.to_pylist(), [None, Decimal(7)])
+
+    def test_declared_decimal_overflow(self):
+        for spec, value in [('Int128', 10 ** 38), ('Int128', -10 ** 38),
+                            ('UInt128', 2 ** 127), ('Int256', 2 ** 200),
+                            ('Int256', -2 ** 128)]:
+            with self.assertRaises(ValueError):
+                self.to_words(spec, [value], type_=pa.decimal128(38, 0))
+
+    def test_python_ints_without_setting(self):
+        array = self.to_arrow('Int128', [2 ** 40, -1])
+
+        self.assertEqual(array.to_pylist(), [2 ** 40, -1])
+
+
+class AddressColumnTestCase(ArrowColumnTestCase):
+    uid = UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d')
+
+    def test_uuid(self):
+        array = self.to_arrow('UUID', [self.uid])
+
+        self.assertEqual(array.type, pa.binary(16))
+        self.assertEqual(array.to_pylist(), [self.uid.bytes])
+
+    def test_uuid_as_text(self):
+        array = self.to_arrow(
+            'Nullable(UUID)', [self.uid, None], type_=pa.string()
+        )
+
+        self.assertEqual(array.to_pylist(), [str(self.uid), None])
+
+    def test_ipv4(self):
+        data = [IPv4Address('10.0.0.1'), IPv4Address('255.255.255.255')]
+        array = self.to_arrow('IPv4', data)
+
+        self.assertEqual(array.type, pa.uint32())
+        self.assertEqual(array.to_pylist(), [int(x) for x in data])
+
+    def test_ipv4_as_text(self):
+        array = self.to_arrow(
+            'IPv4', ['10.0.0.1', '0.0.0.0'], type_=pa.string()
+        )
+
+        self.assertEqual(array.to_pylist(), ['10.0.0.1', '0.0.0.0'])
+
+    def test_ipv6(self):
+        data = [IPv6Address('2001:db8::1'), IPv6Address('::')]
+        array = self.to_arrow('IPv6', data)
+
+        self.assertEqual(array.type, pa.binary(16))
+        self.assertEqual(array.to_pylist(), [x.packed for x in data])
+
+    def test_ipv6_as_text(self):
+        data = ['2001:db8::1', '::', '1:0:0:2::3', '::ffff:1.2.3.4', None]
+        array = self.to_arrow('Nullable(IPv6)', data, type_=pa.string())
+
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_array_of_uuids_as_text(self):
+        array = self.to_arrow(
+            'Array(UUID)', [[self.uid], []], type_=pa.list_(pa.string())
+        )
+
+        self.assertEqual(array.to_pylist(), [[str(self.uid)], []])
+
+
+class EnumColumnTestCase(ArrowColumnTestCase):
+    spec = "Enum8('a' = -128, 'b' = 0, 'c' = 127)"
+
+    def test_enum_is_decoded(self):
+        data = ['a', 'c', 'b', 'a']
+        array = self.to_arrow(self.spec, data)
+
+        self.assertEqual(array.type, pa.string())
+        self.assertEqual(array.to_pylist(), data)
+
+    def test_enum_is_read_as_dense_indices(self):
+        data = self.serialize(self.spec, ['c', 'a', 'b'])
+        column = self.read_arrow_column(self.spec, data, 3)
+
+        self.assertEqual(list(column.indices), [2, 0, 1])
+        self.assertEqual(column.names, ('a', 'b', 'c'))
+
+    def test_declared_dictionary(self):
+        type_ = pa.dictionary(pa.int8(), pa.string())
+        data = ['c', None, 'a']
+        array = self.to_arrow(
+            'Nullable({})'.format(self.spec), data, type_=type_
+        )
+
+        self.assertEqual(array.type, type_)
+        self.assertEqual(array.to_pylist(), data)
+        self.assertEqual(array.dictionary.to_pylist(), ['a', 'b', 'c'])
+
+    def test_enum16(self):
+        spec = "Enum16('x' = -1000, 'y' = 1000, 'z' = 1)"
+        data = ['y', 'x', 'z']
+        array = self.to_arrow(spec, data)
+
+        self.assertEqual(array.to_pylist(), data)
+
+
+class LargeStringsTestCase(ArrowColumnTestCase):
+    def test_large_strings(self):
+        batches = self.read_batches([
+            ('a', 'String', ['x', 'yy']),
+            ('b', 'Array(Nullable(String))', [['z'], [None]]),
+            ('c', 'FixedString(2)', ['ab', 'c'])
+        ], large_strings=True)
+
+        schema = batches[0].schema
+        self.assertEqual(schema.field('a').type, pa.large_string())
+        self.assertEqual(
+            schema.field('b').type, pa.list_(pa.large_string())
+        )
+        self.assertEqual(schema.field('c').type, pa.large_string())
+        self.assertEqual(batches[0].column(1).to_pylist(), [['z'], [None]])
+
+    def test_block_over_limit_is_split(self):
+        data = ['abc', None, 'de', 'fghi', '', 'jk']
+        with patch('clickhouse_driver.arrow.convert.MAX_BINARY_SIZE', 5):
+            batches = self.read_batches([
+                ('a', 'Nullable(String)', data),
+                ('b', 'UInt8', list(range(6)))
+            ])
+
+        self.assertEqual([x.num_rows for x in batches], [3, 2, 1])
+        for batch in batches:
+            self.assertEqual(batch.schema.field('a').type, pa.string())
+
+        self.assertEqual(
+            [x for batch in batches for x in batch.column(0).to_pylist()],
+            data
+        )
+        self.assertEqual(
+            [x for batch in batches for x in batch.column(1).to_pylist()],
+            list(range(6))
+        )
+
+    def test_value_over_limit(self):
+        with patch('clickhouse_driver.arrow.convert.MAX_BINARY_SIZE', 5):
+            with self.assertRaises(ValueError):
+                self.read_batches([('a', 'String', ['abcdef'])])
+
+            batches = self.read_batches(
+                [('a', 'String', ['abcdef'])], large_strings=True
+            )
+            self.assertEqual(batches[0].column(0).to_pylist(), ['abcdef'])
+
+    def test_promoted_type_mismatch(self):
+        schema = pa.schema([('a', pa.list_(pa.string())), ('b', pa.int32())])
+        nested = pa.array([['x']], type=pa.list_(pa.large_string()))
+
+        with self.assertRaises(ValueError) as e:
+            _arrays_to_batches(
+                [nested, pa.array([1], type=pa.int32())], schema
+            )
+        self.assertIn('nested column exceeds 2GiB', str(e.exception))
+
+        with self.assertRaises(ValueError) as e:
+            _arrays_to_batches([
+                nested.cast(pa.list_(pa.string())),
+                pa.array([1], type=pa.int64())
+            ], schema)
+        self.assertEqual(
+            str(e.exception),
+            'Column b of type int64 does not match its schema type int32'
+        )
+
+
+class VariantColumnTestCase(ArrowColumnTestCase):
+    def read_variant(self, spec, data, n_items, type_=None):
+        column = self.read_arrow_column(spec, self.compress(data), n_items)
+        return _column_to_array(column, type_, None)
+
+    def binary_str(self, value):
+        return bytes([len(value)]) + value
+
+    def test_variant(self):
+        # Variant prefix: discriminators mode. Body: discriminators,
+        # then String rows, then UInt64 rows.
+        data = struct.pack('<Q', 0) + bytes([0, 1, 255, 0, 1]) + \
+            self.binary_str(b'a') + self.binary_str(b'bc') + \
+            struct.pack('<QQ', 5, 7)
+        spec = 'Variant(UInt64, String)'
+        array = self.read_variant(spec, data, 5)
+
+        self.assertEqual(array.type, mapping.get_type_and_converter(spec)[0])
+        self.assertEqual(
+            [field.name for field in array.type],
+            ['String', 'UInt64', 'NULL']
+        )
+        self.assertEqual(array.to_pylist(), ['a', 5, None, 'bc', 7])
+
+    def make_dynamic(self):
+        # Dynamic prefix: structure version, variant types, then
+        # Variant prefix. Discriminators follow sorted names: Int64,
+        # SharedVariant, String.
+        shared = bytes([0x0e]) + struct.pack('<d', 1.5)
+        data = struct.pack('<Q', 2) + bytes([2]) + \
+            self.binary_str(b'String') + self.binary_str(b'Int64') + \
+            struct.pack('<Q', 0) + bytes([0, 2, 255, 1]) + \
+            struct.pack('<q', -1) + self.binary_str(shared) + \
+            self.binary_str(b'x')
+        return data, shared
+
+    def test_dynamic(self):
+        data, shared = self.make_dynamic()
+        array = self.read_variant('Dynamic', data, 4)
+
+        self.assertEqual(array.type, pa.dense_union([
+            pa.field('Int64', pa.int64()),
+            pa.field('SharedVariant', pa.binary()),
+            pa.field('String', pa.string()),
+            pa.field('NULL', pa.null())
+        ]))
+        self.assertEqual(array.to_pylist(), [-1, 'x', None, shared])
+
+    def test_dynamic_declared_union(self):
+        data, shared = self.make_dynamic()
+        type_ = pa.dense_union([
+            pa.field('String', pa.string()),
+            pa.field('Float64', pa.float64()),
+            pa.field('Int64', pa.int64()),
+            pa.field('NULL', pa.null()),
+            pa.field('SharedVariant', pa.binary())
+        ], type_codes=[5, 6, 7, 8, 9])
+        array = self.read_variant('Dynamic', data, 4, type_=type_)
+
+        self.assertEqual(array.type, type_)
+        self.assertEqual(array.to_pylist(), [-1, 'x', None, shared])
+
+    def test_dynamic_variant_missing_in_declared_union(self):
+        data, _ = self.make_dynamic()
+        type_ = pa.dense_union([
+            pa.field('Int64', pa.int64()), pa.field('NULL', pa.null())
+        ])
+
+        with self.assertRaises(ValueError):
+            self.read_variant('Dynamic', data, 4, type_=type_)
+
+    def test_dynamic_variants_moved_to_shared_variant(self):
+        type_ = pa.dense_union([
+            pa.field('Int64', pa.int64()),
+            pa.field('SharedVariant', pa.binary()),
+            pa.field('NULL', pa.null())
+        ])
+
+        data, shared = self.make_dynamic()
+        array = self.read_variant('Dynamic', data, 4, type_=type_)
+        self.assertEqual(array.type, type_)
+        self.assertEqual(
+            array.to_pylist(), [-1, bytes([0x15]) + b'\x01x', None, shared]
+        )
+
+        # Next block of the stream: String has no rows, Date and
+        # FixedString rows go after SharedVariant rows of the block.
+        data = struct.pack('<Q', 2) + bytes([4]) + \
+            self.binary_str(b'Date') + self.binary_str(b'FixedString(3)') + \
+            self.binary_str(b'Int64') + self.binary_str(b'String') + \
+            struct.pack('<Q', 0) + bytes([1, 3, 0, 2, 1]) + \
+            struct.pack('<H', 19000) + b'ab\x00' + b'cde' + \
+            struct.pack('<q', 7) + self.binary_str(shared)
+        array = self.read_variant('Dynamic', data, 5, type_=type_)
+        self.assertEqual(array.type, type_)
+        self.assertEqual(array.to_pylist(), [
+            bytes([0x16, 3]) + b'ab\x00', shared,
+            bytes([0x0f]) + struct.pack('<H', 19000), 7,
+            bytes([0x16, 3]) + b'cde'
+        ])
+
+        data = struct.pack('<Q', 2) + bytes([1]) + \
+            self.binary_str(b'Array(Int64)') + struct.pack('<Q', 0) + \
+            bytes([0]) + struct.pack('<Qq', 1, 5)
+        with self.assertRaises(NotImplementedError):
+            self.read_variant('Dynamic', data, 1, type_=type_)
+
+
+class JsonColumnTestCase(ArrowColumnTestCase):
+    def binary_str(self, value):
+        return bytes([len(value)]) + value
+
+    def test_declared_struct(self):
+        data = [
+            {'a': 1, 'b': {'c': 'x', 'd': [1, 2]}}, {'a': 2.5}, {'s': 'z'}, {}
+        ]
+        type_ = pa.struct([
+            ('a', pa.float64()),
+            ('b', pa.struct([
+                ('c', pa.string()), ('d', pa.list_(pa.int64()))
+            ])),
+            ('s', pa.string()),
+            ('q', pa.int32())
+        ])
+        array = self.to_arrow('JSON', data, type_=type_)
+
+        self.assertEqual(array.type, type_)
+        self.assertEqual(array.to_pylist(), [
+            {'a': 1.0, 'b': {'c': 'x', 'd': [1, 2]}, 's': None, 'q': None},
+            {'a': 2.5, 'b': None, 's': None, 'q': None},
+            {'a': None, 'b': None, 's': 'z', 'q': None},
+            {'a': None, 'b': None, 's': None, 'q': None}
+        ])
+
+    def test_paths_are_not_read_into_rows(self):
+        data = self.serialize('JSON', [{'a': 1}, {'b': 'x'}])
+        column = self.read_arrow_column('JSON', data, 2)
+
+        self.assertEqual(column.paths, ['a', 'b'])
+        self.assertEqual(
+            [list(x.discriminators) for x in column.children],
+            [[0, 255], [255, 1]]
+        )
+
+    def test_shared_data(self):
+        # JSON V2 prefix: path names, then Dynamic prefix of path "a".
+        # Body: path "a" rows, then shared data of paths over
+        # max_dynamic_paths: Array(Tuple(String, String)) of paths and
+        # Float64 values with their type codes.
+        def float_blob(value):
+            return bytes([0x0e]) + struct.pack('<d', value)
+
+        data = struct.pack('<Q', 2) + bytes([1]) + self.binary_str(b'a') + \
+            struct.pack('<Q', 2) + bytes([1]) + self.binary_str(b'Int64') + \
+            struct.pack('<Q', 0) + \
+            bytes([0, 255, 0]) + struct.pack('<qq', -1, 3) + \
+            struct.pack('<QQQ', 0, 1, 2) + \
+            self.binary_str(b'b') + self.binary_str(b'c.d') + \
+            self.binary_str(float_blob(1.5)) + \
+            self.binary_str(float_blob(2.5))
+        column = self.read_arrow_column('JSON', self.compress(data), 3)
+
+        type_ = pa.struct([
+            ('a', pa.int64()),
+            ('b', pa.float64()),
+            ('c', pa.struct([('d', pa.float64())]))
+        ])
+        self.assertEqual(_column_to_array(column, type_, None).to_pylist(), [
+            {'a': -1, 'b': None, 'c': None},
+            {'a': None, 'b': 1.5, 'c': None},
+            {'a': 3, 'b': None, 'c': {'d': 2.5}}
+        ])
+
+    def test_other_types_from_rows(self):
+        array = self.to_arrow(
+            'JSON', [{'a': 1}, {'b': 2}],
+            type_=pa.map_(pa.string(), pa.int64())
+        )
+
+        self.assertEqual(array.to_pylist(), [[('a', 1)], [('b', 2)]])
+
+    def test_nullable(self):
+        type_ = pa.struct([('a', pa.int64())])
+        array = self.to_arrow('Nullable(JSON)', [{'a': 1}, None], type_=type_)
+
+        self.assertEqual(array.to_pylist(), [{'a': 1}, None])
+
+    def test_array_of_json(self):
+        data = [[{'a': 1}, {'b': 'x'}], []]
+        type_ = pa.struct([('a', pa.int64()), ('b', pa.string())])
+        array = self.to_arrow('Array(JSON)', data, type_=pa.list_(type_))
+
+        self.assertEqual(array.to_pylist(), [
+            [{'a': 1, 'b': None}, {'a': None, 'b': 'x'}], []
+        ])
+
+    def test_text(self):
+        # String serialization: JSON text of every row.
+        data = struct.pack('<Q', 1) + self.binary_str(b'{"a":1}') + \
+            self.binary_str(b'')
+        column = self.read_arrow_column('JSON', self.compress(data), 2)
+
+        self.assertEqual(
+            _column_to_array(column, pa.string(), None).to_pylist(),
+            ['{"a":1}', '{}']
+        )
+        type_ = pa.struct([('a', pa.int64())])
+        self.assertEqual(
+            _column_to_array(column, type_, None).to_pylist(),
+            [{'a': 1}, {'a': None}]
+        )
+
+
+class SparseColumnTestCase(ArrowColumnTestCase):
+    END_OF_GRANULE_FLAG = 1 << 62
+
+    def read_sparse_column(self, spec, n_items, items, positions):
+        """
+        Reads ``items`` put at ``positions`` of ``n_items`` defaults as
+        a column with sparse serialization.
+        """
+        out = BytesIO()
+        write_varint(1, out)
+        previous = -1
+        for position in positions:
+            write_varint(position - previous - 1, out)
+            previous = position
+        write_varint(self.END_OF_GRANULE_FLAG | (n_items - previous - 1), out)
+
+        data = self.compress(out.getvalue() + self.serialize(spec, items))
+        context = self.make_context(use_numpy=True, use_arrow=True)
+        return read_column(
+            context, spec, n_items, self.make_reader(data),
+            has_custom_serialization=True
+        )
+
+    def test_numbers_keep_dtype(self):
+        column = self.read_sparse_column('Int32', 6, [5, 7], [1, 4])
+
+        self.assertIsInstance(column, np.ndarray)
+        self.assertEqual(column.dtype, np.int32)
+        self.assertEqual(column.tolist(), [0, 5, 0, 0, 7, 0])
+
+    def test_all_defaults(self):
+        column = self.read_sparse_column('Float64', 3, [], [])
+
+        self.assertEqual(column.tolist(), [0.0, 0.0, 0.0])
+
+    def test_strings_are_read_into_buffers(self):
+        for spec in ['String', 'FixedString(2)']:
+            column = self.read_sparse_column(spec, 5, ['a', 'bc'], [0, 3])
+
+            self.assertNotIsInstance(column, (list, tuple, np.ndarray))
+            self.assertEqual(
+                _column_to_array(column, pa.string(), None).to_pylist(),
+                ['a', '', '', 'bc', '']
+            )
+
+    def test_fixed_size_buffers(self):
+        uuid = UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d')
+        zero = UUID(int=0)
+        for spec, items, expected in [
+                ('UUID', [uuid], [zero.bytes, uuid.bytes, zero.bytes]),
+                ('Decimal(9, 2)', [Decimal('1.5')],
+                 [Decimal('0.00'), Decimal('1.50'), Decimal('0.00')]),
+                ('IPv4', ['10.0.0.1'], [0, 167772161, 0]),
+                ('Int128', [-1], [0, -1, 0]),
+                ("DateTime('UTC')", [1], [
+                    datetime(1970, 1, 1, tzinfo=timezone.utc),
+                    datetime(1970, 1, 1, 0, 0, 1, tzinfo=timezone.utc),
+                    datetime(1970, 1, 1, tzinfo=timezone.utc)
+                ])]:
+            column = self.read_sparse_column(spec, 3, items, [1])
+            self.assertEqual(len(column), 3)
+
+            type_, converter = mapping.get_type_and_converter(spec)
+            array = _column_to_array(column, type_, converter)
+            self.assertEqual(array.to_pylist(), expected)
+
+    def test_enum_default_is_smallest_value(self):
+        spec = "Enum8('a' = 1, 'b' = 2, 'c' = -3)"
+        column = self.read_sparse_column(spec, 3, ['b'], [1])
+
+        type_, converter = mapping.get_type_and_converter(spec)
+        array = _column_to_array(column, type_, converter)
+        self.assertEqual(array.to_pylist(), ['c', 'b', 'c'])
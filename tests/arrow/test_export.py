@@ -0,0 +1,156 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from clickhouse_driver import Client
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from clickhouse_driver.arrow.export import write_record_batches
+except ImportError:
+    pa = None
+
+from tests.arrow.testcase import ArrowBaseTestCase
+
+
+class WriteRecordBatchesTestCase(TestCase):
+    """
+    Unit tests for writing record batches to files. No server needed.
+    """
+
+    def setUp(self):
+        if pa is None:
+            self.skipTest('PyArrow package is not installed')
+
+        tmp = TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'result')
+
+    def make_reader(self, n_batches=3, batch_size=2):
+        schema = pa.schema([('x', pa.int64()), ('y', pa.string())])
+        batches = [
+            pa.record_batch([
+                pa.array(range(i * batch_size, (i + 1) * batch_size)),
+                pa.array(['a'] * batch_size)
+            ], schema=schema)
+            for i in range(n_batches)
+        ]
+        return pa.RecordBatchReader.from_batches(schema, iter(batches))
+
+    def test_parquet_row_group_per_batch(self):
+        n_rows = write_record_batches(self.make_reader(), self.path)
+
+        self.assertEqual(n_rows, 6)
+        parquet_file = pq.ParquetFile(self.path)
+        self.assertEqual(parquet_file.num_row_groups, 3)
+        self.assertEqual(
+            parquet_file.read().column('x').to_pylist(), list(range(6))
+        )
+
+    def test_parquet_column_compression(self):
+        write_record_batches(
+            self.make_reader(), self.path,
+            compression={'x': 'zstd', 'y': 'snappy'}
+        )
+
+        row_group = pq.ParquetFile(self.path).metadata.row_group(0)
+        self.assertEqual(row_group.column(0).compression, 'ZSTD')
+        self.assertEqual(row_group.column(1).compression, 'SNAPPY')
+
+    def test_arrow_ipc(self):
+        for format in ['arrow', 'feather']:
+            write_record_batches(
+                self.make_reader(), self.path, format=format
+            )
+
+            with pa.ipc.open_file(self.path) as reader:
+                self.assertEqual(reader.num_record_batches, 3)
+                self.assertEqual(
+                    reader.read_all().column('x').to_pylist(),
+                    list(range(6))
+                )
+
+    def test_ipc_column_compression_unsupported(self):
+        with self.assertRaises(ValueError):
+            write_record_batches(
+                self.make_reader(), self.path, format='arrow',
+                compression={'x': 'zstd'}
+            )
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            write_record_batches(self.make_reader(), self.path, format='csv')
+
+    def test_ipc_invalid_codec(self):
+        for compression, compression_level in [
+                ('foo', None), ('snappy', 3), (None, {'x': 3})]:
+            with self.assertRaises(ValueError):
+                write_record_batches(
+                    self.make_reader(), self.path, format='feather',
+                    compression=compression,
+                    compression_level=compression_level
+                )
+
+    def test_query_to_file_options_checked_before_query(self):
+        # No server: options are rejected before connecting.
+        client = Client('unreachable.invalid')
+
+        for options in [
+                {'format': 'csv'},
+                {'format': 'feather', 'compression': {'x': 'zstd'}},
+                {'format': 'arrow', 'compression': 'foo'}]:
+            with self.assertRaises(ValueError):
+                client.query_to_file('SELECT 1', self.path, **options)
+
+        self.assertFalse(client.connection.connected)
+
+
+class QueryToFileTestCase(ArrowBaseTestCase):
+    def setUp(self):
+        super(QueryToFileTestCase, self).setUp()
+
+        tmp = TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'result')
+
+    def test_parquet(self):
+        n_rows = self.client.query_to_file(
+            'SELECT number FROM system.numbers LIMIT 1000', self.path,
+            settings={'max_block_size': 100}, row_group_size=300
+        )
+
+        self.assertEqual(n_rows, 1000)
+        parquet_file = pq.ParquetFile(self.path)
+        self.assertEqual(
+            [parquet_file.metadata.row_group(i).num_rows
+             for i in range(parquet_file.num_row_groups)],
+            [300, 300, 300, 100]
+        )
+        self.assertEqual(
+            parquet_file.read().column('number').to_pylist(),
+            list(range(1000))
+        )
+
+    def test_feather(self):
+        self.client.query_to_file(
+            'SELECT toString(number) AS s FROM system.numbers LIMIT 10',
+            self.path, format='feather'
+        )
+
+        table = pa.ipc.open_file(self.path).read_all()
+        self.assertEqual(
+            table.column('s').to_pylist(), [str(x) for x in range(10)]
+        )
+
+    def test_client_usable_after_write_error(self):
+        path = os.path.join(os.path.dirname(self.path), 'missing', 'result')
+        with self.assertRaises(OSError):
+            self.client.query_to_file(
+                'SELECT number FROM system.numbers LIMIT 100000',
+                path, format='arrow', settings={'max_block_size': 100}
+            )
+
+        rv = self.client.execute('SELECT 1')
+        self.assertEqual(rv, [(1, )])
@@ -0,0 +1,69 @@
+from ipaddress import IPv4Address, IPv6Address
+from random import Random
+from unittest import TestCase
+from uuid import UUID
+
+try:
+    import numpy as np
+
+    from clickhouse_driver.arrow.formatting import (
+        format_ipv4, format_ipv6, format_uuids
+    )
+except ImportError:
+    np = None
+
+
+class FormattingTestCase(TestCase):
+    def setUp(self):
+        if np is None:
+            self.skipTest('NumPy package is not installed')
+
+    def decode(self, offsets, data):
+        data = bytes(data)
+        return [
+            data[offsets[i]:offsets[i + 1]].decode()
+            for i in range(len(offsets) - 1)
+        ]
+
+    def test_uuids(self):
+        uids = [
+            UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d'),
+            UUID(int=0), UUID(int=2 ** 128 - 1)
+        ]
+        text = self.decode(*format_uuids(b''.join(x.bytes for x in uids)))
+
+        self.assertEqual(text, [str(x) for x in uids])
+
+    def test_ipv4(self):
+        values = [0, 1, 167772161, 3232235777, 2 ** 32 - 1]
+        text = self.decode(*format_ipv4(np.array(values, dtype=np.uint32)))
+
+        self.assertEqual(text, [str(IPv4Address(x)) for x in values])
+
+    def test_ipv6_zero_runs(self):
+        addresses = [
+            '::', '::1', '1::', '1:0:0:2::3', '1::2:0:0:3', '1:0:1:0:1:0:1:0',
+            '2001:db8::ff00:42:8329', 'fe80::1:0:0:0', '::ffff:1.2.3.4',
+            '::ffff:0.0.0.0', '::102:304'
+        ]
+        data = b''.join(IPv6Address(x).packed for x in addresses)
+
+        self.assertEqual(self.decode(*format_ipv6(data)), addresses)
+
+    def test_ipv6_random(self):
+        random = Random(1)
+        choices = [0, 0, 0, 1, 0xff, 0xabc, 0xffff]
+        addresses = [
+            IPv6Address(b''.join(
+                random.choice(choices).to_bytes(2, 'big') for _ in range(8)
+            ))
+            for _ in range(1000)
+        ]
+        data = b''.join(x.packed for x in addresses)
+
+        expected = [
+            '::ffff:{}'.format(x.ipv4_mapped)
+            if x.ipv4_mapped is not None else str(x)
+            for x in addresses
+        ]
+        self.assertEqual(self.decode(*format_ipv6(data)), expected)
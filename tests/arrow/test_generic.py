@@ -6,6 +6,7 @@ except ImportError:
 from clickhouse_driver import errors
 from tests.testcase import BaseTestCase
 from tests.arrow.testcase import ArrowBaseTestCase
+from tests.util import require_server_version
 
 
 class QueryArrowTestCase(ArrowBaseTestCase):
@@ -227,6 +228,35 @@ class QueryArrowStreamTestCase(ArrowBaseTestCase):
         with self.assertRaises(errors.PartiallyConsumedQueryError):
             reader.read_all()
 
+    def test_client_usable_after_reader_released(self):
+        reader = self.client.query_arrow_stream(
+            'SELECT number FROM system.numbers LIMIT 100000',
+            settings={'max_block_size': 100}
+        )
+        reader.read_next_batch()
+        del reader
+
+        rv = self.client.execute('SELECT 1')
+        self.assertEqual(rv, [(1, )])
+
+    def test_pycapsule_stream(self):
+        reader = self.client.query_arrow_stream(
+            'SELECT number FROM system.numbers LIMIT 1000',
+            settings={'max_block_size': 100}
+        )
+        if not hasattr(reader, '__arrow_c_stream__'):
+            self.skipTest('PyCapsule interface requires PyArrow 14+')
+
+        imported = pa.RecordBatchReader._import_from_c_capsule(
+            reader.__arrow_c_stream__()
+        )
+        table = imported.read_all()
+        self.assertEqual(table.column('number').to_pylist(),
+                         list(range(1000)))
+
+        rv = self.client.execute('SELECT 1')
+        self.assertEqual(rv, [(1, )])
+
 
 class ArrowNumpyPathTestCase(ArrowBaseTestCase):
     """
@@ -302,6 +332,135 @@ class ArrowNumpyPathTestCase(ArrowBaseTestCase):
         self.assertTrue(table.equals(numpy_table))
         self.assertEqual(table.column('x').null_count, 5)
 
+    def test_arrays_equal_with_use_numpy(self):
+        query = (
+            'SELECT '
+            'range(number % 4) AS a, '
+            'arrayMap(x -> toString(x), range(number % 3)) AS s, '
+            'arrayMap(x -> if(x % 2 = 0, NULL, x), range(number % 5)) '
+            'AS n, '
+            'arrayMap(x -> range(x), range(number % 3)) AS aa '
+            'FROM system.numbers LIMIT 100'
+        )
+
+        table = self.client.query_arrow(query)
+
+        with self.created_client(settings={'use_numpy': True}) as client:
+            numpy_table = client.query_arrow(query)
+
+        self.assertTrue(table.equals(numpy_table))
+
+    @require_server_version(23, 3)
+    def test_maps_equal_with_use_numpy(self):
+        query = (
+            'SELECT '
+            'CAST(mapFromArrays(arrayMap(x -> toString(x), '
+            'range(number % 4)), arrayMap(x -> x / 2, range(number % 4))) '
+            'AS Map(LowCardinality(String), Float64)) AS m '
+            'FROM system.numbers LIMIT 100'
+        )
+
+        table = self.client.query_arrow(query)
+
+        with self.created_client(settings={'use_numpy': True}) as client:
+            numpy_table = client.query_arrow(query)
+
+        self.assertTrue(table.equals(numpy_table))
+
+    def test_tuples_equal_with_use_numpy(self):
+        query = (
+            'SELECT '
+            'tuple(number, toString(number)) AS t, '
+            'CAST((number, [number]), \'Tuple(a UInt64, b Array(UInt64))\') '
+            'AS named '
+            'FROM system.numbers LIMIT 100'
+        )
+
+        table = self.client.query_arrow(query)
+
+        with self.created_client(settings={'use_numpy': True}) as client:
+            numpy_table = client.query_arrow(query)
+
+        self.assertTrue(table.equals(numpy_table))
+
+    def test_decimals_equal_with_use_numpy(self):
+        query = (
+            'SELECT '
+            'toDecimal32(number / 3 - 10, 2) AS d32, '
+            'toDecimal64(number / 7 - 10, 4) AS d64, '
+            'toDecimal128(number / 3 - 10, 10) AS d128, '
+            'toDecimal256(number / 3 - 10, 20) AS d256, '
+            'if(number % 2 = 0, NULL, toDecimal64(number, 4)) AS n '
+            'FROM system.numbers LIMIT 100'
+        )
+
+        table = self.client.query_arrow(query)
+
+        with self.created_client(settings={'use_numpy': True}) as client:
+            numpy_table = client.query_arrow(query)
+
+        self.assertTrue(table.equals(numpy_table))
+
+    def test_addresses_equal_with_use_numpy(self):
+        query = (
+            'SELECT '
+            'toUUID(if(number % 2 = 0, '
+            '\'c0fcbba9-0752-44ed-a5d6-4dfb4342b89d\', '
+            '\'00000000-0000-0000-0000-000000000001\')) AS u, '
+            'toIPv4(toUInt32(number * 16777259)) AS v4, '
+            'toIPv6(IPv4NumToString(toUInt32(number))) AS v6 '
+            'FROM system.numbers LIMIT 100'
+        )
+        as_text = {'u': pa.string(), 'v4': pa.string(), 'v6': pa.string()}
+
+        for arrow_types in [None, as_text]:
+            table = self.client.query_arrow(query, arrow_types=arrow_types)
+
+            with self.created_client(settings={'use_numpy': True}) as client:
+                numpy_table = client.query_arrow(
+                    query, arrow_types=arrow_types
+                )
+
+            self.assertTrue(table.equals(numpy_table))
+
+    def test_enums_equal_with_use_numpy(self):
+        query = (
+            'SELECT '
+            'CAST(number % 3 - 1 AS Enum8(\'a\' = -1, \'b\' = 0, '
+            '\'c\' = 1)) AS e8, '
+            'CAST(if(number % 2 = 0, NULL, 1000) AS '
+            'Nullable(Enum16(\'x\' = 1000, \'y\' = -1000))) AS e16 '
+            'FROM system.numbers LIMIT 100'
+        )
+        arrow_types = {'e8': pa.dictionary(pa.int8(), pa.string())}
+
+        table = self.client.query_arrow(query, arrow_types=arrow_types)
+
+        with self.created_client(settings={'use_numpy': True}) as client:
+            numpy_table = client.query_arrow(query, arrow_types=arrow_types)
+
+        self.assertEqual(table.schema, numpy_table.schema)
+        self.assertEqual(table.to_pylist(), numpy_table.to_pylist())
+
+    def test_low_cardinality_equal_with_use_numpy(self):
+        query = (
+            'SELECT '
+            'toLowCardinality(toString(number % 7)) AS s, '
+            'toLowCardinality(if(number % 3 = 0, NULL, toString(number))) '
+            'AS n '
+            'FROM system.numbers LIMIT 1000'
+        )
+        arrow_types = {'s': pa.dictionary(pa.int32(), pa.string())}
+
+        table = self.client.query_arrow(query, arrow_types=arrow_types)
+
+        with self.created_client(settings={'use_numpy': True}) as client:
+            numpy_table = client.query_arrow(query, arrow_types=arrow_types)
+
+        # Dictionaries may differ: the server index has extra entries.
+        self.assertEqual(table.schema, numpy_table.schema)
+        self.assertEqual(table.to_pylist(), numpy_table.to_pylist())
+
 
 class NoPyArrowTestCase(BaseTestCase):
     def setUp(self):
@@ -0,0 +1,354 @@
+from datetime import date, datetime, timezone
+from io import BytesIO
+from ipaddress import IPv4Address, IPv6Address
+from unittest.mock import patch
+from uuid import UUID
+
+try:
+    import pyarrow as pa
+
+    from clickhouse_driver.arrow.block import iter_arrow_blocks
+    from clickhouse_driver.arrow.convert import _column_to_array
+    from clickhouse_driver.arrow.insert import write_arrow_column
+    from clickhouse_driver.arrow.mapping import get_type_and_converter
+    from clickhouse_driver.util.helpers import BlockSizer
+except ImportError:
+    pa = None
+
+from clickhouse_driver import errors
+from clickhouse_driver.bufferedwriter import CompressedBufferedWriter
+from tests.arrow.testcase import ArrowBaseTestCase, ArrowColumnTestCase
+
+
+class WriteArrowColumnTestCase(ArrowColumnTestCase):
+    """
+    Columns written from Arrow buffers must be byte to byte equal to
+    columns written by the generic columns from Python values.
+    """
+
+    def make_context(self, **client_settings):
+        context = super(WriteArrowColumnTestCase, self).make_context(
+            **client_settings
+        )
+        context.settings = {'use_client_time_zone': True}
+        return context
+
+    def serialize_arrow(self, spec, array):
+        out = BytesIO()
+        buf = CompressedBufferedWriter(out, 1024)
+        write_arrow_column(self.make_context(), 'a', spec, array, buf)
+        buf.flush()
+        return out.getvalue()
+
+    def check(self, spec, array, items=None):
+        if items is None:
+            items = array.to_pylist()
+
+        self.assertEqual(
+            self.serialize_arrow(spec, array), self.serialize(spec, items)
+        )
+
+    def test_numbers(self):
+        for spec, type_ in [('Int8', pa.int8()), ('UInt16', pa.uint16()),
+                            ('Int32', pa.int32()), ('UInt64', pa.uint64()),
+                            ('Float32', pa.float32()),
+                            ('Float64', pa.float64())]:
+            self.check(spec, pa.array([0, 1, 2, 100], type=type_))
+
+        self.check('Bool', pa.array([True, False, True]))
+
+    def test_numbers_cast(self):
+        self.check('Int32', pa.array([1, -2], type=pa.int64()), [1, -2])
+        self.check('Float64', pa.array([1, 2]), [1.0, 2.0])
+
+        with self.assertRaises(errors.TypeMismatchError) as e:
+            self.serialize_arrow('UInt8', pa.array([1, 256]))
+        self.assertIn('"a"', str(e.exception))
+
+    def test_nullable(self):
+        self.check('Nullable(Int32)', pa.array([1, None, 3], type=pa.int32()))
+        self.check('Nullable(String)', pa.array(['a', None, 'c']))
+
+    def test_strings(self):
+        data = ['', 'a', 'юникод', 'x' * 200, 'y' * 20000]
+        self.check('String', pa.array(data))
+        self.check('String', pa.array(data, type=pa.large_string()))
+        self.check('String', pa.array([x.encode() for x in data]))
+
+    def test_sliced_strings(self):
+        array = pa.array(['skip', 'a', 'bc', 'skip']).slice(1, 2)
+        self.check('String', array, ['a', 'bc'])
+
+    def test_fixed_strings(self):
+        self.check('FixedString(3)', pa.array(['a', 'abc', '']))
+        self.check(
+            'FixedString(2)',
+            pa.array([b'ab', b'cd'], type=pa.binary(2)).slice(1), [b'cd']
+        )
+        self.check(
+            'Nullable(FixedString(2))',
+            pa.array([b'ab', None], type=pa.binary(2)), [b'ab', None]
+        )
+
+        with self.assertRaises(errors.TooLargeStringSize):
+            self.serialize_arrow('FixedString(1)', pa.array(['ab']))
+
+    def test_low_cardinality(self):
+        self.check('LowCardinality(String)', pa.array(['a', 'b', 'a']))
+        self.check(
+            'LowCardinality(String)',
+            pa.array(['a', 'b', 'a']).dictionary_encode()
+        )
+        self.check(
+            'LowCardinality(Nullable(String))',
+            pa.array(['a', None, 'b', 'a']).dictionary_encode()
+        )
+        self.check('LowCardinality(Int32)', pa.array([], type=pa.int32()))
+
+    def test_low_cardinality_sliced_dictionary(self):
+        array = pa.array(['a', 'b', 'c', None, 'd', 'b']).dictionary_encode()
+        self.check('LowCardinality(String)', array.slice(1, 2))
+        self.check('LowCardinality(Nullable(String))', array.slice(2, 4))
+        self.check('LowCardinality(Nullable(String))', array.slice(3, 1))
+
+        array = pa.DictionaryArray.from_arrays(
+            pa.array([2, 0, 2], type=pa.int8()), pa.array(['a', 'b', 'c'])
+        )
+        self.check('LowCardinality(String)', array)
+
+    def test_low_cardinality_unused_dictionary_values(self):
+        array = pa.DictionaryArray.from_arrays(
+            pa.array([2, 0, 2], type=pa.int8()), pa.array(['a', 'b', 'c'])
+        )
+        spec = 'LowCardinality(String)'
+        column = self.read_arrow_column(
+            spec, self.serialize_arrow(spec, array), 3
+        )
+        type_, converter = get_type_and_converter(spec, False, False)
+        self.assertEqual(
+            _column_to_array(column, type_, converter).to_pylist(),
+            ['c', 'a', 'c']
+        )
+
+    def test_dictionary_into_plain_column(self):
+        self.check('String', pa.array(['a', 'b', 'a']).dictionary_encode())
+
+    def test_dates(self):
+        data = [date(1970, 1, 2), date(2024, 2, 29)]
+        self.check('Date', pa.array(data))
+        self.check('Date32', pa.array([date(1925, 1, 2)] + data))
+        self.check(
+            'Date', pa.array([datetime(2024, 2, 29, 12)]),
+            [date(2024, 2, 29)]
+        )
+
+    def test_datetimes(self):
+        data = [
+            datetime(2024, 1, 1, 12, 30, 45, 120000, timezone.utc),
+            datetime(1970, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+        ]
+        array = pa.array(data, type=pa.timestamp('us', tz='UTC'))
+
+        self.check("DateTime('UTC')", array)
+        self.check("DateTime64(2, 'UTC')", array)
+        self.check("DateTime64(6, 'Europe/Berlin')", array)
+        self.check('DateTime', pa.array([1, 2], type=pa.int64()))
+
+    @patch(
+        'clickhouse_driver.arrow.insert.get_localzone_name_compat',
+        lambda: 'Europe/Berlin'
+    )
+    def test_naive_datetimes(self):
+        array = pa.array([datetime(2024, 7, 1, 12)], type=pa.timestamp('s'))
+        expected = [datetime(2024, 7, 1, 10, tzinfo=timezone.utc)]
+
+        self.check('DateTime', array, expected)
+        self.check("DateTime64(3, 'UTC')", array, [datetime(2024, 7, 1, 12)])
+
+    def test_naive_datetimes_dst_transitions(self):
+        # Ambiguous and nonexistent local times are localized with
+        # is_dst=False as the generic column does.
+        data = [
+            datetime(2023, 10, 29, 2, 30), datetime(2023, 3, 26, 2, 30),
+            datetime(2023, 3, 26, 1, 30)
+        ]
+        for type_ in [pa.timestamp('s'), pa.timestamp('us')]:
+            array = pa.array(data, type=type_)
+            self.check("DateTime('Europe/Berlin')", array)
+            self.check("DateTime64(3, 'Europe/Berlin')", array)
+
+        array = pa.array(data + [None], type=pa.timestamp('s'))
+        self.check("Nullable(DateTime('Europe/Berlin'))", array)
+
+    def test_uuids(self):
+        items = [
+            UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d'),
+            UUID('00000000-0000-0000-0000-000000000001')
+        ]
+        array = pa.array([x.bytes for x in items], type=pa.binary(16))
+
+        self.check('UUID', array, items)
+        self.check('UUID', array.slice(1), items[1:])
+        self.check(
+            'Nullable(UUID)',
+            pa.array([items[0].bytes, None], type=pa.binary(16)),
+            [items[0], None]
+        )
+
+    def test_ips(self):
+        ipv4 = [IPv4Address('10.0.0.1'), IPv4Address('255.255.255.255')]
+        self.check(
+            'IPv4', pa.array([int(x) for x in ipv4], type=pa.uint32()), ipv4
+        )
+
+        ipv6 = [IPv6Address('2001:db8::1'), IPv6Address('::ffff:10.0.0.1')]
+        self.check(
+            'Nullable(IPv6)',
+            pa.array([x.packed for x in ipv6] + [None], type=pa.binary(16)),
+            ipv6 + [None]
+        )
+
+    def test_python_values_fallback(self):
+        self.check('Array(Int32)', pa.array([[1, 2], []]))
+        self.check(
+            'Tuple(Int32, String)',
+            pa.array([{'x': 1, 'y': 'a'}]), [(1, 'a')]
+        )
+        self.check(
+            'Map(String, Int32)',
+            pa.array([[('a', 1)]], type=pa.map_(pa.string(), pa.int32())),
+            [{'a': 1}]
+        )
+
+    def test_other_encoding_fallback(self):
+        spec = 'String'
+        array = pa.array(['юникод'])
+        context = self.make_context(strings_encoding='cp1251')
+
+        out = BytesIO()
+        buf = CompressedBufferedWriter(out, 1024)
+        write_arrow_column(context, 'a', spec, array, buf)
+        buf.flush()
+
+        self.assertIn('юникод'.encode('cp1251'), out.getvalue())
+
+
+class IterArrowBlocksTestCase(ArrowColumnTestCase):
+    columns_with_types = [('b', 'String'), ('a', 'Int32')]
+
+    def test_blocks(self):
+        table = pa.table({'a': list(range(5)), 'b': ['x'] * 5, 'c': [0] * 5})
+
+        for data in [table, table.to_batches()[0], table.to_reader()]:
+            blocks = list(iter_arrow_blocks(self.columns_with_types, data, 2))
+
+            self.assertEqual([x.num_rows for x in blocks], [2, 2, 1])
+            self.assertEqual(
+                [x.to_pylist() for x in blocks[2].get_columns()],
+                [['x'], [4]]
+            )
+
+    def test_sized_blocks(self):
+        table = pa.table({
+            'a': pa.array(range(100), type=pa.int32()),
+            'b': pa.array(['xxxx'] * 100)
+        })
+
+        # Row width is 4 bytes of a, 4 bytes of b and its 4 bytes offset.
+        sizer = BlockSizer(120, 1000)
+        blocks = iter_arrow_blocks(
+            self.columns_with_types, table, 1000, sizer=sizer
+        )
+
+        rows = []
+        for block in blocks:
+            rows.append(block.num_rows)
+            sizer.update(block.num_rows, 20 * block.num_rows)
+
+        self.assertEqual(rows[0], 10)
+        self.assertEqual(set(rows[1:-1]), {6})
+        self.assertEqual(sum(rows), 100)
+
+    def test_missing_columns(self):
+        with self.assertRaises(ValueError) as e:
+            iter_arrow_blocks(
+                self.columns_with_types, pa.table({'a': [1]}), 10
+            )
+        self.assertIn("['b']", str(e.exception))
+
+    def test_unsupported_data(self):
+        with self.assertRaises(TypeError):
+            iter_arrow_blocks(self.columns_with_types, [(1, 'x')], 10)
+
+
+class InsertArrowTestCase(ArrowBaseTestCase):
+    def test_insert(self):
+        columns = (
+            'a Int32, b Nullable(String), c LowCardinality(String), '
+            'd DateTime(\'UTC\'), e Array(Int32)'
+        )
+        table = pa.table({
+            'a': pa.array([1, 2, 3], type=pa.int32()),
+            'b': ['x', None, 'z'],
+            'c': pa.array(['p', 'q', 'p']).dictionary_encode(),
+            'd': pa.array(
+                [datetime(2024, 1, 1, tzinfo=timezone.utc)] * 3,
+                type=pa.timestamp('s', tz='UTC')
+            ),
+            'e': [[1], [], [2, 3]]
+        })
+
+        with self.create_table(columns):
+            rv = self.client.insert_arrow('INSERT INTO test VALUES', table)
+            self.assertEqual(rv, 3)
+
+            inserted = self.client.query_arrow('SELECT * FROM test')
+            self.assertEqual(
+                inserted.column('b').to_pylist(), ['x', None, 'z']
+            )
+            self.assertEqual(
+                inserted.column('e').to_pylist(), [[1], [], [2, 3]]
+            )
+
+    def test_query_arrow_round_trip(self):
+        columns = 'a UUID, b Nullable(UUID), c IPv4, d IPv6'
+        data = [
+            (UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d'), None,
+             IPv4Address('10.0.0.1'), IPv6Address('2001:db8::1')),
+            (UUID('00000000-0000-0000-0000-000000000001'),
+             UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d'),
+             IPv4Address('255.255.255.255'), IPv6Address('::1'))
+        ]
+
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test VALUES', data)
+            table = self.client.query_arrow('SELECT * FROM test')
+
+            self.client.execute('TRUNCATE TABLE test')
+            rv = self.client.insert_arrow('INSERT INTO test VALUES', table)
+            self.assertEqual(rv, 2)
+
+            self.assertEqual(self.client.execute('SELECT * FROM test'), data)
+
+    def test_insert_reader_in_blocks(self):
+        table = pa.table({'a': list(range(10))})
+
+        with self.create_table('a Int64'):
+            rv = self.client.insert_arrow(
+                'INSERT INTO test VALUES', table.to_reader(max_chunksize=3),
+                settings={'insert_block_size': 2}
+            )
+            self.assertEqual(rv, 10)
+
+            inserted = self.emit_cli('SELECT sum(a) FROM test')
+            self.assertEqual(inserted, '45\n')
+
+    def test_missing_column(self):
+        with self.create_table('a Int32, b Int32'):
+            with self.assertRaises(ValueError):
+                self.client.insert_arrow(
+                    'INSERT INTO test VALUES', pa.table({'a': [1]})
+                )
+
+            rv = self.client.execute('SELECT 1')
+            self.assertEqual(rv, [(1, )])
@@ -1,16 +1,27 @@
+from ipaddress import IPv4Address, IPv6Address
 from unittest import TestCase
 from uuid import UUID
 
+from clickhouse_driver.block import ColumnOrientedBlock
 from clickhouse_driver.context import Context
+from tests.arrow.testcase import FakePacket
 
 try:
     import pyarrow as pa
 
+    import numpy as np
+
     from clickhouse_driver.arrow import mapping
     from clickhouse_driver.arrow.convert import (
-        ArrowStreamState, _json_declared_converter,
+        ArrowStreamState, _declared_converter, _schema_plan,
         create_record_batch_reader
     )
+    from clickhouse_driver.columns.arrow.tuplecolumn import (
+        ArrowStructBuffers
+    )
+    from clickhouse_driver.columns.arrow.variantcolumn import (
+        ArrowUnionBuffers
+    )
 except ImportError:
     pa = None
     mapping = None
@@ -50,8 +61,83 @@ class MappingTestCase(TestCase):
         self.assertEqual(self.get('DateTime64(0)')[0], pa.timestamp('s'))
         self.assertEqual(self.get('DateTime64(9)')[0], pa.timestamp('ns'))
 
-    def test_tuple_without_json_falls_back_to_inference(self):
-        self.assertEqual(self.get('Tuple(UInt8, String)'), (None, None))
+    def test_intervals(self):
+        self.assertEqual(self.get('IntervalSecond'), (pa.duration('s'), None))
+        self.assertEqual(
+            self.get('IntervalMillisecond'), (pa.duration('ms'), None)
+        )
+
+        type_, converter = self.get('IntervalHour')
+        self.assertEqual(type_, pa.duration('s'))
+        self.assertEqual(converter(2), 7200)
+
+        type_, converter = self.get('IntervalWeek')
+        self.assertEqual(type_, pa.month_day_nano_interval())
+        self.assertEqual(converter(2), (0, 14, 0))
+
+        type_, converter = self.get('IntervalQuarter')
+        self.assertEqual(type_, pa.month_day_nano_interval())
+        self.assertEqual(converter(2), (6, 0, 0))
+
+    def test_large_ints(self):
+        self.assertEqual(self.get('Int128'), (None, None))
+
+        type_, converter = self.get('Int256', large_ints_as_words=True)
+        self.assertEqual(type_, pa.binary(32))
+        self.assertEqual(converter(-1), b'\xff' * 32)
+        self.assertEqual(
+            self.get('UInt128', large_ints_as_words=True)[0], pa.binary(16)
+        )
+
+    def test_variant(self):
+        self.assertEqual(
+            self.get('Variant(UInt64, Array(String))')[0],
+            pa.dense_union([
+                pa.field('Array(String)', pa.list_(pa.string())),
+                pa.field('UInt64', pa.uint64()),
+                pa.field('NULL', pa.null())
+            ])
+        )
+        self.assertEqual(self.get('Variant(Int128, String)'), (None, None))
+        self.assertEqual(self.get('Dynamic'), (None, None))
+
+    def test_fixed_string(self):
+        self.assertEqual(self.get('FixedString(3)')[0], pa.string())
+        self.assertEqual(
+            self.get('FixedString(3)', strings_as_bytes=True)[0],
+            pa.binary(3)
+        )
+
+    def test_tuple_is_struct(self):
+        self.assertEqual(
+            self.get('Tuple(UInt8, String)'),
+            (pa.struct([('1', pa.uint8()), ('2', pa.string())]), None)
+        )
+        self.assertEqual(
+            self.get('Tuple(a UInt8, b Tuple(c String))')[0],
+            pa.struct([
+                ('a', pa.uint8()), ('b', pa.struct([('c', pa.string())]))
+            ])
+        )
+
+    def test_tuple_with_unmapped_element_falls_back_to_inference(self):
+        self.assertEqual(self.get('Tuple(UInt8, Int128)'), (None, None))
+
+    def test_tuple_element_converters(self):
+        type_, converter = self.get('Tuple(a UUID, b UInt8)')
+        self.assertEqual(
+            type_, pa.struct([('a', pa.binary(16)), ('b', pa.uint8())])
+        )
+
+        uid = UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d')
+        self.assertEqual(converter((uid, 1)), (uid.bytes, 1))
+        self.assertEqual(converter({'a': None, 'b': 1}), (None, 1))
+
+    def test_nested_is_list_of_structs(self):
+        self.assertEqual(
+            self.get('Nested(a UInt8, b String)')[0],
+            pa.list_(pa.struct([('a', pa.uint8()), ('b', pa.string())]))
+        )
 
     def test_unknown_spec_falls_back_to_inference(self):
         self.assertEqual(self.get('Int128'), (None, None))
@@ -61,19 +147,33 @@ class MappingTestCase(TestCase):
         self.assertEqual(type_, pa.int64())
         self.assertIsNone(converter)
 
+    def test_binary_types(self):
+        self.assertEqual(self.get('UUID')[0], pa.binary(16))
+        self.assertEqual(self.get('IPv4')[0], pa.uint32())
+        self.assertEqual(self.get('IPv6')[0], pa.binary(16))
+
     def test_array_of_uuid_converter(self):
         type_, converter = self.get('Array(UUID)')
-        self.assertEqual(type_, pa.list_(pa.string()))
+        self.assertEqual(type_, pa.list_(pa.binary(16)))
 
         uid = UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d')
-        self.assertEqual(converter([uid, None]), [str(uid), None])
+        self.assertEqual(converter([uid, None]), [uid.bytes, None])
 
     def test_map_with_value_converter(self):
         type_, converter = self.get('Map(String, UUID)')
-        self.assertEqual(type_, pa.map_(pa.string(), pa.string()))
+        self.assertEqual(type_, pa.map_(pa.string(), pa.binary(16)))
 
         uid = UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d')
-        self.assertEqual(converter({'k': uid}), [('k', str(uid))])
+        self.assertEqual(converter({'k': uid}), [('k', uid.bytes)])
+
+    def test_address_as_text(self):
+        self.assertEqual(
+            mapping.address_as_text(IPv6Address('::ffff:1.2.3.4')),
+            '::ffff:1.2.3.4'
+        )
+        self.assertEqual(
+            mapping.address_as_text(IPv4Address('10.0.0.1')), '10.0.0.1'
+        )
 
     def test_json_as_object_parses_wire_strings(self):
         self.assertEqual(mapping.json_as_object('{"a": 1}'), {'a': 1})
@@ -81,6 +181,17 @@ class MappingTestCase(TestCase):
         self.assertEqual(mapping.json_as_object({'a': 1}), {'a': 1})
 
 
+class FakeConnection(object):
+    connected = True
+    is_query_executing = True
+
+    def __init__(self):
+        self.cancels_sent = 0
+
+    def send_cancel(self):
+        self.cancels_sent += 1
+
+
 class ConvertTestCase(TestCase):
     """
     Unit tests for reader creation edge cases. No server needed.
@@ -90,9 +201,11 @@ class ConvertTestCase(TestCase):
         if pa is None:
             self.skipTest('PyArrow package is not installed')
 
-    def make_context(self):
+    def make_context(self, **client_settings):
         context = Context()
-        context.client_settings = {'strings_as_bytes': False}
+        context.client_settings = dict(
+            {'strings_as_bytes': False}, **client_settings
+        )
         return context
 
     def test_empty_packet_stream(self):
@@ -104,10 +217,276 @@ class ConvertTestCase(TestCase):
         self.assertEqual(reader.read_all().num_rows, 0)
         self.assertTrue(state.finished)
 
+    def make_stream(self, n_blocks, block_size=1, client_settings=None,
+                    **kwargs):
+        packets = (
+            FakePacket(ColumnOrientedBlock([('x', 'Int32')], [
+                list(range(i * block_size, (i + 1) * block_size))
+            ]))
+            for i in range(n_blocks)
+        )
+        state = ArrowStreamState(connection=FakeConnection())
+        context = self.make_context(**(client_settings or {}))
+        reader = create_record_batch_reader(
+            packets, context, state=state, **kwargs
+        )
+        return reader, state
+
+    def test_convert_threads(self):
+        for threads in [1, 4]:
+            reader, state = self.make_stream(
+                10, block_size=3,
+                client_settings={'arrow_convert_threads': threads}
+            )
+
+            self.assertEqual(self.batch_sizes(reader), [3] * 10)
+            self.assertTrue(state.finished)
+
+    def test_convert_threads_released_stream(self):
+        reader, state = self.make_stream(
+            10, client_settings={'arrow_convert_threads': 2}
+        )
+        reader.read_next_batch()
+        del reader
+
+        self.assertTrue(state.released)
+        self.assertEqual(state.connection.cancels_sent, 1)
+
+    def batch_sizes(self, reader):
+        batches = list(reader)
+        values = [x for batch in batches for x in batch.column(0).to_pylist()]
+        self.assertEqual(values, list(range(len(values))))
+        return [batch.num_rows for batch in batches]
+
+    def test_target_batch_rows(self):
+        reader, state = self.make_stream(10, target_batch_rows=4)
+
+        self.assertEqual(self.batch_sizes(reader), [4, 4, 2])
+        self.assertTrue(state.finished)
+
+    def test_target_batch_rows_does_not_split(self):
+        reader, _ = self.make_stream(3, block_size=5, target_batch_rows=4)
+
+        self.assertEqual(self.batch_sizes(reader), [5, 5, 5])
+
+    def test_split_batches(self):
+        reader, _ = self.make_stream(
+            3, block_size=5, target_batch_rows=4, split_batches=True
+        )
+
+        self.assertEqual(self.batch_sizes(reader), [4, 4, 4, 3])
+
+    def test_target_batch_bytes(self):
+        # Int32: four bytes per row.
+        reader, _ = self.make_stream(10, target_batch_bytes=12)
+        self.assertEqual(self.batch_sizes(reader), [3, 3, 3, 1])
+
+        reader, _ = self.make_stream(
+            2, block_size=10, target_batch_bytes=16, split_batches=True
+        )
+        self.assertEqual(self.batch_sizes(reader), [4, 4, 4, 4, 4])
+
+    def test_coalesced_stream_released(self):
+        reader, state = self.make_stream(10, target_batch_rows=4)
+        reader.read_next_batch()
+        del reader
+
+        self.assertTrue(state.released)
+        self.assertEqual(state.connection.cancels_sent, 1)
+
+    def test_coalesced_dictionaries_unified(self):
+        packets = [
+            FakePacket(ColumnOrientedBlock(
+                [('x', 'LowCardinality(String)')], [values]
+            ))
+            for values in [['a', 'b'], ['c', 'a']]
+        ]
+        reader = create_record_batch_reader(
+            iter(packets), self.make_context(), target_batch_rows=4,
+            arrow_types={'x': pa.dictionary(pa.int32(), pa.string())}
+        )
+
+        batches = list(reader)
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(
+            batches[0].column(0).to_pylist(), ['a', 'b', 'c', 'a']
+        )
+
+    def test_released_stream_sends_cancel(self):
+        reader, state = self.make_stream(3)
+        reader.read_next_batch()
+        del reader
+
+        self.assertTrue(state.released)
+        self.assertFalse(state.finished)
+        self.assertEqual(state.connection.cancels_sent, 1)
+
+    def test_consumed_stream_is_not_cancelled(self):
+        reader, state = self.make_stream(3)
+        self.assertEqual(reader.read_all().num_rows, 3)
+        del reader
+
+        self.assertTrue(state.finished)
+        self.assertEqual(state.connection.cancels_sent, 0)
+
+    def test_released_capsule_sends_cancel(self):
+        reader, state = self.make_stream(3)
+        if not hasattr(reader, '__arrow_c_stream__'):
+            self.skipTest('PyCapsule interface requires PyArrow 14+')
+
+        imported = pa.RecordBatchReader._import_from_c_capsule(
+            reader.__arrow_c_stream__()
+        )
+        del reader
+        self.assertEqual(imported.read_next_batch().num_rows, 1)
+        del imported
+
+        self.assertTrue(state.released)
+        self.assertEqual(state.connection.cancels_sent, 1)
+
+    def read_stream(self, spec, blocks, context=None, **kwargs):
+        """
+        Returns reader over ``blocks`` of column ``x`` (the first one
+        is the header) and the number of packets read to build it.
+        """
+        packets = [
+            FakePacket(ColumnOrientedBlock([('x', spec)], [values]))
+            for values in blocks
+        ]
+        consumed = []
+
+        def packet_generator():
+            for packet in packets:
+                consumed.append(packet)
+                yield packet
+
+        reader = create_record_batch_reader(
+            packet_generator(), context or self.make_context(), **kwargs
+        )
+        return reader, len(consumed)
+
+    def test_schema_plan_cached(self):
+        _schema_plan.cache_clear()
+        arrow_types = {'x': pa.int64()}
+
+        for _ in range(3):
+            reader, _ = self.read_stream(
+                'Int32', [[], [1]], arrow_types=arrow_types
+            )
+            self.assertEqual(reader.schema.field('x').type, pa.int64())
+
+        info = _schema_plan.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+        self.read_stream('Int32', [[], [1]], arrow_types={'x': pa.int16()})
+        self.assertEqual(_schema_plan.cache_info().misses, 2)
+
+    def test_inferred_types_reused(self):
+        _schema_plan.cache_clear()
+
+        reader, consumed = self.read_stream('Time', [[], [1], [2]])
+        self.assertEqual(consumed, 2)
+        self.assertEqual(reader.read_all().column('x').to_pylist(), [1, 2])
+
+        # Schema is known from the header block.
+        reader, consumed = self.read_stream('Time', [[], [3], [4]])
+        self.assertEqual(consumed, 1)
+        self.assertEqual(reader.schema.field('x').type, pa.int64())
+        self.assertEqual(reader.read_all().column('x').to_pylist(), [3, 4])
+
+    def test_data_dependent_types_inferred_every_run(self):
+        _schema_plan.cache_clear()
+
+        for _ in range(2):
+            _, consumed = self.read_stream('UInt128', [[], [1]])
+            self.assertEqual(consumed, 2)
+
+    def test_empty_result_types_not_reused(self):
+        _schema_plan.cache_clear()
+
+        reader, _ = self.read_stream('Time', [[]])
+        self.assertEqual(reader.schema.field('x').type, pa.null())
+
+        reader, _ = self.read_stream('Time', [[], [1]])
+        self.assertEqual(reader.schema.field('x').type, pa.int64())
+
+    def test_null_types_not_reused(self):
+        for spec, first, second in [
+            ('Nullable(Time)', [None], [5]),
+            ('Array(Time)', [[]], [[5]]),
+            ('Tuple(a Nullable(Time))', [(None, )], [(5, )]),
+            ('Map(String, Array(Time))', [{'k': []}], [{'k': [5]}])
+        ]:
+            _schema_plan.cache_clear()
+            reader, _ = self.read_stream(spec, [[], second])
+            expected = reader.read_all()
+
+            _schema_plan.cache_clear()
+            reader, _ = self.read_stream(spec, [[], first])
+            reader.read_all()
+
+            reader, consumed = self.read_stream(spec, [[], second])
+            self.assertEqual(consumed, 2)
+            self.assertEqual(reader.read_all(), expected)
+
+    def test_inferred_types_not_shared_between_column_families(self):
+        _schema_plan.cache_clear()
+
+        # Point is read into tuples by the plain family and into
+        # element columns by the NumPy one.
+        reader, _ = self.read_stream(
+            'Point', [[], [(1.0, 2.0)]],
+            context=self.make_context(use_numpy=False)
+        )
+        self.assertEqual(reader.read_all().column('x').to_pylist(), [
+            [1.0, 2.0]
+        ])
+
+        point = ArrowStructBuffers(
+            [None, None], [np.array([1.0]), np.array([2.0])]
+        )
+        reader, _ = self.read_stream(
+            'Point', [[], point], context=self.make_context(use_numpy=True)
+        )
+        self.assertEqual(reader.read_all().column('x').to_pylist(), [
+            {'1': 1.0, '2': 2.0}
+        ])
+
+    def test_dynamic_structure_changes_between_blocks(self):
+        def union(discriminators, names, children):
+            return ArrowUnionBuffers(
+                np.array(discriminators, dtype=np.uint8), names, children
+            )
+
+        shared = bytes([0x0e]) + b'\x00' * 8
+        blocks = [
+            [],
+            union([0, 1], ['Int64', 'SharedVariant'], [
+                np.array([1]), [shared]
+            ]),
+            # Float64 has no rows, UInt8 rows go to SharedVariant.
+            union([2, 1, 255, 2], ['Float64', 'Int64', 'UInt8'], [
+                np.array([]), np.array([2]), np.array([3, 4], dtype=np.uint8)
+            ])
+        ]
+        reader, _ = self.read_stream('Dynamic', blocks)
+
+        self.assertEqual(reader.read_all().column('x').to_pylist(), [
+            1, shared, b'\x01\x03', 2, None, b'\x01\x04'
+        ])
+
+    def test_declared_string_converter_for_map_keys(self):
+        uid = UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d')
+        converter = _declared_converter(
+            'Map(UUID, UUID)', pa.map_(pa.string(), pa.binary(16)), 'x'
+        )
+
+        self.assertEqual(converter({uid: uid}), [(str(uid), uid.bytes)])
+
     def test_declared_converter_none_for_json_free_containers(self):
-        self.assertIsNone(_json_declared_converter(
+        self.assertIsNone(_declared_converter(
             'Array(Int32)', pa.list_(pa.int32()), 'x'
         ))
-        self.assertIsNone(_json_declared_converter(
+        self.assertIsNone(_declared_converter(
             'Map(String, Int32)', pa.map_(pa.string(), pa.int32()), 'x'
         ))
@@ -1,6 +1,7 @@
 import json
 from datetime import date, datetime, timezone
 from decimal import Decimal
+from ipaddress import IPv6Address
 from uuid import UUID
 
 try:
@@ -81,6 +82,21 @@ class StringTestCase(ArrowBaseTestCase):
             self.assertEqual(table.schema.field('a').type, pa.binary())
             self.assertEqual(table.column('a').to_pylist(), [b'ab', b'cd'])
 
+    def test_fixed_strings_as_bytes(self):
+        with self.create_table('a FixedString(2)'):
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', [(b'ab', ), (b'c', )]
+            )
+
+            with self.created_client(
+                    settings={'strings_as_bytes': True}) as client:
+                table = client.query_arrow('SELECT a FROM test')
+
+            self.assertEqual(table.schema.field('a').type, pa.binary(2))
+            self.assertEqual(
+                table.column('a').to_pylist(), [b'ab', b'c\x00']
+            )
+
     def test_strings_as_bytes_with_numpy(self):
         try:
             import numpy  # noqa: F401
@@ -225,26 +241,58 @@ class EnumTestCase(ArrowBaseTestCase):
 
 class UUIDTestCase(ArrowBaseTestCase):
     def test_uuid(self):
+        uid = UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d')
         self.assert_arrow_column(
-            'UUID', pa.string(),
-            [UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d')],
-            expected=['c0fcbba9-0752-44ed-a5d6-4dfb4342b89d']
+            'UUID', pa.binary(16), [uid], expected=[uid.bytes]
         )
 
+    def test_uuid_as_text(self):
+        with self.create_table('a UUID'):
+            uid = UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d')
+            self.client.execute('INSERT INTO test (a) VALUES', [(uid, )])
+
+            table = self.client.query_arrow(
+                'SELECT a FROM test', arrow_types={'a': pa.string()}
+            )
+            self.assertEqual(table.column('a').to_pylist(), [str(uid)])
+
 
 class IPTestCase(ArrowBaseTestCase):
     required_server_version = (19, 3, 3)
 
     def test_ipv4(self):
         self.assert_arrow_column(
-            'IPv4', pa.string(), ['10.0.0.1', '192.168.1.1']
+            'IPv4', pa.uint32(), ['10.0.0.1', '192.168.1.1'],
+            expected=[167772161, 3232235777]
         )
 
     def test_ipv6(self):
         self.assert_arrow_column(
-            'IPv6', pa.string(), ['2001:db8::1', '::1']
+            'IPv6', pa.binary(16), ['2001:db8::1', '::1'],
+            expected=[
+                IPv6Address('2001:db8::1').packed, IPv6Address('::1').packed
+            ]
         )
 
+    def test_ip_as_text(self):
+        with self.create_table('a IPv4, b IPv6'):
+            self.client.execute(
+                'INSERT INTO test (a, b) VALUES',
+                [('10.0.0.1', '2001:db8::1'), ('0.0.0.0', '::ffff:1.2.3.4')]
+            )
+
+            table = self.client.query_arrow(
+                'SELECT a, b FROM test',
+                arrow_types={'a': pa.string(), 'b': pa.string()}
+            )
+            self.assertEqual(
+                table.column('a').to_pylist(), ['10.0.0.1', '0.0.0.0']
+            )
+            self.assertEqual(
+                table.column('b').to_pylist(),
+                ['2001:db8::1', '::ffff:1.2.3.4']
+            )
+
 
 class LowCardinalityTestCase(ArrowBaseTestCase):
     required_server_version = (19, 3, 3)
@@ -516,8 +564,7 @@ class NestedJSONTestCase(ArrowBaseTestCase):
             self.assertIn('arrow_types', str(e.exception))
 
     def test_tuple_json_requires_arrow_types(self):
-        # Tuple has no explicit mapping, but JSON inside it must not
-        # leak into type inference.
+        # JSON inside Tuple has no implicit struct field type.
         with self.create_table('a Tuple(JSON, UInt8)'):
             self.client.execute(
                 'INSERT INTO test (a) VALUES', [(({'k': 1}, 7), )]
@@ -552,6 +599,43 @@ class InferenceTestCase(ArrowBaseTestCase):
         self.assertEqual(table.schema.field('x').type, pa.null())
 
 
+class VariantTestCase(ArrowBaseTestCase):
+    required_server_version = (24, 5)
+
+    def setUp(self):
+        super(VariantTestCase, self).setUp()
+        try:
+            import numpy  # noqa: F401
+            import pandas  # noqa: F401
+        except ImportError:
+            self.skipTest('NumPy package is not installed')
+
+    def query(self, query):
+        settings = {
+            'use_numpy': True,
+            'allow_experimental_variant_type': 1,
+            'allow_experimental_dynamic_type': 1
+        }
+        with self.created_client(settings=settings) as client:
+            return client.query_arrow(query)
+
+    def test_variant(self):
+        table = self.query(
+            "SELECT arrayJoin([1, 'a', NULL])::Variant(UInt64, String) AS a"
+        )
+
+        self.assertTrue(pa.types.is_union(table.schema.field('a').type))
+        self.assertEqual(table.column('a').to_pylist(), [1, 'a', None])
+
+    def test_dynamic(self):
+        table = self.query(
+            "SELECT arrayJoin([1::Int64::Dynamic, 'a'::Dynamic, NULL]) AS a"
+        )
+
+        self.assertTrue(pa.types.is_union(table.schema.field('a').type))
+        self.assertEqual(table.column('a').to_pylist(), [1, 'a', None])
+
+
 class ArrowTypesOverrideTestCase(ArrowBaseTestCase):
     def test_general_type_override(self):
         table = self.client.query_arrow(
@@ -1,11 +1,36 @@
+from io import BytesIO
+from unittest import TestCase
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 try:
     import pyarrow as pa
+
+    from clickhouse_driver.arrow.convert import (
+        _column_to_array, create_record_batch_reader
+    )
+    from clickhouse_driver.arrow.mapping import get_type_and_converter
 except ImportError:
     pa = None
 
+from clickhouse_driver.block import ColumnOrientedBlock
+from clickhouse_driver.bufferedreader import CompressedBufferedReader
+from clickhouse_driver.bufferedwriter import CompressedBufferedWriter
+from clickhouse_driver.columns.service import read_column, write_column
+from clickhouse_driver.context import Context
+from clickhouse_driver.protocol import ServerPacketTypes
 from tests.testcase import BaseTestCase
 
 
+class FakePacket(object):
+    def __init__(self, block):
+        self.type = ServerPacketTypes.DATA
+        self.block = block
+
+
 class ArrowBaseTestCase(BaseTestCase):
     def setUp(self):
         if pa is None:
@@ -31,3 +56,95 @@ class ArrowBaseTestCase(BaseTestCase):
                 table.column('a').to_pylist(),
                 data if expected is None else expected
             )
+
+
+class ArrowColumnTestCase(TestCase):
+    """
+    Wire round trip without server: items are serialized by the plain
+    column writers and read back by the Arrow column family, exactly as
+    ``query_arrow`` with ``use_numpy=True`` reads them.
+    """
+    # Small chunks make reads span reader buffers.
+    chunk_size = 7
+
+    def setUp(self):
+        if pa is None or np is None:
+            self.skipTest('PyArrow and NumPy packages are required')
+        super(ArrowColumnTestCase, self).setUp()
+
+    def make_context(self, **client_settings):
+        context = Context()
+        context.settings = {}
+        context.client_settings = dict({
+            'use_numpy': False,
+            'strings_as_bytes': False,
+            'strings_encoding': 'utf-8',
+            'input_format_null_as_default': False
+        }, **client_settings)
+        return context
+
+    def serialize(self, spec, items):
+        out = BytesIO()
+        buf = CompressedBufferedWriter(out, 1024)
+        write_column(self.make_context(), 'a', spec, list(items), buf)
+        buf.flush()
+        return out.getvalue()
+
+    def compress(self, data):
+        """
+        Wraps hand-made wire ``data`` into compressed frames for types
+        without writers.
+        """
+        out = BytesIO()
+        buf = CompressedBufferedWriter(out, 1024)
+        buf.write(data)
+        buf.flush()
+        return out.getvalue()
+
+    def make_reader(self, data):
+        chunks = iter([
+            data[i:i + self.chunk_size]
+            for i in range(0, len(data), self.chunk_size)
+        ])
+        return CompressedBufferedReader(lambda: next(chunks, b''), 1024)
+
+    def read_arrow_column(self, spec, data, n_items, **client_settings):
+        context = self.make_context(
+            use_numpy=True, use_arrow=True, **client_settings
+        )
+        return read_column(context, spec, n_items, self.make_reader(data))
+
+    def to_arrow(self, spec, items, type_=None, **client_settings):
+        """
+        Serializes ``items`` as ``spec`` and returns Arrow array built by
+        the Arrow read path.
+        """
+        column = self.read_arrow_column(
+            spec, self.serialize(spec, items), len(items), **client_settings
+        )
+        default_type, converter = get_type_and_converter(
+            spec, client_settings.get('strings_as_bytes', False),
+            client_settings.get('large_ints_as_words', False)
+        )
+        return _column_to_array(
+            column, type_ if type_ is not None else default_type, converter
+        )
+
+    def read_batches(self, columns_with_items, **kwargs):
+        """
+        Serializes ``(name, spec, items)`` columns as one block and
+        returns record batches built by the Arrow read path.
+        """
+        columns = [
+            self.read_arrow_column(
+                spec, self.serialize(spec, items), len(items)
+            )
+            for _, spec, items in columns_with_items
+        ]
+        block = ColumnOrientedBlock(
+            [(name, spec) for name, spec, _ in columns_with_items], columns
+        )
+        reader = create_record_batch_reader(
+            iter([FakePacket(block)]), self.make_context(), **kwargs
+        )
+        return list(reader)
@@ -8,6 +8,7 @@ from clickhouse_driver.columns.dynamiccolumn import (
     _decode_type_spec,
     _split_tuple_elements,
     _SharedValueReader,
+    encode_type_spec,
 )
 from clickhouse_driver.columns.newjsoncolumn import (
     NewJsonColumn,
@@ -109,6 +110,17 @@ class DecodeTypeSpecTestCase(TestCase):
         )
         self.assertEqual(self.decode(blob), "Tuple(a Int64, b String)")
 
+    def test_encode_round_trip(self):
+        for spec in [
+            "Int64", "String", "Bool", "Date32", "FixedString(7)",
+            "DateTime('UTC')", "DateTime64(3)",
+            "DateTime64(6, 'Europe/Moscow')"
+        ]:
+            self.assertEqual(self.decode(encode_type_spec(spec)), spec)
+
+        with self.assertRaises(NotImplementedError):
+            encode_type_spec("Array(String)")
+
     def test_json(self):
         # JSON tag (0x30) followed by its encoded parameters: version,
         # max_dynamic_paths, max_dynamic_types, and three empty path
@@ -3,6 +3,13 @@ from io import BytesIO
 from ipaddress import IPv6Address
 from unittest import TestCase
 
+try:
+    import numpy as np
+
+    from clickhouse_driver.columns.numpy.base import NumpySparseSerialization
+except ImportError:
+    np = None
+
 from tests.testcase import BaseTestCase
 from clickhouse_driver import errors
 from clickhouse_driver.columns.base import SparseSerialization
@@ -243,3 +250,72 @@ class SparseSerializationTestCase(TestCase):
         )
         for value in result:
             self.assertIsInstance(value, bool)
+
+
+class NumpySparseSerializationTestCase(SparseSerializationTestCase):
+    def setUp(self):
+        if np is None:
+            self.skipTest('NumPy package is not installed')
+        super(NumpySparseSerializationTestCase, self).setUp()
+
+    def make_serialization(self, n_items, group_sizes, column=None):
+        serialization = NumpySparseSerialization(column or FakeColumn())
+        buf = self.make_buf(group_sizes)
+        serialization.read_sparse(n_items, buf)
+        return serialization
+
+    def test_apply_sparse_keeps_dtype(self):
+        serialization = self.make_serialization(
+            8, [2, 3, self.END_OF_GRANULE_FLAG | 1]
+        )
+        self.assertEqual(serialization.sparse_indexes.dtype, np.int64)
+
+        result = serialization.apply_sparse(
+            np.array([5, 7], dtype=np.uint16)
+        )
+        self.assertEqual(result.dtype, np.uint16)
+        self.assertEqual(result.tolist(), [0, 0, 5, 0, 0, 0, 7, 0])
+
+    def test_apply_sparse_objects(self):
+        column = FakeColumn()
+        column.null_value = ''
+        serialization = self.make_serialization(
+            3, [1, self.END_OF_GRANULE_FLAG | 1], column=column
+        )
+
+        result = serialization.apply_sparse(np.array(['a'], dtype=object))
+        self.assertEqual(result.tolist(), ['', 'a', ''])
+
+    def test_apply_sparse_masked(self):
+        serialization = self.make_serialization(
+            4, [0, 1, self.END_OF_GRANULE_FLAG | 1]
+        )
+
+        result = serialization.apply_sparse(
+            np.ma.MaskedArray([1, 2], mask=[False, True])
+        )
+        self.assertEqual(result.tolist(), [1, 0, None, 0])
+
+    def test_apply_sparse_bytes(self):
+        serialization = self.make_serialization(
+            3, [1, self.END_OF_GRANULE_FLAG | 1]
+        )
+
+        self.assertEqual(
+            serialization.apply_sparse_bytes(b'ab', 2), b'\x00\x00ab\x00\x00'
+        )
+        self.assertEqual(
+            serialization.apply_sparse_bytes(b'ab', 2, default=b'zz'),
+            b'zzabzz'
+        )
+
+    def test_apply_sparse_offsets(self):
+        serialization = self.make_serialization(
+            4, [0, 1, self.END_OF_GRANULE_FLAG | 1]
+        )
+
+        offsets = np.array([0, 2, 5], dtype=np.int64)
+        result = serialization.apply_sparse_offsets(offsets.tobytes())
+        self.assertEqual(
+            np.frombuffer(result, dtype=np.int64).tolist(), [0, 2, 2, 5, 5]
+        )
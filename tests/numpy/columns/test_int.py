@@ -93,3 +93,20 @@ class IntTestCase(NumpyBaseTestCase):
             inserted = self.client.execute(query, columnar=True)
             self.assertArraysEqual(inserted[0], data[0])
             self.assertEqual(inserted[0].dtype, object)
+
+    def test_large_ints_as_words(self):
+        with self.create_table('a Int128, b UInt256'):
+            self.client.execute(
+                'INSERT INTO test (a, b) VALUES', [(-2, 2 ** 200)]
+            )
+
+            query = 'SELECT * FROM test'
+            with self.created_client(
+                    settings={'use_numpy': True,
+                              'large_ints_as_words': True}) as client:
+                a, b = client.execute(query, columnar=True)
+
+            self.assertEqual(a.dtype.names, ('w0', 'w1'))
+            self.assertEqual(a.tobytes(), (-2).to_bytes(16, 'little',
+                                                        signed=True))
+            self.assertEqual(b.tobytes(), (2 ** 200).to_bytes(32, 'little'))
@@ -131,6 +131,22 @@ class DataFrameTestCase(NumpyBaseTestCase):
             )
             self.assertEqual(rv, 3)
 
+    def test_insert_block_bytes(self):
+        n = 1000
+        df = pd.DataFrame({
+            'a': range(n),
+            'b': [str(x) for x in range(n)]
+        })
+
+        with self.create_table('a Int64, b String'):
+            rv = self.client.insert_dataframe(
+                'INSERT INTO test VALUES', df,
+                settings={'insert_block_bytes': 1024}
+            )
+            self.assertEqual(rv, n)
+            df2 = self.client.query_dataframe('SELECT * FROM test ORDER BY a')
+            self.assertTrue(df.equals(df2))
+
     def test_insert_not_ordered_columns(self):
         n = 10
         df = pd.DataFrame({
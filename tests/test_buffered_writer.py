@@ -0,0 +1,180 @@
+import sys
+from array import array
+from io import BytesIO
+from unittest import TestCase, mock
+
+from clickhouse_driver import errors
+from clickhouse_driver.bufferedwriter import (
+    BufferedMemoryWriter, BufferedSocketWriter, CompressedBufferedWriter
+)
+from clickhouse_driver.varint import make_varint
+
+
+class Compressor(object):
+    def __init__(self):
+        self.data = BytesIO()
+        self.chunks = []
+
+    def write(self, p_str):
+        self.chunks.append(p_str)
+        self.data.write(p_str)
+
+
+class BufferedWriterTestCase(TestCase):
+    def test_buffer_protocol_objects(self):
+        compressor = Compressor()
+        writer = CompressedBufferedWriter(compressor, 4)
+
+        writer.write(b'ab')
+        writer.write(bytearray(b'cd'))
+        writer.write(memoryview(b'xefx')[1:3])
+        writer.write(array('H', [1, 2]))
+        writer.flush()
+
+        self.assertEqual(
+            compressor.data.getvalue(), b'abcdef' + bytes(array('H', [1, 2]))
+        )
+
+    def test_non_contiguous_buffer(self):
+        writer = CompressedBufferedWriter(Compressor(), 4)
+
+        with self.assertRaises(BufferError):
+            writer.write(memoryview(b'abcd')[::2])
+
+    def test_large_chunk_bypasses_buffer(self):
+        compressor = Compressor()
+        writer = CompressedBufferedWriter(compressor, 4)
+
+        chunk = bytearray(b'x' * 10)
+        writer.write(b'ab')
+        writer.write(chunk)
+        writer.write(b'cd')
+        writer.flush()
+
+        self.assertEqual(compressor.data.getvalue(), b'ab' + b'x' * 10 + b'cd')
+        self.assertIs(compressor.chunks[1], chunk)
+
+    def test_socket_writer_large_chunk(self):
+        with mock.patch('socket.socket') as mock_socket:
+            sock = mock_socket.return_value
+            writer = BufferedSocketWriter(sock, 4)
+
+            chunk = memoryview(b'y' * 8)
+            writer.write(b'a')
+            writer.write(chunk)
+
+            self.assertEqual(
+                [x[0][0] for x in sock.sendall.call_args_list],
+                [b'a', chunk]
+            )
+
+    def test_memory_writer(self):
+        out = BytesIO()
+        writer = BufferedMemoryWriter(out, 4)
+
+        writer.write(b'ab')
+        writer.write(memoryview(b'c' * 6))
+        writer.write_strings([b'de'])
+        writer.flush()
+
+        self.assertEqual(out.getvalue(), b'abcccccc\x02de')
+        self.assertEqual(writer.tell(), 11)
+
+    def test_fixed_strings(self):
+        compressor = Compressor()
+        writer = CompressedBufferedWriter(compressor, 5)
+
+        writer.write_fixed_strings([b'a', b'bcd', b''], 3)
+        writer.write_fixed_strings(['я'], 7, encoding='utf-8')
+        writer.flush()
+
+        self.assertEqual(
+            compressor.data.getvalue(),
+            b'a\x00\x00bcd\x00\x00\x00' + 'я'.encode() + b'\x00' * 5
+        )
+
+        with self.assertRaises(errors.TooLargeStringSize):
+            writer.write_fixed_strings([b'abcd'], 3)
+
+    def test_fixed_strings_too_large(self):
+        compressor = Compressor()
+        writer = CompressedBufferedWriter(compressor, 16)
+        writer.write(b'ab')
+
+        # Nothing of the column is written.
+        with self.assertRaises(errors.TooLargeStringSize):
+            writer.write_fixed_strings([b'a', b'bcd', b'efgh'], 3)
+        self.assertEqual(writer.tell(), 2)
+
+        with self.assertRaises(errors.TooLargeStringSize):
+            writer.write_fixed_strings(['a', 'яя'], 3, encoding='utf-8')
+        self.assertEqual(writer.tell(), 2)
+
+        writer.flush()
+        self.assertEqual(compressor.data.getvalue(), b'ab')
+
+    def test_strings(self):
+        items = ['', 'a', 'юникод', 'x' * 200, 'y' * 20000]
+        expected = b''.join(
+            make_varint(len(x.encode())) + x.encode() for x in items
+        )
+
+        for encoding in ['utf-8', 'UTF8', 'cp1251']:
+            compressor = Compressor()
+            writer = CompressedBufferedWriter(compressor, 8)
+
+            data = items if encoding != 'cp1251' \
+                else [x.encode() for x in items]
+            writer.write_strings(data, encoding=encoding)
+            writer.flush()
+            self.assertEqual(compressor.data.getvalue(), expected)
+
+        writer = CompressedBufferedWriter(Compressor(), 8)
+        with self.assertRaises(ValueError):
+            writer.write_strings(['a'])
+
+    def test_strings_utf8_not_cached(self):
+        # Strings built at runtime: literals may have UTF-8 cached.
+        items = [''.join(['юникод'] * 10), ''.join(['ascii'] * 10)]
+        sizes = [sys.getsizeof(x) for x in items]
+
+        compressor = Compressor()
+        writer = CompressedBufferedWriter(compressor, 8)
+        writer.write_strings(items, encoding='utf-8')
+        writer.flush()
+
+        self.assertEqual(
+            compressor.data.getvalue(),
+            b''.join(make_varint(len(x.encode())) + x.encode() for x in items)
+        )
+        self.assertEqual([sys.getsizeof(x) for x in items], sizes)
+
+    def test_strings_from_offsets(self):
+        compressor = Compressor()
+        writer = CompressedBufferedWriter(compressor, 4)
+
+        offsets = array('q', [1, 1, 3, 203])
+        data = b'-ab' + b'x' * 200
+        writer.write_strings_from_offsets(offsets, data)
+        writer.write_strings_from_offsets(array('q', [0]), b'')
+        writer.flush()
+
+        self.assertEqual(
+            compressor.data.getvalue(),
+            b'\x00\x02ab' + make_varint(200) + b'x' * 200
+        )
+
+        with self.assertRaises(ValueError):
+            writer.write_strings_from_offsets(array('q', [0, 2]), b'a')
+
+    def test_tell(self):
+        writer = CompressedBufferedWriter(Compressor(), 4)
+
+        writer.write(b'abc')
+        writer.write(bytearray(10))
+        writer.write_fixed_strings([b'a'], 6)
+        writer.write_strings([b'ab'])
+        self.assertEqual(writer.tell(), 22)
+
+        writer.flush()
+        self.assertEqual(writer.tell(), 22)
@@ -5,6 +5,7 @@ from clickhouse_driver.compression.lz4 import Compressor as LZ4Compressor
 from clickhouse_driver.compression.lz4hc import Compressor as LZHC4Compressor
 from clickhouse_driver.compression.zstd import Compressor as ZSTDCompressor
 from clickhouse_driver.protocol import Compression
+from clickhouse_driver.util.helpers import parse_url
 from tests.numpy.util import check_numpy
 from tests.testcase import TestCase
 
@@ -138,6 +139,16 @@ class ClientFromUrlTestCase(TestCase):
         )
         self.assertEqual(c.connection.compress_block_size, 100500)
 
+    def test_compress_threads(self):
+        c = Client.from_url('clickhouse://host?compress_threads=4')
+        # compression is not set
+        self.assertEqual(c.connection.compress_threads, 0)
+
+        c = Client.from_url(
+            'clickhouse://host?compress_threads=4&compression=zstd'
+        )
+        self.assertEqual(c.connection.compress_threads, 4)
+
     def test_settings(self):
         c = Client.from_url(
             'clickhouse://host?'
@@ -248,6 +259,18 @@ class ClientFromUrlTestCase(TestCase):
         c = Client.from_url('clickhouse://host?use_numpy=true')
         self.assertTrue(c.connection.context.client_settings['use_numpy'])
 
+    def test_large_ints_as_words(self):
+        for value, expected in [('1', True), ('true', True), ('0', False)]:
+            url = 'clickhouse://host?large_ints_as_words=' + value
+            _, kwargs = parse_url(url)
+            self.assertIs(kwargs['settings']['large_ints_as_words'], expected)
+
+            c = Client.from_url(url)
+            self.assertIs(
+                c.connection.context.client_settings['large_ints_as_words'],
+                expected
+            )
+
     def test_opentelemetry(self):
         c = Client.from_url(
             'clickhouse://host?opentelemetry_traceparent='
@@ -287,6 +310,17 @@ class ClientFromUrlTestCase(TestCase):
             c.connection.context.client_settings['quota_key'], ''
         )
 
+    def test_arrow_convert_threads(self):
+        c = Client.from_url('clickhouse://host?arrow_convert_threads=4')
+        self.assertEqual(
+            c.connection.context.client_settings['arrow_convert_threads'], 4
+        )
+
+        c = Client.from_url('clickhouse://host')
+        self.assertEqual(
+            c.connection.context.client_settings['arrow_convert_threads'], 0
+        )
+
     def test_round_robin(self):
         c = Client.from_url('clickhouse://host?alt_hosts=host2')
         self.assertEqual(len(c.connections), 0)
@@ -1,10 +1,19 @@
 from datetime import date, datetime
+from io import BytesIO
+from struct import unpack
 from unittest import TestCase
+from unittest.mock import Mock
+
+from clickhouse_cityhash.cityhash import CityHash128
+from lz4 import block as lz4_block
 
 from clickhouse_driver import errors
+from clickhouse_driver.bufferedwriter import CompressedBufferedWriter
 from clickhouse_driver.client import Client
 from clickhouse_driver.compression import get_compressor_cls
 from clickhouse_driver.compression.lz4 import Compressor
+from clickhouse_driver.reader import read_binary_uint128
+from clickhouse_driver.streams.compressed import CompressedBlockOutputStream
 from .testcase import BaseTestCase, file_config
 
 
@@ -101,3 +110,105 @@ class ReadByBlocksTestCase(BaseCompressionTestCase):
 
             inserted = self.client.execute(query)
             self.assertEqual(inserted, data)
+
+
+class PipelinedInsertTestCase(BaseCompressionTestCase):
+    compression = 'lz4'
+
+    def test(self):
+        with self.create_table('a Int32'):
+            data = [(x, ) for x in range(10000)]
+
+            rv = self.client.execute(
+                'INSERT INTO test (a) VALUES', data,
+                settings={'insert_pipeline_depth': 2,
+                          'insert_block_size': 1000}
+            )
+            self.assertEqual(rv, 10000)
+
+            inserted = self.client.execute('SELECT * FROM test ORDER BY a')
+            self.assertEqual(inserted, data)
+
+
+class CompressedFramesTestCase(TestCase):
+    def write_compressed(self, data, compressor_cls=Compressor, **kwargs):
+        out = BytesIO()
+        fout = CompressedBufferedWriter(out, 1024)
+        stream = CompressedBlockOutputStream(
+            compressor_cls, 1000, fout, None, **kwargs
+        )
+
+        compressor = compressor_cls()
+        compressor.write(data)
+        stream.write_compressed(compressor)
+        return out.getvalue()
+
+    def read_frames(self, compressed):
+        frames = []
+        buf = BytesIO(compressed)
+
+        while buf.tell() < len(compressed):
+            compressed_hash = read_binary_uint128(buf)
+            header = buf.read(9)
+            size = unpack('<I', header[1:5])[0]
+            frame = header + buf.read(size - 9)
+
+            self.assertEqual(compressed_hash, CityHash128(frame))
+            frames.append(frame)
+
+        return frames
+
+    def test_frames(self):
+        data = bytes(range(256)) * 15
+
+        # Data is split into blocks only when compressed in parallel.
+        for compress_threads, n_frames in [(0, 1), (1, 1), (4, 4)]:
+            compressed = self.write_compressed(
+                data, compress_threads=compress_threads
+            )
+            frames = self.read_frames(compressed)
+
+            self.assertEqual(len(frames), n_frames)
+            decompressed = b''.join(
+                lz4_block.decompress(
+                    x[9:], uncompressed_size=unpack('<I', x[5:9])[0]
+                ) for x in frames
+            )
+            self.assertEqual(decompressed, data)
+
+    def test_compressed_blocks_window(self):
+        out = BytesIO()
+        stream = CompressedBlockOutputStream(
+            Compressor, 10, CompressedBufferedWriter(out, 1024), None,
+            compress_threads=2
+        )
+        compressed, written = [], []
+
+        def get_compressed_frame(compressor, data):
+            compressed.append(data)
+            return 0, b'x'
+
+        def write(data):
+            # Blocks compressed ahead of the written one.
+            if data == b'x':
+                written.append(len(compressed) - len(written) - 1)
+
+        stream.get_compressed_frame = get_compressed_frame
+        stream.raw_fout = Mock(write=write)
+
+        compressor = Compressor()
+        compressor.write(bytes(200))
+        stream.write_compressed(compressor)
+
+        self.assertEqual(len(compressed), 20)
+        self.assertEqual(len(written), 20)
+        self.assertLessEqual(max(written), 4)
+
+        executor = stream.executor
+        stream.close()
+        self.assertIsNone(stream.executor)
+        self.assertTrue(executor._shutdown)
+
+    def test_empty_data(self):
+        frames = self.read_frames(self.write_compressed(b''))
+        self.assertEqual(len(frames), 1)
@@ -1,8 +1,17 @@
 from datetime import date
+from io import BytesIO
+from unittest import TestCase, mock
 
 from tests.testcase import BaseTestCase
-from clickhouse_driver import errors
+from clickhouse_driver import defines, errors
+from clickhouse_driver.block import RowOrientedBlock
+from clickhouse_driver.bufferedwriter import CompressedBufferedWriter
+from clickhouse_driver.compression.lz4 import Compressor
+from clickhouse_driver.context import Context
 from clickhouse_driver.errors import ServerException
+from clickhouse_driver.insertpipeline import InsertPipeline
+from clickhouse_driver.streams.compressed import CompressedBlockOutputStream
+from clickhouse_driver.streams.native import BlockOutputStream
 from tests.util import require_server_version
 
 
@@ -233,3 +242,181 @@ class InsertColumnarTestCase(BaseTestCase):
                 )
 
             self.assertIn('list or tuple is expected', str(e.exception))
+
+
+class PipelinedInsertTestCase(BaseTestCase):
+    client_kwargs = {'settings': {'insert_pipeline_depth': 2}}
+
+    def test_insert_blocks(self):
+        with self.create_table('a Int32, b String'):
+            data = [(x, str(x)) for x in range(1000)]
+            rv = self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data,
+                settings={'insert_block_size': 100}
+            )
+            self.assertEqual(rv, 1000)
+
+            inserted = self.emit_cli('SELECT count(), sum(a) FROM test')
+            self.assertEqual(inserted, '1000\t499500\n')
+
+    def test_type_mismatch(self):
+        with self.create_table('a UInt8'):
+            data = [(x, ) for x in range(100)] + [('x', )]
+
+            with self.assertRaises(errors.TypeMismatchError):
+                self.client.execute(
+                    'INSERT INTO test (a) VALUES', data,
+                    settings={'insert_block_size': 10}, types_check=True
+                )
+
+            rv = self.client.execute('SELECT 1')
+            self.assertEqual(rv, [(1, )])
+
+    def test_server_exception(self):
+        with self.create_table('a Int32, CONSTRAINT c CHECK a < 50'):
+            data = [(x, ) for x in range(100)]
+
+            with self.assertRaises(ServerException):
+                self.client.execute(
+                    'INSERT INTO test (a) VALUES', data,
+                    settings={'insert_block_size': 10}
+                )
+
+            rv = self.client.execute('SELECT 1')
+            self.assertEqual(rv, [(1, )])
+
+    def test_insert_block_bytes(self):
+        with self.create_table('a Int32, b String'):
+            data = [(x, 'x' * (x % 100)) for x in range(1000)]
+            rv = self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data,
+                settings={'insert_block_bytes': 4096}
+            )
+            self.assertEqual(rv, 1000)
+
+            inserted = self.emit_cli('SELECT count(), sum(a) FROM test')
+            self.assertEqual(inserted, '1000\t499500\n')
+
+
+class InsertBlockBytesTestCase(BaseTestCase):
+    def test_rows(self):
+        with self.create_table('a String'):
+            data = [('x' * 1000, )] * 300
+            with mock.patch.object(
+                    self.client.connection, 'send_data',
+                    wraps=self.client.connection.send_data) as send_data:
+                rv = self.client.execute(
+                    'INSERT INTO test (a) VALUES', data,
+                    settings={'insert_block_bytes': 100000}
+                )
+            self.assertEqual(rv, 300)
+
+            # Probe block, blocks of about 100KB and end of data.
+            rows = [x[0][0].num_rows for x in send_data.call_args_list]
+            self.assertEqual(rows[0], 100)
+            self.assertTrue(all(90 <= x <= 100 for x in rows[1:-2]))
+            self.assertEqual(sum(rows), 300)
+            self.assertEqual(rows[-1], 0)
+
+    def test_columnar(self):
+        with self.create_table('a Int32, b String'):
+            data = [list(range(1000)), ['x'] * 1000]
+            rv = self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data, columnar=True,
+                settings={'insert_block_bytes': 1000}
+            )
+            self.assertEqual(rv, 1000)
+
+            inserted = self.emit_cli('SELECT count(), sum(a) FROM test')
+            self.assertEqual(inserted, '1000\t499500\n')
+
+
+class InsertPipelineTestCase(TestCase):
+    def make_context(self):
+        context = Context()
+        context.settings = {}
+        context.client_settings = {
+            'use_numpy': False,
+            'strings_as_bytes': False,
+            'strings_encoding': 'utf-8',
+            'input_format_null_as_default': False
+        }
+        context.server_info = mock.Mock(used_revision=defines.CLIENT_REVISION)
+        return context
+
+    def check_serialized(self, make_stream):
+        block = RowOrientedBlock(
+            [('a', 'Int32'), ('b', 'String')], [(1, 'x'), (2, 'y' * 100)]
+        )
+        outputs = []
+        sizes = []
+
+        for pipelined in [False, True]:
+            out = BytesIO()
+            fout = CompressedBufferedWriter(out, 16)
+            stream = make_stream(fout, self.make_context())
+
+            if pipelined:
+                serialized, size = stream.serialize(block)
+                stream.write_serialized(serialized)
+            else:
+                size = stream.write(block)
+            outputs.append(out.getvalue())
+            sizes.append(size)
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(sizes[0], sizes[1])
+        self.assertGreater(sizes[0], 100)
+
+    def test_serialized_block(self):
+        self.check_serialized(BlockOutputStream)
+
+    def test_serialized_compressed_block(self):
+        self.check_serialized(
+            lambda fout, context: CompressedBlockOutputStream(
+                Compressor, 1024, fout, context
+            )
+        )
+
+    def make_client(self, events, send_error_at=None):
+        client = mock.Mock()
+        connection = client.connection
+        connection.serialize_data.side_effect = lambda x: (x, 10)
+
+        def send_serialized_data(serialized):
+            if serialized == send_error_at:
+                raise OSError('Broken pipe')
+            events.append(('sent', serialized))
+
+        connection.send_serialized_data.side_effect = send_serialized_data
+        client.receive_profile_events.side_effect = \
+            lambda: events.append(('events', ))
+        return client
+
+    def test_profile_events_received_per_block(self):
+        events = []
+        pipeline = InsertPipeline(self.make_client(events), 1)
+
+        for i in range(3):
+            self.assertEqual(pipeline.send(i), 10)
+        pipeline.stop()
+        pipeline.check()
+
+        self.assertEqual(events, [
+            ('sent', 0), ('sent', 1), ('events', ), ('sent', 2), ('events', ),
+            ('events', )
+        ])
+
+    def test_sender_error(self):
+        events = []
+        pipeline = InsertPipeline(self.make_client(events, send_error_at=1), 1)
+
+        with self.assertRaises(OSError):
+            try:
+                for i in range(100):
+                    pipeline.send(i)
+            finally:
+                pipeline.stop()
+            pipeline.check()
+
+        self.assertEqual(events, [('sent', 0)])
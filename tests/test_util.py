@@ -1,4 +1,7 @@
 from clickhouse_driver.columns.util import get_inner_columns_with_types
+from clickhouse_driver.util.helpers import (
+    BlockSizer, sized_chunks, sized_column_chunks
+)
 
 
 def test_get_inner_columns_with_types_empty_spaces():
@@ -6,3 +9,40 @@ def test_get_inner_columns_with_types_empty_spaces():
         get_inner_columns_with_types('\n test String\n ') ==
         [('test', 'String')]
     )
+
+
+def test_block_sizer():
+    sizer = BlockSizer(1000, 50)
+    # Probe block while row width is unknown.
+    assert sizer.next_size() == 50
+
+    sizer.update(10, 100)
+    assert sizer.next_size() == 50
+
+    sizer.update(10, 1000)
+    assert sizer.next_size() == 10
+
+    sizer.update(1, 5000)
+    assert sizer.next_size() == 1
+
+    assert BlockSizer(1000, 500, row_bytes=4).next_size() == 250
+    assert BlockSizer(10 ** 6, 10 ** 6).next_size() == 100
+
+
+def test_sized_chunks():
+    for data in [list(range(10)), iter(range(10))]:
+        sizer = BlockSizer(10, 10, row_bytes=5)
+        row_bytes = iter([2.5, 2, 2])
+
+        rv = []
+        for chunk in sized_chunks(data, sizer):
+            rv.append(chunk)
+            sizer.update(len(chunk), len(chunk) * next(row_bytes))
+
+        assert rv == [[0, 1], [2, 3, 4, 5], [6, 7, 8, 9]]
+
+
+def test_sized_column_chunks():
+    sizer = BlockSizer(8, 10, row_bytes=4)
+    rv = list(sized_column_chunks([[1, 2, 3], (4, 5, 6)], sizer))
+    assert rv == [[[1, 2], [4, 5]], [[3], [6]]]